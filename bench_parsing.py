@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Parsing benchmark for AI Words Mining System
+对比 html.parser 全量解析 与 lxml + SoupStrainer 按站点裁剪解析 的耗时和峰值内存
+
+Usage:
+    python bench_parsing.py saved_pages/*.html
+    python bench_parsing.py --site producthunt.com page.html
+    python bench_parsing.py            # uses a generated listing page
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from bs4 import BeautifulSoup
+
+# 添加src目录到Python路径
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.html_parsing import parse_html, CARD_STRAINER_RULES
+from src.js_extractor import SITE_ADAPTERS
+
+
+def guess_site(path: str) -> str:
+    """Pick the site key from a saved page's file name"""
+    name = os.path.basename(path).lower()
+    for site_key in CARD_STRAINER_RULES:
+        if site_key.split('.')[0] in name:
+            return site_key
+    return 'generic'
+
+
+def generated_page(cards: int = 300) -> str:
+    """Build a listing page with scripts, navigation and tool cards"""
+    filler = '<script>' + 'var x = 1;' * 2000 + '</script>'
+    nav = '<nav>' + ''.join(f'<a href="/c/{i}">Category {i}</a>' for i in range(200)) + '</nav>'
+    card = ('<div class="tool-item"><a href="/tool/t{0}"><h2>Tool {0}</h2></a>'
+            '<p>An AI assistant that does task number {0} for you.</p>'
+            '<span class="tag">AI</span></div>')
+    body = ''.join(card.format(i) for i in range(cards))
+    footer = '<footer>' + '<p>Footer text</p>' * 300 + '</footer>'
+    return f'<html><head>{filler}</head><body>{nav}<main>{body}</main>{footer}</body></html>'
+
+
+def measure(parse, html, selectors, rounds: int):
+    """Return (best seconds, peak bytes, cards found) for a parse function"""
+    best = None
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        soup = parse(html)
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    soup = parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cards = max((len(soup.select(selector)) for selector in selectors), default=0)
+    return best, peak, cards
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML parsing strategies')
+    parser.add_argument('pages', nargs='*', help='Saved HTML pages')
+    parser.add_argument('--site', help='Site key to use for every page (default: guess from file name)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timing rounds per page')
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = []
+        for path in args.pages:
+            with open(path, 'rb') as f:
+                pages.append((os.path.basename(path), args.site or guess_site(path), f.read()))
+    else:
+        pages = [('generated-toolify.html', args.site or 'toolify.ai', generated_page().encode('utf-8'))]
+
+    print(f"{'page':<32} {'strategy':<20} {'time (ms)':>10} {'peak (KB)':>10} {'cards':>6}")
+    print('-' * 82)
+
+    for name, site_key, html in pages:
+        selectors = SITE_ADAPTERS.get(site_key, SITE_ADAPTERS['generic'])['card_selectors']
+        strategies = [
+            ('html.parser (full)', lambda h: BeautifulSoup(h, 'html.parser')),
+            ('lxml (full)', lambda h: parse_html(h)),
+            ('lxml + strainer', lambda h: parse_html(h, site_key))
+        ]
+
+        baseline = None
+        for label, parse in strategies:
+            elapsed, peak, cards = measure(parse, html, selectors, args.rounds)
+            baseline = baseline or (elapsed, peak)
+            speedup = f"  x{baseline[0] / elapsed:.1f} faster, {peak / baseline[1]:.0%} memory" if label != strategies[0][0] else ''
+            print(f"{name[:32]:<32} {label:<20} {elapsed * 1000:>10.1f} {peak / 1024:>10.0f} {cards:>6}{speedup}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,14 @@ class Config:
     # Scraping Configuration
     TARGET_URL: str = os.getenv('TARGET_URL', 'https://www.toolify.ai/new')
     
+    # Paginated Toolify crawl (single-site scraper)
+    ENABLE_TOOLIFY_PAGINATION: bool = os.getenv('ENABLE_TOOLIFY_PAGINATION', 'true').lower() == 'true'
+    TOOLIFY_MAX_PAGES: int = int(os.getenv('TOOLIFY_MAX_PAGES', '5'))
+    TOOLIFY_PAGE_URL_TEMPLATE: str = os.getenv('TOOLIFY_PAGE_URL_TEMPLATE', '{url}?page={page}')  # 第N页的URL格式
+    ENABLE_HEDGED_SCRAPING: bool = os.getenv('ENABLE_HEDGED_SCRAPING', 'true').lower() == 'true'  # Selenium与requests并行，先满足者胜出
+    HEDGE_MIN_TOOLS: int = int(os.getenv('HEDGE_MIN_TOOLS', '5'))  # 任一路径至少得到这么多工具才算胜出
+    ENABLE_PAGE_ARTIFACTS: bool = os.getenv('ENABLE_PAGE_ARTIFACTS', 'true').lower() == 'true'  # 回退时复用本次已抓取的HTML
+    
     # Multiple Target URLs for comprehensive data collection
     TARGET_URLS: List[str] = [
         'https://www.toolify.ai/new',
@@ -38,7 +46,8 @@ class Config:
             'enabled': True,
             'max_items': 25,  # 增加数量
             'delay': 3,
-            'use_selenium': True
+            'use_selenium': True,
+            'block_resources': ['*ph-files.imgix.net*']  # 产品图片CDN
         },
         'futuretools.io': {
             'enabled': True,  # 启用Future Tools
@@ -62,12 +71,71 @@ class Config:
     
     SCRAPING_DELAY: int = int(os.getenv('SCRAPING_DELAY', '2'))
     
+    # Selenium WebDriver pool configuration
+    ENABLE_DRIVER_POOL: bool = os.getenv('ENABLE_DRIVER_POOL', 'true').lower() == 'true'
+    DRIVER_POOL_SIZE: int = int(os.getenv('DRIVER_POOL_SIZE', '3'))  # 每次运行最多启动的浏览器数
+    DRIVER_MAX_PAGES: int = int(os.getenv('DRIVER_MAX_PAGES', '10'))  # 浏览器加载N个页面后重启以控制内存
+    
+    # Page readiness configuration (replaces fixed sleeps in Selenium scrapers)
+    PAGE_READY_TIMEOUT: float = float(os.getenv('PAGE_READY_TIMEOUT', '15'))  # 等待卡片出现的最长秒数
+    SCROLL_SETTLE_TIMEOUT: float = float(os.getenv('SCROLL_SETTLE_TIMEOUT', '3'))  # 每次滚动后等待新卡片的秒数
+    MAX_SCROLL_ROUNDS: int = int(os.getenv('MAX_SCROLL_ROUNDS', '5'))
+    SELENIUM_EXTRACTION_MODE: str = os.getenv('SELENIUM_EXTRACTION_MODE', 'html')  # html (page_source + BeautifulSoup), js (in-browser JSON)
+    
+    # Async HTTP engine configuration (non-Selenium scrape paths)
+    ENABLE_ASYNC_HTTP: bool = os.getenv('ENABLE_ASYNC_HTTP', 'true').lower() == 'true'
+    HTTP2_ENABLED: bool = os.getenv('HTTP2_ENABLED', 'true').lower() == 'true'  # 需要安装 httpx[http2]
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv('HTTP_MAX_CONNECTIONS', '20'))  # 共享连接池大小
+    HTTP_PER_HOST_LIMIT: int = int(os.getenv('HTTP_PER_HOST_LIMIT', '4'))  # 每个主机的最大并发请求数
+    HTTP_TIMEOUT: float = float(os.getenv('HTTP_TIMEOUT', '30'))
+    
+    # On-disk cache configuration
+    CACHE_DIR: str = os.getenv('CACHE_DIR', '.cache')
+    ENABLE_HTTP_CACHE: bool = os.getenv('ENABLE_HTTP_CACHE', 'true').lower() == 'true'
+    HTTP_CACHE_MAX_MB: int = int(os.getenv('HTTP_CACHE_MAX_MB', '100'))
+    HTTP_CACHE_MAX_AGE_DAYS: int = int(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', '7'))
+    
+    # Selector memory configuration (remembers which card selector worked per site)
+    ENABLE_SELECTOR_MEMORY: bool = os.getenv('ENABLE_SELECTOR_MEMORY', 'true').lower() == 'true'
+    SELECTOR_MEMORY_PATH: str = os.getenv('SELECTOR_MEMORY_PATH', os.path.join(CACHE_DIR, 'selector_memory.json'))
+    SELECTOR_COLLAPSE_RATIO: float = float(os.getenv('SELECTOR_COLLAPSE_RATIO', '0.5'))  # 卡片数低于上次的该比例时重新探测
+    
+    # Embedded structured data (__NEXT_DATA__ / JSON-LD / Apollo) fast path
+    ENABLE_STRUCTURED_DATA: bool = os.getenv('ENABLE_STRUCTURED_DATA', 'true').lower() == 'true'
+    STRUCTURED_DATA_MIN_ITEMS: int = int(os.getenv('STRUCTURED_DATA_MIN_ITEMS', '5'))  # 少于该数量时仍使用浏览器
+    
+    # Selenium resource blocking (images, fonts, media, trackers)
+    ENABLE_RESOURCE_BLOCKING: bool = os.getenv('ENABLE_RESOURCE_BLOCKING', 'true').lower() == 'true'
+    RESOURCE_BASELINE_PATH: str = os.getenv('RESOURCE_BASELINE_PATH', os.path.join(CACHE_DIR, 'resource_baseline.json'))  # 未屏蔽时记录的页面流量
+    RESOURCE_REPORTING: bool = os.getenv('RESOURCE_REPORTING', 'false').lower() == 'true'  # 开启Chrome性能日志统计流量（DEBUG_MODE下总是开启）
+    RESOURCE_BASELINE_MAX_AGE_DAYS: int = int(os.getenv('RESOURCE_BASELINE_MAX_AGE_DAYS', '30'))  # 基线过期后以不屏蔽方式重新测量一次
+    
+    # Incremental scraping (seen-tools index)
+    ENABLE_INCREMENTAL_SCRAPING: bool = os.getenv('ENABLE_INCREMENTAL_SCRAPING', 'true').lower() == 'true'
+    SKIP_SEEN_TOOLS: bool = os.getenv('SKIP_SEEN_TOOLS', 'true').lower() == 'true'  # 分析时跳过以前运行中见过的工具
+    SEEN_INDEX_PATH: str = os.getenv('SEEN_INDEX_PATH', os.path.join(CACHE_DIR, 'seen_tools.json'))
+    SEEN_INDEX_MAX_AGE_DAYS: int = int(os.getenv('SEEN_INDEX_MAX_AGE_DAYS', '90'))
+    SEEN_STOP_WINDOW: int = int(os.getenv('SEEN_STOP_WINDOW', '10'))  # 最后N张卡片都已见过时停止滚动
+    ENABLE_PAGE_HASHES: bool = os.getenv('ENABLE_PAGE_HASHES', 'true').lower() == 'true'  # 页面内容未变化时复用上次的工具列表，跳过提取和分析
+    PAGE_HASH_PATH: str = os.getenv('PAGE_HASH_PATH', os.path.join(CACHE_DIR, 'page_hashes.json'))
+    PAGE_HASH_MIN_CHARS: int = int(os.getenv('PAGE_HASH_MIN_CHARS', '200'))  # 可见文本少于该长度（前端渲染的空壳页）时不比对
+    PAGE_HASH_MAX_AGE_DAYS: int = int(os.getenv('PAGE_HASH_MAX_AGE_DAYS', '7'))  # 超过该天数即使未变化也重新提取
+    
+    # Site health ledger and circuit breaker
+    ENABLE_CIRCUIT_BREAKER: bool = os.getenv('ENABLE_CIRCUIT_BREAKER', 'true').lower() == 'true'
+    SITE_HEALTH_PATH: str = os.getenv('SITE_HEALTH_PATH', os.path.join(CACHE_DIR, 'site_health.json'))
+    BREAKER_FAILURE_THRESHOLD: int = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '3'))  # 连续失败N次后熔断
+    BREAKER_COOLDOWN_HOURS: float = float(os.getenv('BREAKER_COOLDOWN_HOURS', '24'))  # 熔断后多久再探测，每次重新熔断翻倍
+    BREAKER_PROBE_TIMEOUT: int = int(os.getenv('BREAKER_PROBE_TIMEOUT', '10'))
+    SITE_HEALTH_HISTORY: int = int(os.getenv('SITE_HEALTH_HISTORY', '20'))  # 每个站点保留的运行记录数
+    
     # Crawl4AI Configuration
     USE_CRAWL4AI: bool = os.getenv('USE_CRAWL4AI', 'true').lower() == 'true'
     CRAWL4AI_HEADLESS: bool = os.getenv('CRAWL4AI_HEADLESS', 'true').lower() == 'true'
     CRAWL4AI_VERBOSE: bool = os.getenv('CRAWL4AI_VERBOSE', 'false').lower() == 'true'
     CRAWL4AI_CACHE_MODE: str = os.getenv('CRAWL4AI_CACHE_MODE', 'enabled')  # enabled, disabled, bypass
     CRAWL4AI_MAX_CONCURRENT: int = int(os.getenv('CRAWL4AI_MAX_CONCURRENT', '5'))
+    CRAWL4AI_PER_HOST_LIMIT: int = int(os.getenv('CRAWL4AI_PER_HOST_LIMIT', '2'))  # 同一主机同时打开的页面数
     CRAWL4AI_BROWSER_TYPE: str = os.getenv('CRAWL4AI_BROWSER_TYPE', 'chromium')  # chromium, firefox, webkit
     CRAWL4AI_USER_AGENT: str = os.getenv('CRAWL4AI_USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
     CRAWL4AI_VIEWPORT_WIDTH: int = int(os.getenv('CRAWL4AI_VIEWPORT_WIDTH', '1920'))
@@ -91,10 +159,17 @@ class Config:
     
     # Deep Crawling Configuration
     ENABLE_DEEP_CRAWL: bool = os.getenv('ENABLE_DEEP_CRAWL', 'false').lower() == 'true'
-    DEEP_CRAWL_STRATEGY: str = os.getenv('DEEP_CRAWL_STRATEGY', 'bfs')  # bfs, dfs, bestfirst
+    DEEP_CRAWL_STRATEGY: str = os.getenv('DEEP_CRAWL_STRATEGY', 'bestfirst')  # bfs, dfs, bestfirst
     DEEP_CRAWL_MAX_DEPTH: int = int(os.getenv('DEEP_CRAWL_MAX_DEPTH', '3'))
     DEEP_CRAWL_MAX_PAGES: int = int(os.getenv('DEEP_CRAWL_MAX_PAGES', '10'))
-    DEEP_CRAWL_DELAY: float = float(os.getenv('DEEP_CRAWL_DELAY', '1.0'))
+    DEEP_CRAWL_DELAY: float = float(os.getenv('DEEP_CRAWL_DELAY', '1.0'))  # 同一主机两次请求之间的间隔
+    DEEP_CRAWL_FRONTIER_PATH: str = os.getenv('DEEP_CRAWL_FRONTIER_PATH', os.path.join(CACHE_DIR, 'deep_crawl_frontier.json'))
+    DEEP_CRAWL_BLOOM_CAPACITY: int = int(os.getenv('DEEP_CRAWL_BLOOM_CAPACITY', '100000'))  # 已访问URL布隆过滤器的容量
+    DEEP_CRAWL_BLOOM_ERROR_RATE: float = float(os.getenv('DEEP_CRAWL_BLOOM_ERROR_RATE', '0.001'))
+    DEEP_CRAWL_FRONTIER_SIZE: int = int(os.getenv('DEEP_CRAWL_FRONTIER_SIZE', '1000'))  # 保存到下次运行的待爬链接数
+    DEEP_CRAWL_TIME_BUDGET: int = int(os.getenv('DEEP_CRAWL_TIME_BUDGET', '600'))  # 每次运行深度爬取的最长秒数，0表示不限
+    DEEP_CRAWL_RECRAWL_HOURS: float = float(os.getenv('DEEP_CRAWL_RECRAWL_HOURS', '12'))  # 列表页在该时间内不重复抓取
+    DEEP_CRAWL_MAX_ATTEMPTS: int = int(os.getenv('DEEP_CRAWL_MAX_ATTEMPTS', '3'))  # 失败的页面最多尝试次数（跨运行）
     
     # Notification Configuration
     NOTIFICATION_WEBHOOK_URL: Optional[str] = os.getenv('NOTIFICATION_WEBHOOK_URL')
@@ -108,13 +183,20 @@ class Config:
     EMAIL_PASSWORD: str = os.getenv('EMAIL_PASSWORD', '')
     
     # System Configuration
-    MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', '3'))
+    MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', '3'))  # 可恢复错误（超时、429、5xx）的重试次数
+    RETRY_BASE_DELAY: float = float(os.getenv('RETRY_BASE_DELAY', '1'))  # 指数退避基数（秒），带随机抖动
+    RETRY_MAX_DELAY: float = float(os.getenv('RETRY_MAX_DELAY', '30'))
+    TIMING_REPORT_PATH: str = os.getenv('TIMING_REPORT_PATH', 'execution_timings.json')  # 各阶段耗时（JSON）
     BATCH_SIZE: int = int(os.getenv('BATCH_SIZE', '10'))
     DEBUG_MODE: bool = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
     
     # Multi-site scraping configuration
     ENABLE_MULTI_SITE: bool = os.getenv('ENABLE_MULTI_SITE', 'true').lower() == 'true'
     MAX_TOTAL_ITEMS: int = int(os.getenv('MAX_TOTAL_ITEMS', '500'))  # 增加总数限制
+    ENABLE_CONCURRENT_SCRAPING: bool = os.getenv('ENABLE_CONCURRENT_SCRAPING', 'true').lower() == 'true'
+    MAX_SCRAPE_WORKERS: int = int(os.getenv('MAX_SCRAPE_WORKERS', '3'))  # 并发爬取的站点数上限
+    ENABLE_STREAMING_PIPELINE: bool = os.getenv('ENABLE_STREAMING_PIPELINE', 'true').lower() == 'true'  # 边爬取边分析
+    SCRAPE_ENGINE: str = os.getenv('SCRAPE_ENGINE', '')  # 显式指定多站点爬取引擎 selenium/crawl4ai；留空时由 USE_CRAWL4AI 决定
     
     @classmethod
     def get_enabled_sites(cls) -> List[str]:
@@ -135,7 +217,9 @@ class Config:
             'enabled': True,
             'max_items': 30,
             'delay': 2,
-            'use_selenium': True
+            'use_selenium': True,
+            'allow_resources': [],  # 从默认屏蔽列表中移除的模式
+            'block_resources': []   # 额外屏蔽的URL模式
         }
     
     @classmethod
@@ -147,6 +231,7 @@ class Config:
             'verbose': cls.CRAWL4AI_VERBOSE,
             'cache_mode': cls.CRAWL4AI_CACHE_MODE,
             'max_concurrent': cls.CRAWL4AI_MAX_CONCURRENT,
+            'per_host_limit': cls.CRAWL4AI_PER_HOST_LIMIT,
             'browser_type': cls.CRAWL4AI_BROWSER_TYPE,
             'user_agent': cls.CRAWL4AI_USER_AGENT,
             'viewport': {
@@ -189,6 +274,13 @@ class Config:
             'max_depth': cls.DEEP_CRAWL_MAX_DEPTH,
             'max_pages': cls.DEEP_CRAWL_MAX_PAGES,
             'delay': cls.DEEP_CRAWL_DELAY,
+            'frontier_path': cls.DEEP_CRAWL_FRONTIER_PATH,
+            'bloom_capacity': cls.DEEP_CRAWL_BLOOM_CAPACITY,
+            'bloom_error_rate': cls.DEEP_CRAWL_BLOOM_ERROR_RATE,
+            'frontier_size': cls.DEEP_CRAWL_FRONTIER_SIZE,
+            'time_budget': cls.DEEP_CRAWL_TIME_BUDGET,
+            'recrawl_hours': cls.DEEP_CRAWL_RECRAWL_HOURS,
+            'max_attempts': cls.DEEP_CRAWL_MAX_ATTEMPTS,
         }
     
     @classmethod
@@ -214,15 +306,68 @@ class Config:
         """Print current configuration (hiding sensitive data)"""
         print("Current Configuration:")
         print(f"  TARGET_URL: {cls.TARGET_URL}")
+        print(f"  ENABLE_TOOLIFY_PAGINATION: {cls.ENABLE_TOOLIFY_PAGINATION}")
+        print(f"  TOOLIFY_MAX_PAGES: {cls.TOOLIFY_MAX_PAGES}")
+        print(f"  TOOLIFY_PAGE_URL_TEMPLATE: {cls.TOOLIFY_PAGE_URL_TEMPLATE}")
+        print(f"  ENABLE_HEDGED_SCRAPING: {cls.ENABLE_HEDGED_SCRAPING}")
+        print(f"  HEDGE_MIN_TOOLS: {cls.HEDGE_MIN_TOOLS}")
+        print(f"  ENABLE_PAGE_ARTIFACTS: {cls.ENABLE_PAGE_ARTIFACTS}")
         print(f"  ENABLE_MULTI_SITE: {cls.ENABLE_MULTI_SITE}")
         print(f"  TARGET_URLS: {len(cls.TARGET_URLS)} sites configured")
         for i, url in enumerate(cls.TARGET_URLS, 1):
             print(f"    {i}. {url}")
         print(f"  SCRAPING_DELAY: {cls.SCRAPING_DELAY}")
+        print(f"  ENABLE_DRIVER_POOL: {cls.ENABLE_DRIVER_POOL}")
+        print(f"  DRIVER_POOL_SIZE: {cls.DRIVER_POOL_SIZE}")
+        print(f"  DRIVER_MAX_PAGES: {cls.DRIVER_MAX_PAGES}")
+        print(f"  PAGE_READY_TIMEOUT: {cls.PAGE_READY_TIMEOUT}s")
+        print(f"  SCROLL_SETTLE_TIMEOUT: {cls.SCROLL_SETTLE_TIMEOUT}s")
+        print(f"  MAX_SCROLL_ROUNDS: {cls.MAX_SCROLL_ROUNDS}")
+        print(f"  SELENIUM_EXTRACTION_MODE: {cls.SELENIUM_EXTRACTION_MODE}")
+        print(f"  ENABLE_ASYNC_HTTP: {cls.ENABLE_ASYNC_HTTP}")
+        print(f"  HTTP2_ENABLED: {cls.HTTP2_ENABLED}")
+        print(f"  HTTP_MAX_CONNECTIONS: {cls.HTTP_MAX_CONNECTIONS}")
+        print(f"  HTTP_PER_HOST_LIMIT: {cls.HTTP_PER_HOST_LIMIT}")
+        print(f"  HTTP_TIMEOUT: {cls.HTTP_TIMEOUT}")
+        print(f"  CACHE_DIR: {cls.CACHE_DIR}")
+        print(f"  ENABLE_HTTP_CACHE: {cls.ENABLE_HTTP_CACHE}")
+        print(f"  HTTP_CACHE_MAX_MB: {cls.HTTP_CACHE_MAX_MB}")
+        print(f"  HTTP_CACHE_MAX_AGE_DAYS: {cls.HTTP_CACHE_MAX_AGE_DAYS}")
+        print(f"  ENABLE_SELECTOR_MEMORY: {cls.ENABLE_SELECTOR_MEMORY}")
+        print(f"  SELECTOR_MEMORY_PATH: {cls.SELECTOR_MEMORY_PATH}")
+        print(f"  SELECTOR_COLLAPSE_RATIO: {cls.SELECTOR_COLLAPSE_RATIO}")
+        print(f"  ENABLE_STRUCTURED_DATA: {cls.ENABLE_STRUCTURED_DATA}")
+        print(f"  STRUCTURED_DATA_MIN_ITEMS: {cls.STRUCTURED_DATA_MIN_ITEMS}")
+        print(f"  ENABLE_RESOURCE_BLOCKING: {cls.ENABLE_RESOURCE_BLOCKING}")
+        print(f"  RESOURCE_BASELINE_PATH: {cls.RESOURCE_BASELINE_PATH}")
+        print(f"  RESOURCE_REPORTING: {cls.RESOURCE_REPORTING}")
+        print(f"  RESOURCE_BASELINE_MAX_AGE_DAYS: {cls.RESOURCE_BASELINE_MAX_AGE_DAYS}")
+        print(f"  ENABLE_INCREMENTAL_SCRAPING: {cls.ENABLE_INCREMENTAL_SCRAPING}")
+        print(f"  SKIP_SEEN_TOOLS: {cls.SKIP_SEEN_TOOLS}")
+        print(f"  SEEN_INDEX_PATH: {cls.SEEN_INDEX_PATH}")
+        print(f"  SEEN_INDEX_MAX_AGE_DAYS: {cls.SEEN_INDEX_MAX_AGE_DAYS}")
+        print(f"  SEEN_STOP_WINDOW: {cls.SEEN_STOP_WINDOW}")
+        print(f"  ENABLE_PAGE_HASHES: {cls.ENABLE_PAGE_HASHES}")
+        print(f"  PAGE_HASH_PATH: {cls.PAGE_HASH_PATH}")
+        print(f"  PAGE_HASH_MIN_CHARS: {cls.PAGE_HASH_MIN_CHARS}")
+        print(f"  PAGE_HASH_MAX_AGE_DAYS: {cls.PAGE_HASH_MAX_AGE_DAYS}")
+        print(f"  ENABLE_CIRCUIT_BREAKER: {cls.ENABLE_CIRCUIT_BREAKER}")
+        print(f"  SITE_HEALTH_PATH: {cls.SITE_HEALTH_PATH}")
+        print(f"  BREAKER_FAILURE_THRESHOLD: {cls.BREAKER_FAILURE_THRESHOLD}")
+        print(f"  BREAKER_COOLDOWN_HOURS: {cls.BREAKER_COOLDOWN_HOURS}")
+        print(f"  BREAKER_PROBE_TIMEOUT: {cls.BREAKER_PROBE_TIMEOUT}")
+        print(f"  SITE_HEALTH_HISTORY: {cls.SITE_HEALTH_HISTORY}")
         print(f"  MAX_RETRIES: {cls.MAX_RETRIES}")
+        print(f"  RETRY_BASE_DELAY: {cls.RETRY_BASE_DELAY}")
+        print(f"  RETRY_MAX_DELAY: {cls.RETRY_MAX_DELAY}")
+        print(f"  TIMING_REPORT_PATH: {cls.TIMING_REPORT_PATH}")
         print(f"  BATCH_SIZE: {cls.BATCH_SIZE}")
         print(f"  DEBUG_MODE: {cls.DEBUG_MODE}")
         print(f"  MAX_TOTAL_ITEMS: {cls.MAX_TOTAL_ITEMS}")
+        print(f"  ENABLE_CONCURRENT_SCRAPING: {cls.ENABLE_CONCURRENT_SCRAPING}")
+        print(f"  MAX_SCRAPE_WORKERS: {cls.MAX_SCRAPE_WORKERS}")
+        print(f"  ENABLE_STREAMING_PIPELINE: {cls.ENABLE_STREAMING_PIPELINE}")
+        print(f"  SCRAPE_ENGINE: {cls.SCRAPE_ENGINE or 'auto (USE_CRAWL4AI)'}")
         print(f"  OPENAI_API_KEY: {'*' * 20 if cls.OPENAI_API_KEY else 'Not set'}")
         print(f"  NOTIFICATION_EMAIL: {cls.NOTIFICATION_EMAIL}")
         print(f"  EMAIL_HOST: {cls.EMAIL_HOST}")
@@ -240,6 +385,7 @@ class Config:
         print(f"    VERBOSE: {cls.CRAWL4AI_VERBOSE}")
         print(f"    CACHE_MODE: {cls.CRAWL4AI_CACHE_MODE}")
         print(f"    MAX_CONCURRENT: {cls.CRAWL4AI_MAX_CONCURRENT}")
+        print(f"    PER_HOST_LIMIT: {cls.CRAWL4AI_PER_HOST_LIMIT}")
         print(f"    BROWSER_TYPE: {cls.CRAWL4AI_BROWSER_TYPE}")
         print(f"    VIEWPORT: {cls.CRAWL4AI_VIEWPORT_WIDTH}x{cls.CRAWL4AI_VIEWPORT_HEIGHT}")
         print(f"    WAIT_TIMEOUT: {cls.CRAWL4AI_WAIT_TIMEOUT}ms")
@@ -267,4 +413,11 @@ class Config:
         print(f"    STRATEGY: {cls.DEEP_CRAWL_STRATEGY}")
         print(f"    MAX_DEPTH: {cls.DEEP_CRAWL_MAX_DEPTH}")
         print(f"    MAX_PAGES: {cls.DEEP_CRAWL_MAX_PAGES}")
-        print(f"    DELAY: {cls.DEEP_CRAWL_DELAY}s") 
\ No newline at end of file
+        print(f"    DELAY: {cls.DEEP_CRAWL_DELAY}s")
+        print(f"    FRONTIER_PATH: {cls.DEEP_CRAWL_FRONTIER_PATH}")
+        print(f"    BLOOM_CAPACITY: {cls.DEEP_CRAWL_BLOOM_CAPACITY}")
+        print(f"    BLOOM_ERROR_RATE: {cls.DEEP_CRAWL_BLOOM_ERROR_RATE}")
+        print(f"    FRONTIER_SIZE: {cls.DEEP_CRAWL_FRONTIER_SIZE}")
+        print(f"    TIME_BUDGET: {cls.DEEP_CRAWL_TIME_BUDGET}s")
+        print(f"    RECRAWL_HOURS: {cls.DEEP_CRAWL_RECRAWL_HOURS}")
+        print(f"    MAX_ATTEMPTS: {cls.DEEP_CRAWL_MAX_ATTEMPTS}") 
\ No newline at end of file
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+pytest 公共夹具
+每个测试使用独立的临时缓存目录；对 Config 类属性的修改在测试结束后自动还原，不会影响其他测试
+"""
+
+import sys
+import os
+import pytest
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from config import Config
+
+
+class CacheSandbox:
+    """Temporary cache directory plus Config overrides scoped to one test"""
+    
+    def __init__(self, tmp_path, monkeypatch):
+        self.dir = tmp_path
+        self.monkeypatch = monkeypatch
+    
+    def path(self, name: str) -> str:
+        """Path of a cache file inside this test's directory"""
+        return str(self.dir / name)
+    
+    def configure(self, **values):
+        """Override Config class attributes until the test ends"""
+        for name, value in values.items():
+            self.monkeypatch.setattr(Config, name, value)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch) -> CacheSandbox:
+    """Per-test cache directory and Config overrides, undone by pytest afterwards"""
+    return CacheSandbox(tmp_path, monkeypatch)
@@ -8,8 +8,9 @@ import sys
 import os
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -17,17 +18,25 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 from config import Config
 from src.toolify_scraper import ToolifyScraper
 from src.multi_site_scraper import MultiSiteScraper
+from src.scrape_engines import get_scrape_engine
 from src.openai_analyzer import OpenAIAnalyzer
 from src.data_processor import DataProcessor
 from src.notification_system import NotificationSystem
+from src.retry_policy import retry_policy
+from src.timing import timeline
 
 class AIWordsMiningSystem:
     """Main AI Words Mining System orchestrator"""
     
     def __init__(self):
         self.config = Config()
-        self.scraper = ToolifyScraper()  # Keep for backward compatibility
         self.multi_scraper = MultiSiteScraper()  # New multi-site scraper
+        # Keep for backward compatibility; shares the multi-site browser pool and HTTP cache
+        self.scraper = ToolifyScraper(driver_pool=self.multi_scraper.driver_pool,
+                                      http_cache=self.multi_scraper.http_cache,
+                                      seen_index=self.multi_scraper.seen_index,
+                                      page_artifacts=self.multi_scraper.page_artifacts)
+        self.scrape_engine = get_scrape_engine(self.multi_scraper)  # USE_CRAWL4AI, or SCRAPE_ENGINE to override
         self.analyzer = OpenAIAnalyzer()
         self.processor = DataProcessor()
         self.notification_system = NotificationSystem()
@@ -38,6 +47,9 @@ class AIWordsMiningSystem:
             'scraped_tools': 0,
             'extracted_words': 0,
             'processed_words': 0,
+            'skipped_seen_tools': 0,
+            'unchanged_pages': self.multi_scraper.page_hashes.stats,  # checked, unchanged, tools_reused
+            'retries': retry_policy.stats,  # per operation: calls, retries, failures, retry_seconds
             'sheets_updated': False,
             'notifications_sent': False,
             'errors': [],
@@ -106,43 +118,10 @@ class AIWordsMiningSystem:
             # Send start notification
             if self.config.ENABLE_MULTI_SITE:
                 self.notification_system.notify_start("Multiple AI tool websites")
-                print(f"🌐 Multi-site scraping enabled - scraping {len(self.config.TARGET_URLS)} sites")
+                print(f"🌐 Multi-site scraping enabled - scraping {len(self.config.TARGET_URLS)} sites "
+                      f"with the {self.scrape_engine.name} engine")
                 
-                # Use multi-site scraper
-                tools_data = self.multi_scraper.scrape_all_sites()
-                
-                if not tools_data:
-                    print("❌ 多网站爬虫没有获取到数据，尝试单网站爬虫...")
-                    # Fallback to single site scraper
-                    tools_data = self.scraper.scrape(self.config.TARGET_URL)
-                    
-                    if not tools_data:
-                        print("❌ 单网站爬虫也没有获取到数据，尝试使用模拟数据...")
-                        from src.mock_web_scraper import MockWebScraper
-                        mock_scraper = MockWebScraper()
-                        tools_data = mock_scraper.scrape_ai_tools()
-                        
-                        if not tools_data:
-                            raise Exception("No tools data scraped from any source")
-                            
-                        self.stats['warnings'].append("Used mock data due to all scraping failures")
-                    else:
-                        self.stats['warnings'].append("Fallback to single site scraper due to multi-site failure")
-                else:
-                    print(f"✅ Multi-site scraping successful")
-                    # Save detailed source statistics
-                    source_stats = {}
-                    for tool in tools_data:
-                        source = tool.get('source', 'unknown')
-                        source_stats[source] = source_stats.get(source, 0) + 1
-                    
-                    print("📊 Source breakdown:")
-                    for source, count in source_stats.items():
-                        print(f"  - {source}: {count} tools")
-                    
-                    # Save multi-site scraped data for debugging
-                    if self.config.DEBUG_MODE:
-                        self.multi_scraper.save_results(tools_data, "debug_multi_site_scraped_tools.json")
+                tools_data = self.multi_site_results(self.scrape_with_engine())
             else:
                 print("🔗 Single-site scraping mode")
                 self.notification_system.notify_start(self.config.TARGET_URL)
@@ -176,11 +155,187 @@ class AIWordsMiningSystem:
             self.stats['errors'].append(error_msg)
             raise
     
+    def scrape_with_engine(self) -> List[Dict]:
+        """Run the selected scrape engine, falling back to Selenium if another engine fails or finds nothing"""
+        if self.scrape_engine.name == 'selenium':
+            return self.scrape_engine.scrape()
+        
+        try:
+            with timeline.span('scrape.engine', self.scrape_engine.name):
+                tools_data = self.scrape_engine.scrape()
+        except Exception as e:
+            print(f"❌ {self.scrape_engine.name} engine failed: {e}")
+            tools_data = []
+        
+        if not tools_data:
+            print(f"⚠️ {self.scrape_engine.name} engine found no tools, retrying with Selenium...")
+            self.stats['warnings'].append(f"Fell back to Selenium after the {self.scrape_engine.name} engine found nothing")
+            tools_data = self.multi_scraper.scrape_all_sites()
+        
+        return tools_data
+    
+    def multi_site_results(self, tools_data: List[Dict]) -> List[Dict]:
+        """Report a successful multi-site scrape, or fall back when it found nothing"""
+        if not tools_data:
+            return self.scrape_fallback_tools()
+        
+        print("✅ Multi-site scraping successful")
+        self.print_source_breakdown(tools_data)
+        
+        # Save multi-site scraped data for debugging
+        if self.config.DEBUG_MODE:
+            self.multi_scraper.save_results(tools_data, "debug_multi_site_scraped_tools.json")
+        
+        return tools_data
+    
+    def warn_selenium_only_features(self):
+        """Say which enabled features the selected engine skips, since they are only built into the Selenium path"""
+        selenium_only = {
+            'ENABLE_STREAMING_PIPELINE': 'streaming analysis',
+            'ENABLE_CIRCUIT_BREAKER': 'site circuit breaker',
+            'ENABLE_SELECTOR_MEMORY': 'selector memory',
+            'ENABLE_PAGE_ARTIFACTS': 'page artifact reuse'
+        }
+        skipped = [f"{name} ({feature})" for name, feature in selenium_only.items() if getattr(self.config, name)]
+        if skipped:
+            print(f"⚠️ The {self.scrape_engine.name} engine ignores: {', '.join(skipped)}. "
+                  f"Set SCRAPE_ENGINE=selenium to use them")
+    
+    def scrape_fallback_tools(self) -> List[Dict]:
+        """Single-site scraper, then mock data, when multi-site scraping found nothing"""
+        print("❌ 多网站爬虫没有获取到数据，尝试单网站爬虫...")
+        # Fallback to single site scraper
+        tools_data = self.scraper.scrape(self.config.TARGET_URL)
+        
+        if not tools_data:
+            print("❌ 单网站爬虫也没有获取到数据，尝试使用模拟数据...")
+            from src.mock_web_scraper import MockWebScraper
+            mock_scraper = MockWebScraper()
+            tools_data = mock_scraper.scrape_ai_tools()
+            
+            if not tools_data:
+                raise Exception("No tools data scraped from any source")
+                
+            self.stats['warnings'].append("Used mock data due to all scraping failures")
+        else:
+            self.stats['warnings'].append("Fallback to single site scraper due to multi-site failure")
+        
+        return tools_data
+    
+    def print_source_breakdown(self, tools_data: List[Dict]):
+        """Print how many tools came from each source"""
+        source_stats = {}
+        for tool in tools_data:
+            source = tool.get('source', 'unknown')
+            source_stats[source] = source_stats.get(source, 0) + 1
+        
+        print("📊 Source breakdown:")
+        for source, count in source_stats.items():
+            print(f"  - {source}: {count} tools")
+    
+    def stream_scrape_and_analyze(self) -> Tuple[List[Dict], List[Dict]]:
+        """Send OpenAI batches as soon as BATCH_SIZE tools arrive, while other sites are still scraping"""
+        print("🌊 Streaming pipeline: analyzing tools while sites are still being scraped")
+        
+        tools_data = []
+        batch = []
+        batch_futures = []
+        stream_start = time.time()
+        
+        # One analysis worker keeps OpenAI calls in order and off the scraping thread
+        with ThreadPoolExecutor(max_workers=1) as analysis_executor:
+            def submit(tools: List[Dict]):
+                batch_futures.append(analysis_executor.submit(self.analyzer.analyze_tools_batch, tools))
+                print(f"🧠 Batch {len(batch_futures)} ({len(tools)} tools) sent for analysis "
+                      f"at {time.time() - stream_start:.1f}s")
+            
+            try:
+                self.notification_system.notify_start("Multiple AI tool websites")
+                
+                for tool in self.multi_scraper.iter_tools():
+                    tools_data.append(tool)
+                    
+                    if not self.needs_analysis(tool):
+                        self.stats['skipped_seen_tools'] += 1
+                        continue
+                    
+                    batch.append(tool)
+                    if len(batch) >= self.config.BATCH_SIZE:
+                        submit(batch)
+                        batch = []
+                
+                streamed = bool(tools_data)
+                tools_data = self.multi_site_results(tools_data)
+                if not streamed:
+                    # Nothing streamed in: analyze the fallback tools in one go
+                    batch = [tool for tool in tools_data if self.needs_analysis(tool)]
+                
+                self.stats['scraped_tools'] = len(tools_data)
+                print(f"✅ Successfully obtained {len(tools_data)} AI tools")
+                
+            except Exception as e:
+                error_msg = f"Failed to scrape AI tools: {str(e)}"
+                print(f"❌ {error_msg}")
+                self.stats['errors'].append(error_msg)
+                raise
+            
+            if batch:
+                submit(batch)
+            
+            try:
+                all_words = []
+                for future in batch_futures:
+                    all_words.extend(future.result())
+            except Exception as e:
+                error_msg = f"Failed to analyze tools: {str(e)}"
+                print(f"❌ {error_msg}")
+                self.stats['errors'].append(error_msg)
+                raise
+        
+        if self.stats['skipped_seen_tools']:
+            print(f"⏭️ Skipped {self.stats['skipped_seen_tools']} tools seen in earlier runs")
+        
+        extracted_words = self.analyzer.filter_and_rank_words(all_words)
+        self.stats['extracted_words'] = len(extracted_words)
+        
+        if extracted_words:
+            print(f"✅ Extracted {len(extracted_words)} new words/terms")
+        else:
+            self.stats['warnings'].append("No new words extracted from analysis")
+            print("⚠️ No new words extracted")
+        
+        if self.config.DEBUG_MODE and extracted_words:
+            self.analyzer.save_analysis_results(extracted_words, "debug_extracted_words.json")
+        
+        return tools_data, extracted_words
+    
+    def needs_analysis(self, tool: Dict) -> bool:
+        """False for tools from unchanged pages, and for seen tools when SKIP_SEEN_TOOLS is on"""
+        if tool.get('unchanged_page'):
+            return False
+        return not self.config.SKIP_SEEN_TOOLS or tool.get('is_new', True)
+    
+    def analyzed_tools(self, tools_data: List[Dict]) -> List[Dict]:
+        """Tools whose OpenAI batch succeeded, plus those skipped because an earlier run analyzed them"""
+        return [tool for tool in tools_data if tool.get('analyzed') or not self.needs_analysis(tool)]
+    
     def analyze_tools(self, tools_data: List[Dict]) -> List[Dict]:
         """Analyze tools and extract new words using OpenAI"""
         print("🧠 Analyzing tools with OpenAI...")
         
         try:
+            # Tools collected in earlier runs were already analyzed
+            new_tools = [tool for tool in tools_data if self.needs_analysis(tool)]
+            self.stats['skipped_seen_tools'] = len(tools_data) - len(new_tools)
+            if self.stats['skipped_seen_tools']:
+                print(f"⏭️ Skipping {self.stats['skipped_seen_tools']} tools seen in earlier runs")
+            
+            if not new_tools:
+                self.stats['warnings'].append("All scraped tools were seen in earlier runs")
+                print("⚠️ No new tools to analyze")
+                return []
+            tools_data = new_tools
+            
             # Analyze and extract new words
             extracted_words = self.analyzer.analyze_and_extract(tools_data)
             
@@ -422,6 +577,9 @@ AI Words Mining System
 ## 📝 Extracted Words
 {self.format_words_for_markdown(words_data)}
 
+## ⏱️ Stage Timings
+{timeline.to_markdown()}
+
 ## ⚠️ Warnings
 {chr(10).join(f"- {warning}" for warning in self.stats.get('warnings', []))}
 
@@ -552,11 +710,76 @@ AI Words Mining System
         print(f"⏰ End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"⏱️ Execution time: {execution_time}")
         print(f"🕷️ Tools scraped: {self.stats['scraped_tools']}")
+        if self.stats['skipped_seen_tools']:
+            print(f"⏭️ Seen tools skipped: {self.stats['skipped_seen_tools']}")
+        page_hash_stats = self.stats['unchanged_pages']
+        if page_hash_stats['unchanged']:
+            print(f"♻️ Unchanged pages skipped: {page_hash_stats['unchanged']} of {page_hash_stats['checked']} "
+                  f"({page_hash_stats['tools_reused']} tools reused without extraction or analysis)")
         print(f"🧠 Words extracted: {self.stats['extracted_words']}")
         print(f"⚙️ Words processed: {self.stats['processed_words']}")
         print(f"📊 Sheets updated: {'✅' if self.stats['sheets_updated'] else '❌'}")
         print(f"📬 Notifications sent: {'✅' if self.stats['notifications_sent'] else '❌'}")
         
+        readiness_stats = {**self.multi_scraper.readiness_stats, **self.scraper.readiness_stats}
+        if readiness_stats:
+            print(f"⏱️ Page readiness waits: {sum(r['waited'] for r in readiness_stats.values()):.1f}s total")
+            for url, readiness in readiness_stats.items():
+                print(f"   - {url}: {readiness['waited']}s ({readiness['cards']} cards, {readiness['scroll_rounds']} scrolls)")
+        
+        resource_stats = {**self.multi_scraper.resource_blocker.stats, **self.scraper.resource_blocker.stats}
+        if resource_stats:
+            print(f"🚫 Resource blocking: {sum(r['blocked'] for r in resource_stats.values())} requests blocked")
+            for url, usage in resource_stats.items():
+                transferred = f"{usage['bytes'] / 1024:.0f} KB" if usage['bytes'] is not None else "n/a"
+                saved = (f", {usage['bytes_saved'] / 1024:.0f} KB saved vs baseline" if usage['bytes_saved'] is not None
+                         else " (unblocked baseline load)" if usage.get('baseline') else "")
+                print(f"   - {url}: loaded in {usage['load_ms']} ms, {transferred} transferred{saved}")
+        
+        selector_stats = self.multi_scraper.selector_memory.stats
+        if selector_stats['remembered_hits'] or selector_stats['probes']:
+            print(f"🧠 Selector memory: {selector_stats['remembered_hits']} remembered hits, "
+                  f"{selector_stats['probes']} full probes, {selector_stats['collapses']} collapses")
+        
+        artifact_stats = self.multi_scraper.page_artifacts.stats
+        if artifact_stats['reused']:
+            print(f"♻️ Page artifacts: {artifact_stats['stored']} pages captured, {artifact_stats['reused']} re-parsed by the fallback")
+        
+        http_cache = self.multi_scraper.http_cache
+        if http_cache:
+            cache_stats = http_cache.stats
+            print(f"💾 HTTP cache: {cache_stats['hits']} hits (304), {cache_stats['misses']} misses, "
+                  f"{cache_stats['stored']} stored, {cache_stats['evicted']} evicted, "
+                  f"{cache_stats['bytes_saved'] / 1024:.0f} KB not re-downloaded")
+        
+        slowest = [row for row in timeline.stage_totals() if not row['stage'].startswith('pipeline.')][:5]
+        if slowest:
+            print("⏱️ Slowest stages:")
+            for row in slowest:
+                target = f" ({row['label']})" if row['label'] else ""
+                print(f"   - {row['stage']}{target}: {row['seconds']:.1f}s over {row['count']} calls")
+        
+        retry_stats = {op: stats for op, stats in self.stats['retries'].items() if stats['retries'] or stats['failures']}
+        if retry_stats:
+            print(f"🔁 Retries: {sum(stats['retries'] for stats in retry_stats.values())} "
+                  f"({sum(stats['retry_seconds'] for stats in retry_stats.values()):.1f}s backing off)")
+            for operation, stats in retry_stats.items():
+                print(f"   - {operation}: {stats['retries']} retries over {stats['calls']} calls, "
+                      f"{stats['retry_seconds']:.1f}s waiting, {stats['failures']} gave up")
+        
+        site_health = self.multi_scraper.site_health
+        if site_health.ledger:
+            print(f"🔌 Site health (last {self.config.SITE_HEALTH_HISTORY} runs):")
+            for domain in sorted(site_health.ledger):
+                health = site_health.summary(domain)
+                success_rate = f"{health['success_rate']:.0%}" if health['success_rate'] is not None else "n/a"
+                event = site_health.run_events.get(domain)
+                line = (f"   - {domain}: breaker {health['state']}{f' ({event} this run)' if event else ''}, "
+                        f"{success_rate} success, {health['avg_items']:.0f} items avg, {health['avg_seconds']:.1f}s avg")
+                if health['state'] != 'closed' or health['consecutive_failures']:
+                    line += f", last error: {health['last_error']}"
+                print(line)
+        
         if self.stats['errors']:
             print(f"❌ Errors: {len(self.stats['errors'])}")
             for error in self.stats['errors']:
@@ -583,27 +806,50 @@ AI Words Mining System
             if not self.test_integrations():
                 print("⚠️ Some integration tests failed, but continuing...")
             
-            # Step 3: Scrape AI tools
-            tools_data = self.scrape_ai_tools()
+            if self.config.ENABLE_MULTI_SITE and self.scrape_engine.name != 'selenium':
+                self.warn_selenium_only_features()
+            
+            # Streaming needs per-site results as they finish, which only the Selenium engine yields
+            if (self.config.ENABLE_STREAMING_PIPELINE and self.config.ENABLE_MULTI_SITE
+                    and self.scrape_engine.name == 'selenium'):
+                # Steps 3-4 overlapped: analyze batches as sites finish
+                with timeline.span('pipeline.scrape_and_analyze'):
+                    tools_data, extracted_words = self.stream_scrape_and_analyze()
+            else:
+                # Step 3: Scrape AI tools
+                with timeline.span('pipeline.scrape'):
+                    tools_data = self.scrape_ai_tools()
+                
+                # Step 4: Analyze tools with OpenAI
+                with timeline.span('pipeline.analyze'):
+                    extracted_words = self.analyze_tools(tools_data)
             
-            # Step 4: Analyze tools with OpenAI
-            extracted_words = self.analyze_tools(tools_data)
+            # Remember analyzed tools and pages so later runs can skip them; after errors, retry everything next run
+            if self.stats['errors']:
+                print("⚠️ Errors during this run, seen-tools index and page hashes not updated")
+            else:
+                analyzed_tools = self.analyzed_tools(tools_data)
+                self.multi_scraper.seen_index.commit(analyzed_tools)
+                self.multi_scraper.page_hashes.commit(analyzed_tools)
             
             # Step 5: Process and deduplicate words
-            processed_result = self.process_words(extracted_words)
+            with timeline.span('pipeline.process'):
+                processed_result = self.process_words(extracted_words)
             
             # Step 6: Create backup outputs (Google Sheets removed)
-            sheets_url = self.create_all_backups(
-                processed_result.get('words', []),
-                processed_result.get('summary', {})
-            )
+            with timeline.span('pipeline.backup'):
+                sheets_url = self.create_all_backups(
+                    processed_result.get('words', []),
+                    processed_result.get('summary', {})
+                )
             
             # Step 7: Send completion notification
-            self.send_completion_notification(
-                processed_result.get('words', []),
-                processed_result.get('summary', {}),
-                sheets_url
-            )
+            with timeline.span('pipeline.notify'):
+                self.send_completion_notification(
+                    processed_result.get('words', []),
+                    processed_result.get('summary', {}),
+                    sheets_url
+                )
             
             # Print summary
             self.print_execution_summary()
@@ -631,6 +877,11 @@ AI Words Mining System
             self.print_execution_summary()
             
             return False
+        
+        finally:
+            # Quit pooled browsers once per run
+            self.multi_scraper.close()
+            timeline.save(self.config.TIMING_REPORT_PATH)
     
     def run_test_mode(self) -> bool:
         """Run system in test mode with minimal data"""
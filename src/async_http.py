@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Async HTTP Engine for AI Words Mining System
+基于httpx的异步HTTP抓取：HTTP/2、共享连接池、按主机限制并发
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Union
+from urllib.parse import urlparse
+import httpx
+from config import Config
+from src.http_cache import HTTPCache
+from src.retry_policy import retry_policy
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+def run_sync(coro):
+    """Run a coroutine from sync code, even if the caller already has an event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    # Called from inside a running loop: run on a helper thread with its own loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class AsyncHTTPEngine:
+    """Fetches many pages concurrently over one httpx connection pool"""
+    
+    def __init__(self, headers: Optional[Dict] = None, http_cache: Optional[HTTPCache] = None):
+        self.config = Config()
+        self.headers = dict(headers or {})
+        self.http_cache = http_cache
+        
+        # Only advertise brotli when we can actually decode it
+        if not BROTLI_AVAILABLE:
+            self.headers['Accept-Encoding'] = 'gzip, deflate'
+        
+        self.http2 = self.config.HTTP2_ENABLED and HTTP2_AVAILABLE
+        self.stats = {
+            'requests': 0,
+            'errors': 0,
+            'bytes': 0,
+            'elapsed': 0.0
+        }
+    
+    def create_client(self, timeout: float = None) -> httpx.AsyncClient:
+        """Create a client whose pool is shared by every request in one batch"""
+        limits = httpx.Limits(
+            max_connections=self.config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=self.config.HTTP_MAX_CONNECTIONS
+        )
+        
+        return httpx.AsyncClient(
+            headers=self.headers,
+            http2=self.http2,
+            limits=limits,
+            timeout=timeout or self.config.HTTP_TIMEOUT,
+            follow_redirects=True
+        )
+    
+    async def fetch_all(self, urls: List[str], timeout: float = None,
+                        retries: Optional[int] = None) -> Dict[str, Union[httpx.Response, Exception]]:
+        """Fetch all URLs concurrently, at most HTTP_PER_HOST_LIMIT at a time per host"""
+        host_limits = {}
+        results = {}
+        
+        async def fetch_one(client: httpx.AsyncClient, url: str):
+            host = urlparse(url).netloc
+            semaphore = host_limits.setdefault(host, asyncio.Semaphore(max(1, self.config.HTTP_PER_HOST_LIMIT)))
+            
+            async with semaphore:
+                start_time = time.time()
+                try:
+                    results[url] = await retry_policy.acall('http', lambda: self.get_with_cache(client, url), retries)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    results[url] = e
+                finally:
+                    self.stats['requests'] += 1
+                    self.stats['elapsed'] += time.time() - start_time
+            
+            if self.config.DEBUG_MODE:
+                outcome = results[url]
+                status = outcome.status_code if isinstance(outcome, httpx.Response) else type(outcome).__name__
+                print(f"🌐 {host} -> {status} in {time.time() - start_time:.2f}s")
+        
+        unique_urls = list(dict.fromkeys(urls))
+        async with self.create_client(timeout) as client:
+            await asyncio.gather(*(fetch_one(client, url) for url in unique_urls))
+        
+        return results
+    
+    async def get_with_cache(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """GET a page, revalidating against the disk cache when one is attached"""
+        if not self.http_cache:
+            response = await client.get(url)
+            self.stats['bytes'] += len(response.content)
+            return response
+        
+        entry = self.http_cache.get(url)
+        response = await client.get(url, headers=self.http_cache.conditional_headers(entry))
+        self.stats['bytes'] += len(response.content)
+        
+        if response.status_code == 304 and entry:
+            body = self.http_cache.revalidated(url, entry)
+            if body is not None:
+                return httpx.Response(200, headers=entry.get('headers', {}), content=body, request=response.request)
+        
+        self.http_cache.store(url, response.status_code, response.headers, response.content)
+        return response
+    
+    def fetch_many(self, urls: List[str], timeout: float = None,
+                   retries: Optional[int] = None) -> Dict[str, Union[httpx.Response, Exception]]:
+        """Blocking wrapper around fetch_all for the thread-based scrapers"""
+        if not urls:
+            return {}
+        
+        return run_sync(self.fetch_all(urls, timeout, retries))
+    
+    def fetch(self, url: str, timeout: float = None, retries: Optional[int] = None) -> httpx.Response:
+        """Fetch a single page, raising the request error if it failed"""
+        result = self.fetch_many([url], timeout, retries)[url]
+        if isinstance(result, Exception):
+            raise result
+        return result
@@ -7,6 +7,8 @@ Crawl4AI Enhanced Scraper for AI Words Mining System
 import asyncio
 import json
 import time
+import uuid
+from contextlib import asynccontextmanager
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
@@ -24,6 +26,11 @@ except ImportError as e:
     raise
 
 from config import Config
+from src.crawl_scheduler import CrawlScheduler
+from src.url_frontier import URLFrontier
+from src.detail_page import DetailPageExtractor
+from src.async_http import AsyncHTTPEngine
+from src.structured_data import StructuredDataExtractor
 
 
 class AIToolExtractor:
@@ -139,24 +146,162 @@ class AIToolModel(BaseModel):
 class Crawl4AIScraper:
     """基于Crawl4AI的高性能爬虫"""
     
-    def __init__(self, debug_mode: bool = False):
+    def __init__(self, debug_mode: bool = False, page_hashes=None):
         self.config = Config()
         self.debug_mode = debug_mode
+        # 可选的 PageHashIndex：列表页未变化时在启动浏览器前复用上次的工具列表
+        self.page_hashes = page_hashes
+        self.http_engine = AsyncHTTPEngine(headers={'User-Agent': self.config.CRAWL4AI_USER_AGENT})
+        self.structured_extractor = StructuredDataExtractor()
         self.extractor = AIToolExtractor()
+        self.detail_extractor = DetailPageExtractor()
+        self.crawl_config = self.config.get_crawl4ai_config()
+        self.filter_config = self.config.get_content_filter_config()
+        self.llm_config = self.config.get_llm_config()
+        self.cache_mode = self.resolve_cache_mode(self.crawl_config['cache_mode'])
         
         # 浏览器配置
         self.browser_config = BrowserConfig(
-            headless=True,
-            verbose=debug_mode,
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            browser_type=self.crawl_config['browser_type'],
+            headless=self.crawl_config['headless'],
+            verbose=debug_mode or self.crawl_config['verbose'],
+            user_agent=self.crawl_config['user_agent'],
             java_script_enabled=True,
             # 反爬配置
-            viewport={"width": 1920, "height": 1080},
+            viewport=self.crawl_config['viewport'],
             locale="en-US",
-            # 使用持久化上下文避免重复初始化
-            user_data_dir="./browser_profile",
-            use_persistent_context=True,
+            # 不使用持久化配置目录：每个任务在自己的浏览器上下文中运行，cookie、localStorage 和缓存互不共享
         )
+        
+        # 整个运行共用一个浏览器进程，任务之间只隔离上下文
+        self.crawler: Optional[AsyncWebCrawler] = None
+        # 锁在首次使用时按事件循环创建：Python 3.9 的 asyncio.Lock 绑定创建时的循环，而每次 asyncio.run 都是新循环
+        self._crawler_lock: Optional[asyncio.Lock] = None
+        self._crawler_lock_loop = None
+        
+        # 全局/每主机并发上限与单任务超时
+        self.scheduler = CrawlScheduler()
+    
+    def resolve_cache_mode(self, value: str) -> CacheMode:
+        """CRAWL4AI_CACHE_MODE (enabled, disabled, bypass, read_only, write_only) as a CacheMode"""
+        try:
+            return CacheMode(value.strip().lower())
+        except ValueError:
+            print(f"⚠️ 未知的 CRAWL4AI_CACHE_MODE '{value}'，使用 enabled")
+            return CacheMode.ENABLED
+    
+    def content_filter(self):
+        """Markdown content filter selected by CONTENT_FILTER_TYPE (pruning, bm25, none)"""
+        filter_type = self.filter_config['filter_type'].lower()
+        if filter_type == 'pruning':
+            return PruningContentFilter(
+                threshold=self.filter_config['threshold'],
+                threshold_type="fixed",
+                min_word_threshold=self.filter_config['min_words']
+            )
+        if filter_type == 'bm25':
+            return self.bm25_filter()
+        return None
+    
+    def bm25_filter(self) -> BM25ContentFilter:
+        return BM25ContentFilter(
+            user_query=self.filter_config['bm25_query'],
+            bm25_threshold=self.filter_config['bm25_threshold']
+        )
+    
+    def crawler_lock(self) -> asyncio.Lock:
+        """The crawler lock for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._crawler_lock_loop is not loop:
+            self._crawler_lock = asyncio.Lock()
+            self._crawler_lock_loop = loop
+        return self._crawler_lock
+    
+    async def start(self) -> AsyncWebCrawler:
+        """Start the shared crawler on first use"""
+        async with self.crawler_lock():
+            if self.crawler is None:
+                self.crawler = AsyncWebCrawler(config=self.browser_config)
+                await self.crawler.start()
+                if self.debug_mode:
+                    print("🌐 共享浏览器已启动")
+        return self.crawler
+    
+    async def close(self):
+        """Close the shared crawler"""
+        async with self.crawler_lock():
+            if self.crawler is not None:
+                await self.crawler.close()
+                self.crawler = None
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    @asynccontextmanager
+    async def crawler_session(self):
+        """Yield the shared crawler, or a one-off crawler when none is running"""
+        if self.crawler is not None:
+            yield self.crawler
+            return
+        
+        async with AsyncWebCrawler(config=self.browser_config) as crawler:
+            yield crawler
+    
+    async def open_task_context(self, crawler: AsyncWebCrawler, crawl_config: CrawlerRunConfig):
+        """Register a fresh browser context and page under the task's session_id; arun then uses that page"""
+        # Without this, crawl4ai shares one context between all tasks whose run config looks alike
+        browser_manager = crawler.crawler_strategy.browser_manager
+        context = await browser_manager.create_browser_context(crawl_config)
+        await browser_manager.setup_context(context, crawl_config)
+        page = await context.new_page()
+        browser_manager.sessions[crawl_config.session_id] = (context, page, time.time())
+    
+    async def run_isolated(self, url: str, crawl_config: CrawlerRunConfig, task_name: str):
+        """Crawl one URL in its own browser context, closed when the task finishes"""
+        session_id = crawl_config.session_id
+        async with self.crawler_session() as crawler:
+            try:
+                await self.open_task_context(crawler, crawl_config)
+                return await crawler.arun(url=url, config=crawl_config)
+            finally:
+                try:
+                    # Closes the session's page and, for a non-persistent browser, its context
+                    await crawler.crawler_strategy.browser_manager.kill_session(session_id)
+                except Exception as e:
+                    if self.debug_mode:
+                        print(f"⚠️ 关闭会话失败 ({task_name}): {e}")
+    
+    async def listing_digest(self, url: str, max_items: int) -> Optional[str]:
+        """Hash of the listing from one plain HTTP request, taken before the browser crawl is paid for"""
+        if not self.page_hashes or not self.page_hashes.enabled:
+            return None
+        
+        response = (await self.http_engine.fetch_all([url], retries=0)).get(url)
+        if isinstance(response, Exception) or response is None or response.status_code != 200:
+            return None
+        
+        site_domain = urlparse(url).netloc
+        if not Config.get_site_config(site_domain).get('use_selenium', True):
+            return self.page_hashes.digest_html(response.content)
+        
+        # A JS-rendered page's plain response is its static shell; only the embedded listing shows a change
+        structured = self.structured_extractor.extract(response.content, url, site_domain.replace('www.', ''), max_items)
+        return self.page_hashes.digest_tools(structured)
+    
+    async def reuse_unchanged(self, url: str, site_name: str, max_items: int):
+        """Last run's tools if the listing is unchanged, plus the digest to remember after extraction"""
+        digest = await self.listing_digest(url, max_items)
+        previous = self.page_hashes.unchanged(url, digest) if self.page_hashes else None
+        if previous is not None:
+            print(f"♻️ {site_name} 页面未变化，复用上次的 {len(previous)} 个工具")
+        return previous, digest
+    
+    def new_session_id(self, task_name: str) -> str:
+        return f"{task_name}-{uuid.uuid4().hex[:8]}"
     
     async def scrape_site_with_css(self, url: str, site_name: str, max_items: int = 50) -> List[Dict]:
         """使用CSS选择器策略爬取网站"""
@@ -177,17 +322,11 @@ class Crawl4AIScraper:
         )
         
         # 创建Markdown生成器（带内容过滤）
-        markdown_generator = DefaultMarkdownGenerator(
-            content_filter=PruningContentFilter(
-                threshold=0.48,
-                threshold_type="fixed",
-                min_word_threshold=10
-            )
-        )
+        markdown_generator = DefaultMarkdownGenerator(content_filter=self.content_filter())
         
         # 爬取配置
         crawl_config = CrawlerRunConfig(
-            cache_mode=CacheMode.ENABLED,
+            cache_mode=self.cache_mode,
             extraction_strategy=extraction_strategy,
             markdown_generator=markdown_generator,
             output_formats=['extracted_content', 'markdown'],
@@ -199,36 +338,46 @@ class Crawl4AIScraper:
                 "await new Promise(resolve => setTimeout(resolve, 2000));",
                 "window.scrollTo(0, document.body.scrollHeight);"
             ],
+            page_timeout=self.crawl_config['wait_timeout'],
             # 截图用于调试
-            screenshot=self.debug_mode,
+            screenshot=self.debug_mode or self.crawl_config['enable_screenshots'],
+            capture_network_requests=self.crawl_config['enable_network_capture'],
+            # 每个任务独立的浏览器上下文，共享同一个浏览器进程
+            session_id=self.new_session_id(site_name),
         )
         
-        async with AsyncWebCrawler(config=self.browser_config) as crawler:
-            if self.debug_mode:
-                print(f"🕷️ 开始爬取: {site_name} - {url}")
-            
-            result = await crawler.arun(url=url, config=crawl_config)
-            
-            if result.success and result.extracted_content:
-                try:
-                    extracted_data = json.loads(result.extracted_content)
-                    
-                    # 数据清洗和标准化
-                    cleaned_data = self.clean_and_standardize_data(
-                        extracted_data, site_name, max_items
-                    )
-                    
-                    if self.debug_mode:
-                        print(f"✅ 成功从 {site_name} 提取 {len(cleaned_data)} 个工具")
-                    
-                    return cleaned_data
+        # 列表页未变化：沿用上次的结果，跳过爬取、清洗和后续分析
+        previous, digest = await self.reuse_unchanged(url, site_name, max_items)
+        if previous is not None:
+            return previous
+        
+        if self.debug_mode:
+            print(f"🕷️ 开始爬取: {site_name} - {url}")
+        
+        result = await self.run_isolated(url, crawl_config, site_name)
+        
+        if result.success and result.extracted_content:
+            try:
+                extracted_data = json.loads(result.extracted_content)
                 
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON解析错误 ({site_name}): {e}")
-                    return []
-            else:
-                print(f"❌ 爬取失败 ({site_name}): {result.error_message}")
+                # 数据清洗和标准化
+                cleaned_data = self.clean_and_standardize_data(
+                    extracted_data, site_name, max_items
+                )
+                
+                if self.debug_mode:
+                    print(f"✅ 成功从 {site_name} 提取 {len(cleaned_data)} 个工具")
+                
+                if self.page_hashes:
+                    self.page_hashes.remember(url, digest, cleaned_data)
+                return cleaned_data
+            
+            except json.JSONDecodeError as e:
+                print(f"❌ JSON解析错误 ({site_name}): {e}")
                 return []
+        else:
+            print(f"❌ 爬取失败 ({site_name}): {result.error_message}")
+            return []
     
     async def scrape_site_with_llm(self, url: str, site_name: str, max_items: int = 50) -> List[Dict]:
         """使用LLM策略爬取网站（需要API key）"""
@@ -237,9 +386,14 @@ class Crawl4AIScraper:
             print("⚠️ 未配置OpenAI API Key，跳过LLM提取")
             return []
         
+        # 列表页未变化时不再调用LLM
+        previous, digest = await self.reuse_unchanged(url, site_name, max_items)
+        if previous is not None:
+            return previous
+        
         # 创建LLM提取策略
         llm_strategy = LLMExtractionStrategy(
-            provider="openai/gpt-4o-mini",  # 使用更便宜的模型
+            provider=self.llm_config['provider'],
             api_token=self.config.OPENAI_API_KEY,
             schema=AIToolModel.schema(),
             extraction_type="schema",
@@ -256,54 +410,54 @@ class Crawl4AIScraper:
             最多提取 {max_items} 个工具。
             """,
             # 使用BM25过滤相关内容
-            content_filter=BM25ContentFilter(
-                user_query="AI tools artificial intelligence machine learning",
-                bm25_threshold=1.0
-            )
+            content_filter=self.bm25_filter()
         )
         
         # 爬取配置
         crawl_config = CrawlerRunConfig(
-            cache_mode=CacheMode.ENABLED,
+            cache_mode=self.cache_mode,
             extraction_strategy=llm_strategy,
             output_formats=['extracted_content', 'markdown'],
             wait_for_timeout=3000,
+            page_timeout=self.crawl_config['wait_timeout'],
             js_code=[
                 "window.scrollTo(0, document.body.scrollHeight);",
                 "await new Promise(resolve => setTimeout(resolve, 2000));"
             ],
+            session_id=self.new_session_id(f"llm-{site_name}"),
         )
         
-        async with AsyncWebCrawler(config=self.browser_config) as crawler:
-            if self.debug_mode:
-                print(f"🤖 使用LLM爬取: {site_name} - {url}")
-            
-            result = await crawler.arun(url=url, config=crawl_config)
-            
-            if result.success and result.extracted_content:
-                try:
-                    extracted_data = json.loads(result.extracted_content)
-                    
-                    # 如果是单个对象，转换为列表
-                    if isinstance(extracted_data, dict):
-                        extracted_data = [extracted_data]
-                    
-                    # 数据清洗和标准化
-                    cleaned_data = self.clean_and_standardize_data(
-                        extracted_data, site_name, max_items
-                    )
-                    
-                    if self.debug_mode:
-                        print(f"✅ LLM成功从 {site_name} 提取 {len(cleaned_data)} 个工具")
-                    
-                    return cleaned_data
+        if self.debug_mode:
+            print(f"🤖 使用LLM爬取: {site_name} - {url}")
+        
+        result = await self.run_isolated(url, crawl_config, site_name)
+        
+        if result.success and result.extracted_content:
+            try:
+                extracted_data = json.loads(result.extracted_content)
                 
-                except json.JSONDecodeError as e:
-                    print(f"❌ LLM JSON解析错误 ({site_name}): {e}")
-                    return []
-            else:
-                print(f"❌ LLM爬取失败 ({site_name}): {result.error_message}")
+                # 如果是单个对象，转换为列表
+                if isinstance(extracted_data, dict):
+                    extracted_data = [extracted_data]
+                
+                # 数据清洗和标准化
+                cleaned_data = self.clean_and_standardize_data(
+                    extracted_data, site_name, max_items
+                )
+                
+                if self.debug_mode:
+                    print(f"✅ LLM成功从 {site_name} 提取 {len(cleaned_data)} 个工具")
+                
+                if self.page_hashes:
+                    self.page_hashes.remember(url, digest, cleaned_data)
+                return cleaned_data
+            
+            except json.JSONDecodeError as e:
+                print(f"❌ LLM JSON解析错误 ({site_name}): {e}")
                 return []
+        else:
+            print(f"❌ LLM爬取失败 ({site_name}): {result.error_message}")
+            return []
     
     def clean_and_standardize_data(self, data: List[Dict], source: str, max_items: int) -> List[Dict]:
         """清洗和标准化数据"""
@@ -402,21 +556,26 @@ class Crawl4AIScraper:
         """并发爬取多个站点"""
         all_tools = []
         
-        # 创建任务列表
-        tasks = []
+        # 所有站点共用一个浏览器；若调用方已启动共享浏览器则沿用，否则本次结束时关闭
+        owns_crawler = self.crawler is None
+        await self.start()
+        
+        # 创建任务列表（协程工厂，由调度器在拿到并发槽位后才创建）
+        scrape = self.scrape_site_with_llm if use_llm else self.scrape_site_with_css
+        jobs = []
         for url, config in urls_config.items():
             site_name = config.get('name', 'unknown')
             max_items = config.get('max_items', 50)
-            
-            if use_llm:
-                task = self.scrape_site_with_llm(url, site_name, max_items)
-            else:
-                task = self.scrape_site_with_css(url, site_name, max_items)
-            
-            tasks.append(task)
+            jobs.append((url, lambda url=url, site_name=site_name, max_items=max_items: scrape(url, site_name, max_items)))
+        
+        # 有界并发执行任务
+        try:
+            results = await self.scheduler.run(jobs)
+        finally:
+            if owns_crawler:
+                await self.close()
         
-        # 并发执行任务
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.scheduler.print_report()
         
         # 处理结果
         for i, result in enumerate(results):
@@ -444,69 +603,89 @@ class Crawl4AIScraper:
         
         return unique_tools
     
-    async def deep_crawl_site(self, start_url: str, max_pages: int = 10) -> List[Dict]:
-        """深度爬取网站（使用BFS策略）"""
-        
+    async def deep_crawl_site(self, start_url: str, max_pages: int = None) -> List[Dict]:
+        """深度爬取单个站点（策略、深度、间隔见 DEEP_CRAWL_* 配置）"""
+        return await self.deep_crawl_sites([start_url], max_pages)
+    
+    async def deep_crawl_sites(self, start_urls: List[str], max_pages: int = None) -> List[Dict]:
+        """从列表页出发按得分优先爬取工具详情页；每个起始站点最多 max_pages 个页面，并受时间预算限制，中断后下次从检查点继续"""
+        deep_config = self.config.get_deep_crawl_config()
+        budget = (max_pages or deep_config['max_pages']) * len(start_urls)
+        deadline = time.monotonic() + deep_config['time_budget'] if deep_config['time_budget'] else None
+        frontier = URLFrontier(deep_config['strategy'], deep_config['max_depth'])
+        if frontier.resumed:
+            print(f"♻️ 从上次的检查点继续: 待爬 {frontier.resumed} 个链接, 已访问 {frontier.visited.count} 个详情页")
+        # 起始列表页在 DEEP_CRAWL_RECRAWL_HOURS 内抓取过则不再重复抓取
+        for url in start_urls:
+            frontier.push(url, 0)
+        
+        # 只需要HTML和链接，不做提取和Markdown过滤
         crawl_config = CrawlerRunConfig(
-            cache_mode=CacheMode.ENABLED,
-            output_formats=['markdown', 'links'],
-            # 只爬取AI工具相关页面
-            include_patterns=[
-                r".*/(tool|ai|product|app)/.*",
-                r".*/tools/.*",
-                r".*/ai-tools/.*"
-            ],
-            exclude_patterns=[
-                r".*/(login|register|contact|about|privacy|terms)/.*",
-                r".*/\.(jpg|jpeg|png|gif|pdf|doc|docx)$"
-            ],
-            scope='domain',
-            delay_between_requests=1.0,
-            respect_robots_txt=True,
-            max_retries=3,
+            cache_mode=self.cache_mode,
             wait_for_timeout=2000,
+            page_timeout=self.crawl_config['wait_timeout'],
         )
         
-        async with AsyncWebCrawler(config=self.browser_config) as crawler:
-            print(f"🔄 开始深度爬取: {start_url}")
-            
-            crawl_generator = await crawler.adeep_crawl(
-                start_url=start_url,
-                strategy="bfs",  # 广度优先搜索
-                max_depth=3,
-                max_pages=max_pages,
-                config=crawl_config
-            )
-            
-            all_tools = []
-            page_count = 0
-            
-            async for result in crawl_generator:
-                page_count += 1
+        print(f"🔄 开始深度爬取: {len(start_urls)} 个起始页, 最多 {budget} 个页面 "
+              f"({frontier.strategy}, 深度 {frontier.max_depth}, 待爬 {len(frontier)})")
+        
+        owns_crawler = self.crawler is None
+        await self.start()
+        
+        all_tools = []
+        page_count = 0
+        try:
+            while page_count < budget and len(frontier):
+                if deadline and time.monotonic() >= deadline:
+                    print(f"⏳ 深度爬取时间预算 ({deep_config['time_budget']}s) 已用完，剩余链接留待下次运行")
+                    break
                 
-                if result.success:
-                    print(f"[{page_count:02d}] 深度: {result.depth}, URL: {result.url}")
+                # 每轮取出得分最高的一批，由调度器按全局/每主机上限并发抓取
+                batch = frontier.pop_batch(min(self.scheduler.max_concurrent, budget - page_count))
+                jobs = [(url, lambda url=url: self.fetch_detail_page(url, crawl_config, deep_config['delay']))
+                        for url, _ in batch]
+                results = await self.scheduler.run(jobs)
+                
+                for (url, depth), result in zip(batch, results):
+                    page_count += 1
+                    ok = not isinstance(result, Exception) and result.success
+                    frontier.complete(url, ok)
+                    if not ok:
+                        error = result if isinstance(result, Exception) else result.error_message
+                        print(f"[{page_count:02d}] 失败: {url}, 错误: {error}")
+                        continue
+                    
+                    if frontier.is_detail(url):
+                        source = urlparse(url).netloc.replace('www.', '').split('.')[0]
+                        tool = self.detail_extractor.extract(result.html, url, source)
+                        if tool:
+                            tool['depth'] = depth
+                            all_tools.append(tool)
+                            print(f"[{page_count:02d}] 深度: {depth}, 工具: {tool['name']} ({url})")
+                    elif self.debug_mode:
+                        print(f"[{page_count:02d}] 深度: {depth}, 列表页: {url}")
                     
-                    # 从markdown内容中提取工具信息
-                    # 这里可以使用更复杂的提取逻辑
-                    if result.markdown and 'AI' in result.markdown.fit_markdown:
-                        # 简单的工具信息提取
-                        tool_info = {
-                            'name': f"发现的工具_{page_count}",
-                            'description': result.markdown.fit_markdown[:200] + "...",
-                            'categories': ['AI', 'Tools'],
-                            'link': result.url,
-                            'source': 'deep_crawl',
-                            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'depth': result.depth
-                        }
-                        all_tools.append(tool_info)
+                    if depth < frontier.max_depth:
+                        for link in (result.links or {}).get('internal', []):
+                            frontier.push(link.get('href', ''), depth + 1, link.get('text', ''), base_url=url)
                 
-                else:
-                    print(f"[{page_count:02d}] 失败: {result.url}, 错误: {result.error_message}")
-            
-            print(f"✅ 深度爬取完成，访问了 {page_count} 个页面，发现 {len(all_tools)} 个工具")
-            return all_tools
+                # 每轮结束写检查点，运行被中断时最多丢失一轮
+                frontier.save()
+        finally:
+            frontier.save()
+            if owns_crawler:
+                await self.close()
+        
+        print(f"✅ 深度爬取完成，访问了 {page_count} 个页面，发现 {len(all_tools)} 个工具 "
+              f"(新入队 {frontier.stats['queued']}, 跳过已访问 {frontier.stats['skipped_visited']}, "
+              f"跳过近期已抓取 {frontier.stats['skipped_recent']}, 失败 {frontier.stats['failed']}, 剩余 {len(frontier)})")
+        return self.remove_duplicates(all_tools)
+    
+    async def fetch_detail_page(self, url: str, crawl_config: CrawlerRunConfig, delay: float):
+        """Crawl one page in its own session, then hold the host slot for the politeness delay"""
+        result = await self.run_isolated(url, crawl_config.clone(session_id=self.new_session_id('deep')), 'deep')
+        await asyncio.sleep(delay)
+        return result
 
 
 # 使用示例
@@ -531,17 +710,19 @@ async def main():
     }
     
     try:
-        # 1. 使用CSS选择器策略爬取
-        print("🚀 开始使用CSS选择器策略爬取...")
-        css_results = await scraper.scrape_multiple_sites(urls_config, use_llm=False)
-        
-        # 2. 使用LLM策略爬取（可选）
-        print("\n🤖 开始使用LLM策略爬取...")
-        llm_results = await scraper.scrape_multiple_sites(urls_config, use_llm=True)
-        
-        # 3. 深度爬取示例
-        print("\n🔄 开始深度爬取...")
-        deep_results = await scraper.deep_crawl_site("https://www.toolify.ai/", max_pages=5)
+        # 三个步骤共用一个浏览器
+        async with scraper:
+            # 1. 使用CSS选择器策略爬取
+            print("🚀 开始使用CSS选择器策略爬取...")
+            css_results = await scraper.scrape_multiple_sites(urls_config, use_llm=False)
+            
+            # 2. 使用LLM策略爬取（可选）
+            print("\n🤖 开始使用LLM策略爬取...")
+            llm_results = await scraper.scrape_multiple_sites(urls_config, use_llm=True)
+            
+            # 3. 深度爬取示例
+            print("\n🔄 开始深度爬取...")
+            deep_results = await scraper.deep_crawl_site("https://www.toolify.ai/", max_pages=5)
         
         # 合并结果
         all_results = css_results + llm_results + deep_results
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 import re
 from collections import defaultdict
 from config import Config
+from src.timing import timeline
 
 class DataProcessor:
     """Data processing module for aggregating and deduplicating extracted words"""
@@ -306,23 +307,28 @@ class DataProcessor:
         print(f"Processing {len(words_data)} extracted words...")
         
         # Load existing data and merge
-        existing_words = self.load_existing_data()
-        all_words = existing_words + words_data
+        with timeline.span('processor.load'):
+            existing_words = self.load_existing_data()
+            all_words = existing_words + words_data
         
         # Deduplicate
-        deduplicated_words = self.deduplicate_words(all_words)
+        with timeline.span('processor.dedup'):
+            deduplicated_words = self.deduplicate_words(all_words)
         
         # Filter by criteria
-        filtered_words = self.filter_by_criteria(deduplicated_words)
+        with timeline.span('processor.filter'):
+            filtered_words = self.filter_by_criteria(deduplicated_words)
         
         # Rank words
-        ranked_words = self.rank_words(filtered_words)
-        
-        # Generate summary statistics
-        summary_stats = self.generate_summary_stats(ranked_words)
+        with timeline.span('processor.rank'):
+            ranked_words = self.rank_words(filtered_words)
+            
+            # Generate summary statistics
+            summary_stats = self.generate_summary_stats(ranked_words)
         
         # Save processed data
-        self.save_processed_data(ranked_words, summary_stats)
+        with timeline.span('processor.save'):
+            self.save_processed_data(ranked_words, summary_stats)
         
         return {
             'words': ranked_words,
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Detail Page Extractor for AI Words Mining System
+从单个工具详情页提取名称、描述、分类和官网链接：优先使用内嵌JSON，其次是 Open Graph / meta 标签和正文
+"""
+
+import re
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+from bs4 import BeautifulSoup
+from src.html_parsing import HTML_PARSER
+from src.structured_data import StructuredDataExtractor
+
+# "Tool Name - Site | Tagline" -> "Tool Name"
+TITLE_SEPARATORS = re.compile(r'\s+[-|–—:·]\s+')
+MIN_DESCRIPTION_LENGTH = 40
+
+
+class DetailPageExtractor:
+    """Maps one tool detail page to the scrapers' tool dict format"""
+    
+    def __init__(self):
+        self.structured = StructuredDataExtractor()
+    
+    def extract(self, html, url: str, source: str) -> Optional[Dict]:
+        """The page's tool, or None when no name can be found"""
+        soup = BeautifulSoup(html, HTML_PARSER)
+        heading = self.page_heading(soup)
+        
+        tool = self.from_embedded(soup, url, source, heading)
+        if tool is None:
+            tool = self.from_meta(soup, url, source, heading)
+        if tool is None:
+            return None
+        
+        tool['link'] = tool.get('link') or url
+        tool['detail_url'] = url
+        if not tool['categories']:
+            tool['categories'] = self.page_categories(soup)
+        return tool
+    
+    def page_heading(self, soup) -> Optional[str]:
+        h1 = soup.find('h1')
+        text = h1.get_text(' ', strip=True) if h1 else ''
+        return text if 1 < len(text) < 100 else None
+    
+    def from_embedded(self, soup, url: str, source: str, heading: Optional[str]) -> Optional[Dict]:
+        """The embedded item named like the page heading; detail pages often embed related tools too"""
+        candidates = []
+        for _, payload, refs in self.structured.iter_payloads(soup):
+            for item in self.structured.iter_items(payload, refs):
+                tool = self.structured.to_tool(item, refs, url, source)
+                if tool:
+                    candidates.append(tool)
+        
+        if not candidates:
+            return None
+        if heading:
+            return next((tool for tool in candidates if tool['name'].lower() == heading.lower()), None)
+        return candidates[0] if len(candidates) == 1 else None
+    
+    def meta(self, soup, *names: str) -> Optional[str]:
+        for name in names:
+            tag = soup.find('meta', attrs={'property': name}) or soup.find('meta', attrs={'name': name})
+            content = tag.get('content', '').strip() if tag else ''
+            if content:
+                return content
+        return None
+    
+    def from_meta(self, soup, url: str, source: str, heading: Optional[str]) -> Optional[Dict]:
+        """Name from the heading or page title, description from Open Graph / meta tags or the first paragraph"""
+        title = self.meta(soup, 'og:title', 'twitter:title') or (soup.title.get_text(strip=True) if soup.title else '')
+        name = heading or TITLE_SEPARATORS.split(title)[0].strip()
+        if not name or len(name) < 2:
+            return None
+        
+        description = self.meta(soup, 'og:description', 'description', 'twitter:description')
+        if not description or len(description) < MIN_DESCRIPTION_LENGTH:
+            paragraph = next((p.get_text(' ', strip=True) for p in soup.find_all('p')
+                              if len(p.get_text(strip=True)) >= MIN_DESCRIPTION_LENGTH), None)
+            description = paragraph or description
+        
+        return {
+            'name': name,
+            'description': description or "AI tool description not available",
+            'categories': [],
+            'link': self.website_link(soup, url),
+            'source': source,
+            'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    def website_link(self, soup, url: str) -> Optional[str]:
+        """The tool's own site: an external link labelled like a visit button"""
+        host = urlparse(url).netloc
+        for anchor in soup.find_all('a', href=True):
+            href = urljoin(url, anchor['href'])
+            label = anchor.get_text(' ', strip=True).lower()
+            if urlparse(href).netloc not in ('', host) and re.search(r'visit|website|open|try|get started', label):
+                return href
+        return None
+    
+    def page_categories(self, soup) -> List[str]:
+        """Category and tag links on the page"""
+        categories = []
+        for anchor in soup.find_all('a', href=re.compile(r'/(category|categories|tag|tags|topics)/')):
+            text = anchor.get_text(' ', strip=True)
+            if text and len(text) < 30 and text not in categories:
+                categories.append(text)
+        return categories[:5]
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Chrome WebDriver Pool for AI Words Mining System
+在一次运行中复用Chrome浏览器实例，避免每个站点重复启动浏览器
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, List
+from webdriver_manager.chrome import ChromeDriverManager
+from config import Config
+
+_driver_path_lock = threading.Lock()
+_driver_path = None
+
+
+def get_chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process"""
+    global _driver_path
+    
+    with _driver_path_lock:
+        if _driver_path:
+            return _driver_path
+        
+        driver_path = ChromeDriverManager().install()
+        
+        # Fix the common webdriver_manager path issue
+        if driver_path.endswith('THIRD_PARTY_NOTICES.chromedriver'):
+            driver_dir = os.path.dirname(driver_path)
+            driver_path = os.path.join(driver_dir, 'chromedriver.exe')
+            
+            if not os.path.exists(driver_path):
+                # Try alternative path
+                driver_path = os.path.join(driver_dir, 'chromedriver')
+        
+        _driver_path = driver_path
+        return _driver_path
+
+
+class ChromeDriverPool:
+    """Thread-safe pool that leases a few long-lived Chrome drivers to site scrapers"""
+    
+    def __init__(self, driver_factory: Callable, size: int = None, max_pages: int = None):
+        self.config = Config()
+        self.driver_factory = driver_factory
+        self.size = max(1, size or self.config.DRIVER_POOL_SIZE)
+        self.max_pages = max(1, max_pages or self.config.DRIVER_MAX_PAGES)
+        
+        self._idle: List = []
+        self._page_counts = {}
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        
+        self.stats = {
+            'launched': 0,
+            'leases': 0,
+            'recycled': 0,
+            'discarded': 0
+        }
+    
+    @contextmanager
+    def lease(self):
+        """Lease a driver for one page; it is reset or recycled on return"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+    
+    def acquire(self):
+        """Take an idle driver, launching a new one while under the pool size"""
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    self.stats['leases'] += 1
+                    return driver
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._condition.wait()
+        
+        # Launch outside the lock so other threads can keep returning drivers
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        
+        with self._condition:
+            self._page_counts[id(driver)] = 0
+            self.stats['launched'] += 1
+            self.stats['leases'] += 1
+            launched = self.stats['launched']
+        
+        if self.config.DEBUG_MODE:
+            print(f"🚗 Driver pool launched browser {launched}/{self.size}")
+        
+        return driver
+    
+    def release(self, driver):
+        """Return a driver to the pool, recycling it after max_pages"""
+        with self._condition:
+            pages = self._page_counts.get(id(driver), 0) + 1
+            self._page_counts[id(driver)] = pages
+            retire = self._closed or pages >= self.max_pages
+        
+        discarded = not retire and not self.reset_driver(driver)
+        
+        if retire or discarded:
+            self.quit_driver(driver)
+            with self._condition:
+                # Counters are shared by every scraping thread; only touch them under the pool lock
+                if discarded:
+                    self.stats['discarded'] += 1
+                elif not self._closed and pages >= self.max_pages:
+                    self.stats['recycled'] += 1
+                self._created -= 1
+                self._condition.notify()
+            return
+        
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+    
+    def reset_driver(self, driver) -> bool:
+        """Clear cookies and storage so the next lease starts clean"""
+        try:
+            try:
+                origin = driver.execute_script("return window.location.origin")
+                if origin and origin.startswith('http'):
+                    driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                        'origin': origin,
+                        'storageTypes': 'local_storage,session_storage,indexeddb,websql,cache_storage,service_workers'
+                    })
+            except Exception:
+                # Fall back to clearing what the page itself can reach
+                driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            
+            try:
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            except Exception:
+                driver.delete_all_cookies()
+            
+            driver.get('about:blank')
+            return True
+        
+        except Exception as e:
+            if self.config.DEBUG_MODE:
+                print(f"Driver reset failed, discarding browser: {e}")
+            return False
+    
+    def quit_driver(self, driver):
+        """Quit a driver, ignoring errors from an already dead browser"""
+        with self._condition:
+            self._page_counts.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Quit all idle drivers; leased drivers are quit when returned"""
+        with self._condition:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._created -= len(idle)
+            self._condition.notify_all()
+        
+        for driver in idle:
+            self.quit_driver(driver)
+        
+        if self.config.DEBUG_MODE:
+            with self._condition:
+                stats = dict(self.stats)
+            print(f"🚗 Driver pool closed: {stats}")
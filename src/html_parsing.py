@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+HTML Parsing helpers for AI Words Mining System
+离线解析页面源码，避免逐个元素调用Selenium
+"""
+
+import re
+from typing import Dict, Optional
+from bs4 import BeautifulSoup, NavigableString, Comment, SoupStrainer
+from src.timing import timeline
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Elements that start a new line in rendered text (mirrors Selenium's element.text)
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4',
+    'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'tbody', 'td', 'th', 'thead', 'tr', 'ul'
+}
+
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+# Candidate card containers per site: a tag is kept (with its whole subtree) when its
+# name is listed or any attribute pattern matches. Supersets of the scrapers' selectors.
+CARD_STRAINER_RULES: Dict[str, Dict] = {
+    'toolify.ai': {
+        'tags': {'article'},
+        'attrs': {'class': r'tool|card|item|grid', 'href': r'tool'}
+    },
+    'producthunt.com': {
+        'tags': {'article', 'li'},
+        'attrs': {'class': r'item|card|product', 'data-test': r'product|item'}
+    },
+    'futuretools.io': {
+        'tags': set(),
+        'attrs': {'class': r'tool|grid-item|card', 'data-testid': r'tool-card'}
+    },
+    'explodingtopics.com': {
+        'tags': set(),
+        'attrs': {'class': r'topic|trend', 'data-testid': r'topic-card'}
+    },
+    'betalist.com': {
+        'tags': {'article'},
+        'attrs': {'class': r'startup|product|item'}
+    },
+    'generic': {
+        'tags': {'article'},
+        'attrs': {'class': r'card|item|product|tool|app|service|startup'}
+    }
+}
+
+class CardStrainer(SoupStrainer):
+    """Keeps a tag (and its subtree) when its name or any attribute pattern matches"""
+    
+    def __init__(self, rules: Dict):
+        self.card_tags = rules.get('tags', set())
+        self.card_patterns = {attr: re.compile(pattern, re.I) for attr, pattern in rules.get('attrs', {}).items()}
+        # bs4 < 4.13 calls a callable name with (name, attrs) while parsing
+        super().__init__(self.is_card)
+    
+    def is_card(self, name, attrs=None) -> bool:
+        """True when a prospective tag looks like a card container"""
+        if name in self.card_tags:
+            return True
+        
+        for attr, pattern in self.card_patterns.items():
+            value = (attrs or {}).get(attr)
+            if isinstance(value, (list, tuple)):
+                value = ' '.join(value)
+            if value and pattern.search(value):
+                return True
+        return False
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # bs4 >= 4.13 decides tag creation here, passing name and raw attributes
+        return self.is_card(name, attrs)
+    
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+
+_strainers: Dict[str, CardStrainer] = {}
+
+
+def card_strainer(site_key: str) -> CardStrainer:
+    """Strainer that only builds the candidate card containers for a site"""
+    if site_key not in _strainers:
+        _strainers[site_key] = CardStrainer(CARD_STRAINER_RULES.get(site_key, CARD_STRAINER_RULES['generic']))
+    return _strainers[site_key]
+
+
+def parse_html(html, site_key: Optional[str] = None) -> BeautifulSoup:
+    """Parse page source with lxml, building only card containers when a site is given"""
+    parse_only = card_strainer(site_key) if site_key else None
+    with timeline.span('scrape.parse', site_key or 'full page'):
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+
+def rendered_text(element) -> str:
+    """Approximate the visible text of an element with one line per block"""
+    if element is None:
+        return ""
+    
+    parts = []
+    for node in element.descendants:
+        if isinstance(node, NavigableString):
+            if isinstance(node, Comment) or (node.parent and node.parent.name in SKIP_TAGS):
+                continue
+            parts.append(str(node))
+        elif node.name in BLOCK_TAGS:
+            parts.append('\n')
+    
+    lines = (re.sub(r'\s+', ' ', line).strip() for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP Cache for AI Words Mining System
+持久化HTTP响应缓存：基于ETag/Last-Modified的条件请求，304直接读取磁盘
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from config import Config
+
+# Headers that describe the wire encoding rather than the stored (decoded) body
+HOP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class HTTPCache:
+    """Disk-backed response cache keyed by URL, evicted by age and total size"""
+    
+    def __init__(self, cache_dir: str = None, max_bytes: int = None, max_age: float = None):
+        self.config = Config()
+        self.cache_dir = cache_dir or os.path.join(self.config.CACHE_DIR, 'http')
+        self.max_bytes = max_bytes if max_bytes is not None else self.config.HTTP_CACHE_MAX_MB * 1024 * 1024
+        self.max_age = max_age if max_age is not None else self.config.HTTP_CACHE_MAX_AGE_DAYS * 86400
+        self._lock = threading.Lock()
+        
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stored': 0,
+            'evicted': 0,
+            'bytes_saved': 0
+        }
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.evict()
+    
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached entry for a URL, or None when missing or expired"""
+        meta_path, body_path = self._paths(url)
+        
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - entry.get('stored_at', 0) > self.max_age:
+            self.remove(url)
+            return None
+        
+        entry['body_path'] = body_path
+        return entry
+    
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def read_body(self, entry: Dict) -> Optional[bytes]:
+        """Read the stored body for an entry"""
+        try:
+            with open(entry['body_path'], 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def revalidated(self, url: str, entry: Dict) -> Optional[bytes]:
+        """Record a 304 for a cached entry and return its body"""
+        body = self.read_body(entry)
+        if body is None:
+            return None
+        
+        with self._lock:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += len(body)
+        
+        # Refresh the entry so age-based eviction counts from the last validation
+        meta_path, _ = self._paths(url)
+        entry = {k: v for k, v in entry.items() if k != 'body_path'}
+        entry['stored_at'] = time.time()
+        self._write_json(meta_path, entry)
+        
+        if self.config.DEBUG_MODE:
+            print(f"💾 HTTP cache hit (304): {url}")
+        
+        return body
+    
+    def store(self, url: str, status: int, headers, content: bytes):
+        """Store a full 200 response that carries a validator"""
+        with self._lock:
+            self.stats['misses'] += 1
+        
+        if status != 200:
+            return
+        
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        cache_control = (headers.get('Cache-Control') or '').lower()
+        if not (etag or last_modified) or 'no-store' in cache_control:
+            return
+        
+        meta_path, body_path = self._paths(url)
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in HOP_HEADERS},
+            'size': len(content),
+            'stored_at': time.time()
+        }
+        
+        try:
+            with open(body_path, 'wb') as f:
+                f.write(content)
+            self._write_json(meta_path, entry)
+        except OSError as e:
+            print(f"Warning: could not write HTTP cache entry for {url}: {e}")
+            return
+        
+        with self._lock:
+            self.stats['stored'] += 1
+    
+    def _write_json(self, path: str, data: Dict):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    
+    def remove(self, url: str):
+        """Delete a cached entry"""
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def evict(self):
+        """Drop expired entries, then the oldest ones until under the size limit"""
+        entries = []
+        now = time.time()
+        
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, filename), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            
+            if now - entry.get('stored_at', 0) > self.max_age:
+                self.remove(entry.get('url', ''))
+                self.stats['evicted'] += 1
+            else:
+                entries.append(entry)
+        
+        total = sum(entry.get('size', 0) for entry in entries)
+        for entry in sorted(entries, key=lambda e: e.get('stored_at', 0)):
+            if total <= self.max_bytes:
+                break
+            self.remove(entry['url'])
+            total -= entry.get('size', 0)
+            self.stats['evicted'] += 1
+
+
+class CachingAdapter(HTTPAdapter):
+    """requests adapter that revalidates GETs against an HTTPCache"""
+    
+    def __init__(self, cache: HTTPCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+    
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+        
+        entry = self.cache.get(request.url)
+        request.headers.update(self.cache.conditional_headers(entry))
+        
+        response = super().send(request, **kwargs)
+        
+        if response.status_code == 304 and entry:
+            body = self.cache.revalidated(request.url, entry)
+            if body is not None:
+                return self.build_cached_response(request, entry, body)
+        
+        self.cache.store(request.url, response.status_code, response.headers, response.content)
+        return response
+    
+    def build_cached_response(self, request, entry: Dict, body: bytes) -> requests.Response:
+        """Turn a cached entry into a 200 response for the caller"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        response._content = body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def mount_http_cache(session: requests.Session, cache: Optional[HTTPCache]):
+    """Route a session's http(s) traffic through the cache"""
+    if cache is None:
+        return
+    adapter = CachingAdapter(cache)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+In-browser JavaScript Card Extractor for AI Words Mining System
+在浏览器内一次性提取卡片数据，只把精简的JSON传回Python
+"""
+
+import json
+import time
+from typing import List, Dict, Optional
+from config import Config
+
+# Site adapters: card selectors in priority order plus per-field selectors
+SITE_ADAPTERS: Dict[str, Dict] = {
+    'toolify.ai': {
+        'source': 'toolify.ai',
+        'card_selectors': ['.tool-item'],
+        'min_cards': 1,
+        'fields': {
+            'name': ['h2', 'h3', '.tool-name', 'a[href^="/tool/"]'],
+            'description': ['p', '.tool-desc', '.description'],
+            'link': ['a[href^="/tool/"]', 'a[href]'],
+            'categories': ['.tag', '.category', '.badge']
+        },
+        'default_categories': ['AI Tool']
+    },
+    'producthunt.com': {
+        'source': 'producthunt.com',
+        'card_selectors': [
+            '[data-test*="product"]',  # 调试发现的最佳选择器
+            '[data-test*="item"]',
+            'div[class*="styles_item"]',
+            'div[class*="styles_product"]',
+            'div[class*="item"]',
+            'div[class*="card"]',
+            'article',
+            'li[class*="item"]'
+        ],
+        'min_cards': 10,
+        'fields': {
+            'name': ['h3', 'h4', 'h2', '[data-test*="name"]', '[data-test*="title"]', 'strong', 'a'],
+            'description': ['.tagline', '[data-test*="description"]', 'p', '.description'],
+            'link': ['a[href*="/posts/"]', 'a[href*="/products/"]', 'a[href]'],
+            'categories': ['a[href*="/topics/"]']
+        },
+        'default_categories': ['Product Hunt']
+    },
+    'futuretools.io': {
+        'source': 'futuretools.io',
+        'card_selectors': [
+            '.tool-card', '.tool-item', '.tool',
+            '[data-testid="tool-card"]',
+            '.grid-item', '.card'
+        ],
+        'min_cards': 6,
+        'fields': {
+            'name': ['h3', 'h4', '.title', '.name'],
+            'description': ['p', '.description', '.desc'],
+            'link': ['a[href]'],
+            'categories': ['.tag', '.category']
+        },
+        'default_categories': ['Future Tools']
+    },
+    'explodingtopics.com': {
+        'source': 'explodingtopics.com',
+        'card_selectors': [
+            '.topic-card', '.topic-item', '.topic',
+            '[data-testid="topic-card"]',
+            '.trend-item', '.trend-card'
+        ],
+        'min_cards': 4,
+        'fields': {
+            'name': ['h3', 'h4', '.title', '.topic-name'],
+            'description': ['p', '.description', '.trend-info'],
+            'link': ['a[href]'],
+            'categories': ['.category', '.tag']
+        },
+        'default_categories': ['Exploding Topics', 'Trend']
+    },
+    'generic': {
+        'source': 'generic',
+        'card_selectors': [
+            'article', '.card', '.item', '.product',
+            '.tool', '.app', '.service', '.startup'
+        ],
+        'min_cards': 4,
+        'fields': {
+            'name': ['h1', 'h2', 'h3', 'h4', '.title', '.name'],
+            'description': ['p', '.description', '.desc'],
+            'link': ['a[href]'],
+            'categories': ['.tag', '.category']
+        },
+        'default_categories': ['Generic']
+    }
+}
+
+EXTRACT_CARDS_JS = """
+const [cardSelectors, fields, maxItems, minCards, tail] = arguments;
+const textOf = (el) => el ? (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+const query = (root, selector) => { try { return Array.from(root.querySelectorAll(selector)); } catch (e) { return []; } };
+const firstText = (card, selectors, minLen, maxLen) => {
+    for (const selector of selectors) {
+        for (const el of query(card, selector)) {
+            const text = textOf(el);
+            if (text.length > minLen && text.length < maxLen) return text;
+        }
+    }
+    return '';
+};
+
+let cards = [];
+for (const selector of cardSelectors) {
+    const found = query(document, selector);
+    if (found.length > cards.length) cards = found;
+    if (found.length >= minCards) break;
+}
+
+const items = [];
+for (const card of (tail ? cards.slice(-tail) : cards.slice(0, maxItems))) {
+    const name = firstText(card, fields.name, 2, 200);
+    if (!name) continue;
+    let link = '';
+    for (const selector of fields.link) {
+        const el = query(card, selector)[0] || (card.matches && card.matches(selector) ? card : null);
+        if (el && el.href) { link = el.href; break; }
+    }
+    const categories = [];
+    for (const selector of fields.categories) {
+        for (const el of query(card, selector)) {
+            const text = textOf(el);
+            if (text && text.length < 30 && !categories.includes(text)) categories.push(text);
+        }
+    }
+    items.push({
+        name: name,
+        description: firstText(card, fields.description, 10, 500).replace(name, '').trim(),
+        link: link,
+        categories: categories.slice(0, 5)
+    });
+}
+return JSON.stringify(items);
+"""
+
+
+class JSCardExtractor:
+    """Runs one execute_script per page and maps the compact JSON to tool dicts"""
+    
+    def __init__(self):
+        self.config = Config()
+    
+    def get_adapter(self, site_key: str) -> Dict:
+        """Return the adapter for a site, falling back to the generic one"""
+        return SITE_ADAPTERS.get(site_key, SITE_ADAPTERS['generic'])
+    
+    def extract(self, driver, site_key: str, max_items: int) -> List[Dict]:
+        """Extract up to max_items cards from the current page in a single round trip"""
+        adapter = self.get_adapter(site_key)
+        
+        try:
+            payload = driver.execute_script(
+                EXTRACT_CARDS_JS,
+                adapter['card_selectors'],
+                adapter['fields'],
+                max_items,
+                adapter.get('min_cards', 1)
+            )
+            items = json.loads(payload or '[]')
+        except Exception as e:
+            print(f"JS card extraction failed for {site_key}: {e}")
+            return []
+        
+        if self.config.DEBUG_MODE:
+            print(f"JS extractor returned {len(items)} cards ({len(payload or '')} bytes) for {site_key}")
+        
+        return [tool for tool in (self.to_tool(item, adapter) for item in items) if tool]
+    
+    def tail_cards(self, driver, site_key: str, count: int) -> List[Dict]:
+        """Return the raw {name, link} of the last `count` cards currently on the page"""
+        adapter = self.get_adapter(site_key)
+        
+        try:
+            payload = driver.execute_script(
+                EXTRACT_CARDS_JS,
+                adapter['card_selectors'],
+                adapter['fields'],
+                count,
+                adapter.get('min_cards', 1),
+                count
+            )
+            return json.loads(payload or '[]')
+        except Exception:
+            return []
+    
+    def to_tool(self, item: Dict, adapter: Dict) -> Optional[Dict]:
+        """Map one extracted card to the scrapers' tool dict format"""
+        name = (item.get('name') or '').replace('—', '-').replace('–', '-').strip()
+        if len(name) < 3:
+            return None
+        
+        categories = list(adapter.get('default_categories', []))
+        for category in item.get('categories', []):
+            if category not in categories:
+                categories.append(category)
+        
+        return {
+            'name': name,
+            'description': item.get('description') or "AI tool description not available",
+            'categories': categories[:5],
+            'link': item.get('link', ''),
+            'source': adapter['source'],
+            'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
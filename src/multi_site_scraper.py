@@ -7,26 +7,79 @@ Multi-Site Scraper for AI Words Mining System
 import requests
 import time
 import re
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import queue
+from typing import List, Dict, Optional, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from contextlib import contextmanager
 from config import Config
+from src.driver_pool import ChromeDriverPool, get_chromedriver_path
+from src.page_readiness import PageReadiness
+from src.html_parsing import parse_html, rendered_text
+from src.js_extractor import JSCardExtractor, SITE_ADAPTERS
+from src.async_http import AsyncHTTPEngine
+from src.http_cache import HTTPCache, mount_http_cache
+from src.selector_memory import SelectorMemory
+from src.structured_data import StructuredDataExtractor
+from src.resource_blocking import ResourceBlocker
+from src.seen_index import SeenToolsIndex
+from src.site_health import SiteHealthLedger
+from src.retry_policy import retry_policy
+from src.timing import timeline
+from src.page_artifacts import PageArtifactStore
+from src.page_hashes import PageHashIndex
 import json
 
 class MultiSiteScraper:
     """Multi-site scraper for AI tools and products"""
     
-    def __init__(self):
+    def __init__(self, driver_pool: Optional[ChromeDriverPool] = None, http_cache: Optional[HTTPCache] = None):
         self.config = Config()
         self.session = requests.Session()
         self.setup_session()
         
+        # Persistent ETag/Last-Modified cache shared by the session and the async engine
+        if http_cache is None and self.config.ENABLE_HTTP_CACHE:
+            http_cache = HTTPCache()
+        self.http_cache = http_cache
+        mount_http_cache(self.session, self.http_cache)
+        
+        # Share one pool of browsers across all Selenium site scrapers in a run
+        self.owns_driver_pool = driver_pool is None and self.config.ENABLE_DRIVER_POOL
+        if self.owns_driver_pool:
+            driver_pool = ChromeDriverPool(self.setup_driver)
+        self.driver_pool = driver_pool
+        
+        # Condition-based waits instead of fixed sleeps; per-URL wait report
+        self.readiness = PageReadiness()
+        self.readiness_stats = {}
+        self.js_extractor = JSCardExtractor()
+        self.selector_memory = SelectorMemory()
+        self.structured_extractor = StructuredDataExtractor()
+        
+        # Block images/fonts/media/trackers in Selenium and record what each page cost
+        self.resource_blocker = ResourceBlocker()
+        self.page_load_seconds = {}
+        
+        # Fingerprints of tools collected in earlier runs (incremental scraping)
+        self.seen_index = SeenToolsIndex()
+        
+        # Per-domain health history; sites that keep failing are skipped or probed cheaply
+        self.site_health = SiteHealthLedger()
+        
+        # Requests-based pages are prefetched together by the async engine
+        self.http_engine = AsyncHTTPEngine(headers=self.session.headers, http_cache=self.http_cache)
+        self.prefetched_pages = {}
+        
+        # Raw and rendered HTML from this run, so the single-site fallback can re-parse instead of re-fetching
+        self.page_artifacts = PageArtifactStore()
+        
+        # Content hash per URL; an unchanged page reuses last run's tools without extraction or analysis
+        self.page_hashes = PageHashIndex()
+        
     def setup_session(self):
         """Setup HTTP session with proper headers"""
         self.session.headers.update({
@@ -52,24 +105,14 @@ class MultiSiteScraper:
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-plugins')
-        chrome_options.add_argument('--disable-images')
+        self.resource_blocker.apply_options(chrome_options)
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         try:
-            # Get the driver path and fix it if needed
-            driver_path = ChromeDriverManager().install()
-            
-            # Fix the common webdriver_manager path issue
-            if driver_path.endswith('THIRD_PARTY_NOTICES.chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                driver_path = os.path.join(driver_dir, 'chromedriver.exe')
-                
-                if not os.path.exists(driver_path):
-                    # Try alternative path
-                    driver_path = os.path.join(driver_dir, 'chromedriver')
+            # Resolved once per process instead of on every browser launch
+            driver_path = get_chromedriver_path()
             
             if self.config.DEBUG_MODE:
                 print(f"Using Chrome driver: {driver_path}")
@@ -85,34 +128,87 @@ class MultiSiteScraper:
             print(f"Chrome driver setup failed: {e}")
             raise
     
+    @contextmanager
+    def driver_session(self):
+        """Lease a driver from the shared pool, or launch a one-off driver"""
+        start_time = time.perf_counter()
+        if self.driver_pool:
+            with self.driver_pool.lease() as driver:
+                timeline.record('scrape.driver_start', time.perf_counter() - start_time, start=start_time)
+                yield driver
+            return
+        
+        driver = self.setup_driver()
+        timeline.record('scrape.driver_start', time.perf_counter() - start_time, start=start_time)
+        try:
+            yield driver
+        finally:
+            driver.quit()
+    
+    def load_page(self, driver, url: str):
+        """Apply the site's resource blocking, then navigate"""
+        self.resource_blocker.configure(driver, url)
+        start_time = time.time()
+        retry_policy.call('selenium', lambda: driver.get(url))
+        self.page_load_seconds[url] = time.time() - start_time
+        timeline.record('scrape.page_load', self.page_load_seconds[url], urlparse(url).netloc)
+    
+    def wait_for_page(self, driver, url: str, selectors: List[str], max_items: int, site_key: str = None) -> Dict:
+        """Wait for a site's cards to render and record how long it actually took"""
+        should_stop = self.seen_stop_check(site_key) if site_key else None
+        readiness = self.readiness.wait_until_ready(driver, selectors, max_items, should_stop)
+        self.readiness_stats[url] = readiness
+        timeline.record('scrape.scroll', readiness['waited'], urlparse(url).netloc)
+        self.resource_blocker.record(driver, url, self.page_load_seconds.get(url, 0))
+        
+        print(f"⏱️ {urlparse(url).netloc} ready in {readiness['waited']}s "
+              f"({readiness['cards']} cards, {readiness['scroll_rounds']} scrolls"
+              f"{', stopped at already-seen tools' if readiness['stopped_early'] else ''})")
+        
+        return readiness
+    
+    def seen_stop_check(self, site_key: str):
+        """Stop scrolling once the last loaded cards were all collected in earlier runs"""
+        source = SITE_ADAPTERS.get(site_key, SITE_ADAPTERS['generic'])['source']
+        return self.seen_index.scroll_stop_check(
+            source, lambda driver, count: self.js_extractor.tail_cards(driver, site_key, count)
+        )
+    
+    def select_cards(self, soup, url: str, selectors: List[str], site_key: str):
+        """Find card elements, starting from the selector that won on this site last run"""
+        min_cards = SITE_ADAPTERS[site_key]['min_cards']
+        elements, selector = self.selector_memory.probe(soup, urlparse(url).netloc, selectors, min_cards)
+        
+        if self.config.DEBUG_MODE:
+            print(f"Found {len(elements)} elements with selector: {selector}")
+        
+        return elements, selector
+    
+    def page_source(self, driver, url: str) -> str:
+        """Read the rendered DOM once and keep it as a page artifact"""
+        html = driver.page_source
+        self.page_artifacts.put(url, html, 'selenium', elapsed=self.page_load_seconds.get(url))
+        return html
+    
+    def extract_in_browser(self, driver, site_key: str, max_items: int) -> List[Dict]:
+        """Extract cards with one execute_script when the JS extraction mode is on"""
+        if self.config.SELENIUM_EXTRACTION_MODE != 'js':
+            return []
+        
+        with timeline.span('scrape.extract', site_key):
+            return self.js_extractor.extract(driver, site_key, max_items)
+    
+    def close(self):
+        """Release browsers owned by this scraper"""
+        if self.owns_driver_pool and self.driver_pool:
+            self.driver_pool.close()
+    
     def scrape_all_sites(self) -> List[Dict]:
         """Scrape all configured sites and return combined results"""
+        # Combine in TARGET_URLS order so deduplication and truncation stay deterministic
         all_tools = []
-        
-        for url in self.config.TARGET_URLS:
-            try:
-                site_domain = urlparse(url).netloc
-                site_config = self.config.get_site_config(site_domain)
-                
-                if not site_config.get('enabled', True):
-                    continue
-                
-                print(f"🕷️ Scraping {site_domain}...")
-                
-                tools = self.scrape_site(url, site_config)
-                
-                if tools:
-                    print(f"✅ Found {len(tools)} items from {site_domain}")
-                    all_tools.extend(tools)
-                else:
-                    print(f"⚠️ No items found from {site_domain}")
-                
-                # Add delay between sites
-                time.sleep(site_config.get('delay', 2))
-                
-            except Exception as e:
-                print(f"❌ Error scraping {url}: {e}")
-                continue
+        for _, tools in self.iter_site_results_in_order():
+            all_tools.extend(tools)
         
         # Remove duplicates based on name
         unique_tools = self.remove_duplicates(all_tools)
@@ -121,7 +217,255 @@ class MultiSiteScraper:
         
         return unique_tools[:self.config.MAX_TOTAL_ITEMS]
     
+    def iter_site_results(self) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """Yield (job, tools) for each site as soon as it finishes"""
+        site_jobs = []
+        for job in self.get_site_jobs():
+            if self.site_health.should_skip(job['domain']):
+                health = self.site_health.summary(job['domain'])
+                print(f"⛔ Skipping {job['domain']}: circuit breaker open until {health['retry_after']} "
+                      f"({health['last_error']})")
+                self.site_health.note(job['domain'], 'skipped')
+                yield job, []
+            else:
+                site_jobs.append(job)
+        
+        # Fetch plain-HTTP pages up front over one HTTP/2 connection pool; with the
+        # embedded-JSON fast path on, browser sites are fetched too so they can skip Chrome
+        self.prefetch_pages([job['url'] for job in site_jobs
+                             if self.config.ENABLE_STRUCTURED_DATA or not job['config'].get('use_selenium', True)])
+        
+        if self.config.ENABLE_CONCURRENT_SCRAPING and len(site_jobs) > 1:
+            yield from self.iter_sites_concurrently(site_jobs)
+        else:
+            yield from self.iter_sites_sequentially(site_jobs)
+    
+    def iter_site_results_in_order(self) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """Yield (job, tools) in TARGET_URLS order, each as soon as it and every earlier site have finished"""
+        order = [job['index'] for job in self.get_site_jobs()]
+        finished = {}
+        
+        for job, tools in self.iter_site_results():
+            finished[job['index']] = (job, tools)
+            while order and order[0] in finished:
+                yield finished.pop(order.pop(0))
+        
+        for index in sorted(finished):
+            yield finished[index]
+    
+    def iter_tools(self) -> Iterator[Dict]:
+        """Yield deduplicated tools site by site in TARGET_URLS order, up to MAX_TOTAL_ITEMS"""
+        seen_names = set()
+        yielded = 0
+        
+        # Same order as scrape_all_sites, so the same duplicate survives and the same tools are cut
+        for _, tools in self.iter_site_results_in_order():
+            for tool in tools:
+                name = tool.get('name', '').lower().strip()
+                if not name or name in seen_names:
+                    continue
+                seen_names.add(name)
+                yield tool
+                
+                yielded += 1
+                if yielded >= self.config.MAX_TOTAL_ITEMS:
+                    return
+    
+    def prefetch_pages(self, urls: List[str]):
+        """Fetch requests-based pages concurrently; scrapers pick them up via fetch_page"""
+        if not self.config.ENABLE_ASYNC_HTTP or not urls:
+            return
+        
+        start_time = time.time()
+        try:
+            self.prefetched_pages.update(self.http_engine.fetch_many(urls))
+        except Exception as e:
+            print(f"⚠️ Async prefetch failed, falling back to per-site requests: {e}")
+            return
+        
+        print(f"🌐 Prefetched {len(urls)} pages in {time.time() - start_time:.2f}s "
+              f"(HTTP/2: {self.http_engine.http2})")
+    
+    def fetch_page(self, url: str, timeout: float = 30, retries: Optional[int] = None):
+        """Return a prefetched response, or fetch the page now"""
+        response = self.prefetched_pages.get(url)
+        
+        if response is None:
+            if self.config.ENABLE_ASYNC_HTTP:
+                response = self.http_engine.fetch(url, timeout=timeout, retries=retries)
+            else:
+                response = retry_policy.call('http', lambda: self.session.get(url, timeout=timeout), retries)
+        
+        if isinstance(response, Exception):
+            raise response
+        
+        response.raise_for_status()
+        self.page_artifacts.put(url, response.content, 'http', response)
+        return response
+    
+    def get_site_jobs(self) -> List[Dict]:
+        """Build the list of enabled scrape jobs, keeping their TARGET_URLS position"""
+        site_jobs = []
+        
+        for index, url in enumerate(self.config.TARGET_URLS):
+            site_domain = urlparse(url).netloc
+            site_config = self.config.get_site_config(site_domain)
+            
+            if not site_config.get('enabled', True):
+                continue
+            
+            site_jobs.append({
+                'index': index,
+                'url': url,
+                'domain': site_domain,
+                'config': site_config
+            })
+        
+        return site_jobs
+    
+    def scrape_site_job(self, job: Dict) -> List[Dict]:
+        """Scrape a single job, reporting progress and recording errors in the site health ledger"""
+        site_domain = job['domain']
+        start_time = time.time()
+        
+        try:
+            if self.site_health.needs_probe(site_domain):
+                probe_error = self.probe_site(job)
+                if probe_error:
+                    print(f"⛔ {site_domain} probe failed, circuit breaker stays open: {probe_error}")
+                    self.site_health.record_probe_failure(site_domain, probe_error)
+                    return []
+                print(f"🔌 {site_domain} probe passed, trying a full scrape")
+                self.site_health.start_trial(site_domain)
+            
+            print(f"🕷️ Scraping {site_domain}...")
+            
+            with timeline.span('scrape.site', site_domain):
+                tools = self.seen_index.mark(self.scrape_site(job['url'], job['config']) or [])
+            
+            if tools and all(tool.get('unchanged_page') for tool in tools):
+                # Reused tools say nothing about whether the scraper still works, so the breaker is left as is
+                self.site_health.note(site_domain, 'unchanged')
+                return tools
+            
+            if tools:
+                new_count = sum(1 for tool in tools if tool.get('is_new', True))
+                print(f"✅ Found {len(tools)} items from {site_domain} ({new_count} new)")
+            else:
+                print(f"⚠️ No items found from {site_domain}")
+            
+            self.site_health.record(site_domain, len(tools), time.time() - start_time)
+            return tools or []
+        
+        except Exception as e:
+            print(f"❌ Error scraping {job['url']}: {e}")
+            if self.config.DEBUG_MODE:
+                import traceback
+                traceback.print_exc()
+            self.site_health.record(site_domain, 0, time.time() - start_time, str(e))
+            return []
+        
+        finally:
+            self.prefetched_pages.pop(job['url'], None)
+    
+    def probe_site(self, job: Dict) -> Optional[str]:
+        """One short plain HTTP request; returns an error message, or None if a full scrape is worth trying"""
+        url = job['url']
+        try:
+            # No retries: the probe is meant to be a single cheap request
+            response = self.fetch_page(url, timeout=self.config.BREAKER_PROBE_TIMEOUT, retries=0)
+        except Exception as e:
+            return str(e)
+        
+        if job['config'].get('use_selenium', True):
+            # Cards render in the browser, so a reachable page is all a plain fetch can confirm
+            return None
+        
+        site_key = self.site_key(url)
+        selectors = SITE_ADAPTERS.get(site_key, SITE_ADAPTERS['generic'])['card_selectors']
+        soup = parse_html(response.content, site_key)
+        if any(soup.select(selector) for selector in selectors):
+            return None
+        return "no tool cards in page"
+    
+    def iter_sites_sequentially(self, site_jobs: List[Dict]) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """Scrape sites one after another, sleeping after each site"""
+        for i, job in enumerate(site_jobs):
+            if i > 0:
+                # Add delay between sites
+                time.sleep(site_jobs[i - 1]['config'].get('delay', 2))
+            
+            yield job, self.scrape_site_job(job)
+    
+    def iter_sites_concurrently(self, site_jobs: List[Dict]) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """Scrape different hosts in parallel, yielding each site as it completes"""
+        # Jobs for the same host share one worker so the site delay only spaces out that host
+        host_jobs = {}
+        for job in site_jobs:
+            host_jobs.setdefault(job['domain'], []).append(job)
+        
+        max_workers = max(1, min(self.config.MAX_SCRAPE_WORKERS, len(host_jobs)))
+        print(f"⚡ Concurrent scraping: {len(host_jobs)} hosts with {max_workers} workers")
+        
+        finished = queue.Queue()
+        
+        def scrape_host(jobs: List[Dict]):
+            for i, job in enumerate(jobs):
+                tools = []
+                try:
+                    if i > 0:
+                        # Only space out requests to the same host
+                        time.sleep(job['config'].get('delay', 2))
+                    tools = self.scrape_site_job(job)
+                except Exception as e:
+                    print(f"❌ Concurrent scrape worker failed: {e}")
+                finally:
+                    finished.put((job, tools))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for jobs in host_jobs.values():
+                executor.submit(scrape_host, jobs)
+            
+            for _ in range(len(site_jobs)):
+                yield finished.get()
+    
     def scrape_site(self, url: str, site_config: dict) -> List[Dict]:
+        """Scrape a specific site, or reuse last run's tools if its listing has not changed"""
+        browser_site = site_config.get('use_selenium', True)
+        digest = None if browser_site else self.page_digest(url)
+        
+        # Embedded listing JSON needs no browser and no DOM heuristics
+        structured = self.scrape_structured(url, site_config)
+        if browser_site and self.page_hashes.enabled:
+            # The plain response of a browser site is its static shell; only the embedded listing shows a change
+            digest = self.page_hashes.digest_tools(structured)
+        
+        previous = self.page_hashes.unchanged(url, digest)
+        if previous is not None:
+            print(f"♻️ {urlparse(url).netloc} unchanged since last run, reusing {len(previous)} tools")
+            return previous
+        
+        tools = structured or self.extract_site(url, site_config)
+        self.page_hashes.remember(url, digest, tools)
+        return tools
+    
+    def page_digest(self, url: str) -> Optional[str]:
+        """Content hash of a server-rendered page's plain HTTP response; None if it cannot be fetched"""
+        if not self.page_hashes.enabled:
+            return None
+        
+        try:
+            response = self.fetch_page(url, retries=0)
+        except Exception as e:
+            if self.config.DEBUG_MODE:
+                print(f"No page hash for {urlparse(url).netloc}: {e}")
+            return None
+        
+        # Keep the response so the structured-data path does not fetch it again
+        self.prefetched_pages.setdefault(url, response)
+        return self.page_hashes.digest_html(response.content)
+    
+    def extract_site(self, url: str, site_config: dict) -> List[Dict]:
         """Scrape a specific site based on its configuration"""
         site_domain = urlparse(url).netloc
         
@@ -139,27 +483,51 @@ class MultiSiteScraper:
         else:
             return self.scrape_generic(url, site_config)
     
+    def site_key(self, url: str) -> str:
+        """Map a URL to its site key (adapters, strainers, tool source)"""
+        site_domain = urlparse(url).netloc
+        return next((key for key in ('toolify.ai', 'producthunt.com', 'futuretools.io', 'betalist.com', 'explodingtopics.com')
+                     if key in site_domain), 'generic')
+    
+    def scrape_structured(self, url: str, site_config: dict) -> List[Dict]:
+        """Extract tools from __NEXT_DATA__ / JSON-LD / Apollo state in the plain HTTP response"""
+        if not self.config.ENABLE_STRUCTURED_DATA:
+            return []
+        
+        site_domain = urlparse(url).netloc
+        source = self.site_key(url)
+        
+        try:
+            response = self.fetch_page(url)
+            with timeline.span('scrape.structured', site_domain):
+                return self.structured_extractor.extract(response.content, url, source, site_config.get('max_items', 20))
+        except Exception as e:
+            if self.config.DEBUG_MODE:
+                print(f"No embedded data for {site_domain}, using scraper: {e}")
+            return []
+    
     def scrape_toolify(self, url: str, site_config: dict) -> List[Dict]:
         """Scrape Toolify.ai"""
         if not site_config.get('use_selenium', True):
             return self.scrape_toolify_requests(url, site_config)
         
-        driver = None
         tools = []
         
-        try:
-            driver = self.setup_driver()
-            driver.get(url)
-            time.sleep(3)
+        max_items = site_config.get('max_items', 50)
+        
+        with self.driver_session() as driver:
+            self.load_page(driver, url)
             
-            # Scroll to load more content
-            for i in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            # Wait for tool cards and scroll until no more load
+            self.wait_for_page(driver, url, SITE_ADAPTERS['toolify.ai']['card_selectors'], max_items, 'toolify.ai')
+            
+            js_tools = self.extract_in_browser(driver, 'toolify.ai', max_items)
+            if js_tools:
+                return js_tools
             
             # Get page source and parse with BeautifulSoup
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            html = self.page_source(driver, url)
+            soup = parse_html(html, 'toolify.ai')
             
             # Find tool elements using BeautifulSoup
             elements = soup.find_all(class_='tool-item')
@@ -167,7 +535,6 @@ class MultiSiteScraper:
             if self.config.DEBUG_MODE:
                 print(f"Found {len(elements)} tool items on Toolify")
             
-            max_items = site_config.get('max_items', 50)
             for element in elements[:max_items]:
                 try:
                     tool = self.extract_toolify_data(element)
@@ -177,35 +544,28 @@ class MultiSiteScraper:
                     if self.config.DEBUG_MODE:
                         print(f"Error extracting tool: {e}")
                     continue
-            
-        except Exception as e:
-            print(f"Error scraping Toolify: {e}")
-        finally:
-            if driver:
-                driver.quit()
         
         return tools
     
     def scrape_producthunt(self, url: str, site_config: dict) -> List[Dict]:
         """Scrape Product Hunt"""
-        driver = None
         tools = []
         
-        try:
-            driver = self.setup_driver()
-            
+        # Find product elements using the correct selectors from debugging
+        selectors = SITE_ADAPTERS['producthunt.com']['card_selectors']
+        max_items = site_config.get('max_items', 25)
+        
+        with self.driver_session() as driver:
             if self.config.DEBUG_MODE:
                 print(f"Loading Product Hunt page: {url}")
                 
-            driver.get(url)
-            time.sleep(5)  # 增加等待时间
+            self.load_page(driver, url)
             
             # Accept cookies if present
             try:
                 cookie_button = driver.find_element(By.CSS_SELECTOR, '[data-test="cookie-banner-accept"]')
                 if cookie_button:
                     cookie_button.click()
-                    time.sleep(1)
             except:
                 pass
             
@@ -213,126 +573,85 @@ class MultiSiteScraper:
             if self.config.DEBUG_MODE:
                 print(f"Page title: {driver.title}")
             
-            # Scroll to load more content
-            for i in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            # Find product elements using the correct selector from debugging
-            selectors = [
-                '[data-test*="product"]',  # 调试发现的最佳选择器
-                '[data-test*="item"]',
-                'div[class*="styles_item"]',
-                'div[class*="styles_product"]',
-                'div[class*="item"]',
-                'div[class*="card"]',
-                'article',
-                'li[class*="item"]'
-            ]
+            # Wait for product cards and scroll until the count stops growing
+            self.wait_for_page(driver, url, self.selector_memory.ordered(urlparse(url).netloc, selectors), max_items, 'producthunt.com')
             
-            elements = []
-            best_selector = None
+            # Pull compact card JSON in-browser when enabled
+            js_tools = self.extract_in_browser(driver, 'producthunt.com', max_items)
+            if js_tools:
+                return js_tools
             
-            for selector in selectors:
+            # Otherwise grab the rendered page once and extract offline
+            html = self.page_source(driver, url)
+        
+        soup = parse_html(html, 'producthunt.com')
+        elements, best_selector = self.select_cards(soup, url, selectors, 'producthunt.com')
+        
+        if not elements:
+            if self.config.DEBUG_MODE:
+                print("No product elements found, trying fallback selectors...")
+            # 尝试备用选择器 (on the full tree, the strainer dropped plain containers)
+            soup = parse_html(html)
+            fallback_selectors = ['div', 'li', 'article', 'section']
+            for selector in fallback_selectors:
                 try:
-                    found_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if found_elements and len(found_elements) > len(elements):
-                        elements = found_elements
-                        best_selector = selector
-                        if self.config.DEBUG_MODE:
-                            print(f"Found {len(elements)} elements with selector: {selector}")
-                        if len(elements) >= 10:  # 找到足够的元素就停止
-                            break
+                    elements = soup.select(selector)
+                    if len(elements) > 20:
+                        elements = elements[:50]  # 限制数量
+                        break
                 except:
                     continue
-            
-            if not elements:
+        
+        if self.config.DEBUG_MODE:
+            print(f"Total elements found: {len(elements)} using selector: {best_selector}")
+        
+        for element in elements[:max_items]:
+            try:
+                tool = self.extract_producthunt_data(element)
+                if tool:
+                    tools.append(tool)
+            except Exception as e:
                 if self.config.DEBUG_MODE:
-                    print("No product elements found, trying fallback selectors...")
-                # 尝试备用选择器
-                fallback_selectors = ['div', 'li', 'article', 'section']
-                for selector in fallback_selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if len(elements) > 20:
-                            elements = elements[:50]  # 限制数量
-                            break
-                    except:
-                        continue
-            
-            if self.config.DEBUG_MODE:
-                print(f"Total elements found: {len(elements)} using selector: {best_selector}")
-            
-            max_items = site_config.get('max_items', 25)
-            for element in elements[:max_items]:
-                try:
-                    tool = self.extract_producthunt_data(element)
-                    if tool:
-                        tools.append(tool)
-                except Exception as e:
-                    if self.config.DEBUG_MODE:
-                        print(f"Error extracting product data: {e}")
-                    continue
-            
-            if self.config.DEBUG_MODE:
-                print(f"Successfully extracted {len(tools)} products from Product Hunt")
-            
-        except Exception as e:
-            print(f"Error scraping Product Hunt: {e}")
-            if self.config.DEBUG_MODE:
-                import traceback
-                traceback.print_exc()
-        finally:
-            if driver:
-                driver.quit()
+                    print(f"Error extracting product data: {e}")
+                continue
+        
+        if self.config.DEBUG_MODE:
+            print(f"Successfully extracted {len(tools)} products from Product Hunt")
         
         return tools
     
     def scrape_futuretools(self, url: str, site_config: dict) -> List[Dict]:
         """Scrape Future Tools"""
-        driver = None
         tools = []
         
-        try:
-            driver = self.setup_driver()
-            driver.get(url)
-            time.sleep(3)
-            
-            # Scroll to load more content
-            for i in range(2):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            # Find tool elements
-            selectors = [
-                '.tool-card', '.tool-item', '.tool',
-                '[data-testid="tool-card"]',
-                '.grid-item', '.card'
-            ]
+        # Find tool elements
+        selectors = SITE_ADAPTERS['futuretools.io']['card_selectors']
+        max_items = site_config.get('max_items', 40)
+        
+        with self.driver_session() as driver:
+            self.load_page(driver, url)
             
-            elements = []
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if len(elements) > 5:
-                        break
-                except:
-                    continue
+            # Wait for tool cards and scroll until no more load
+            self.wait_for_page(driver, url, self.selector_memory.ordered(urlparse(url).netloc, selectors), max_items, 'futuretools.io')
             
-            max_items = site_config.get('max_items', 40)
-            for element in elements[:max_items]:
-                try:
-                    tool = self.extract_futuretools_data(element)
-                    if tool:
-                        tools.append(tool)
-                except:
-                    continue
+            # Pull compact card JSON in-browser when enabled
+            js_tools = self.extract_in_browser(driver, 'futuretools.io', max_items)
+            if js_tools:
+                return js_tools
             
-        except Exception as e:
-            print(f"Error scraping Future Tools: {e}")
-        finally:
-            if driver:
-                driver.quit()
+            # Otherwise grab the rendered page once and extract offline
+            html = self.page_source(driver, url)
+        
+        soup = parse_html(html, 'futuretools.io')
+        elements, _ = self.select_cards(soup, url, selectors, 'futuretools.io')
+        
+        for element in elements[:max_items]:
+            try:
+                tool = self.extract_futuretools_data(element)
+                if tool:
+                    tools.append(tool)
+            except:
+                continue
         
         return tools
     
@@ -340,74 +659,56 @@ class MultiSiteScraper:
         """Scrape BetaList"""
         tools = []
         
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find startup elements
-            elements = soup.find_all(['div', 'article'], class_=re.compile(r'startup|product|item'))
-            
-            max_items = site_config.get('max_items', 25)
-            for element in elements[:max_items]:
-                try:
-                    tool = self.extract_betalist_data(element)
-                    if tool:
-                        tools.append(tool)
-                except:
-                    continue
-            
-        except Exception as e:
-            print(f"Error scraping BetaList: {e}")
+        response = self.fetch_page(url)
+        
+        soup = parse_html(response.content, 'betalist.com')
+        
+        # Find startup elements
+        elements = soup.find_all(['div', 'article'], class_=re.compile(r'startup|product|item'))
+        
+        max_items = site_config.get('max_items', 25)
+        for element in elements[:max_items]:
+            try:
+                tool = self.extract_betalist_data(element)
+                if tool:
+                    tools.append(tool)
+            except:
+                continue
         
         return tools
     
     def scrape_explodingtopics(self, url: str, site_config: dict) -> List[Dict]:
         """Scrape Exploding Topics"""
-        driver = None
         tools = []
         
-        try:
-            driver = self.setup_driver()
-            driver.get(url)
-            time.sleep(4)
-            
-            # Scroll to load more content
-            for i in range(2):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
-            
-            # Find topic elements
-            selectors = [
-                '.topic-card', '.topic-item', '.topic',
-                '[data-testid="topic-card"]',
-                '.trend-item', '.trend-card'
-            ]
+        # Find topic elements
+        selectors = SITE_ADAPTERS['explodingtopics.com']['card_selectors']
+        max_items = site_config.get('max_items', 20)
+        
+        with self.driver_session() as driver:
+            self.load_page(driver, url)
             
-            elements = []
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if len(elements) > 3:
-                        break
-                except:
-                    continue
+            # Wait for topic cards and scroll until no more load
+            self.wait_for_page(driver, url, self.selector_memory.ordered(urlparse(url).netloc, selectors), max_items, 'explodingtopics.com')
             
-            max_items = site_config.get('max_items', 20)
-            for element in elements[:max_items]:
-                try:
-                    tool = self.extract_explodingtopics_data(element)
-                    if tool:
-                        tools.append(tool)
-                except:
-                    continue
+            # Pull compact card JSON in-browser when enabled
+            js_tools = self.extract_in_browser(driver, 'explodingtopics.com', max_items)
+            if js_tools:
+                return js_tools
             
-        except Exception as e:
-            print(f"Error scraping Exploding Topics: {e}")
-        finally:
-            if driver:
-                driver.quit()
+            # Otherwise grab the rendered page once and extract offline
+            html = self.page_source(driver, url)
+        
+        soup = parse_html(html, 'explodingtopics.com')
+        elements, _ = self.select_cards(soup, url, selectors, 'explodingtopics.com')
+        
+        for element in elements[:max_items]:
+            try:
+                tool = self.extract_explodingtopics_data(element)
+                if tool:
+                    tools.append(tool)
+            except:
+                continue
         
         return tools
     
@@ -415,58 +716,54 @@ class MultiSiteScraper:
         """Generic scraper for unknown sites"""
         tools = []
         
-        try:
-            if site_config.get('use_selenium', True):
-                driver = self.setup_driver()
-                driver.get(url)
-                time.sleep(3)
-                
-                # Generic element selectors
-                selectors = [
-                    'article', '.card', '.item', '.product',
-                    '.tool', '.app', '.service', '.startup'
-                ]
-                
-                elements = []
-                for selector in selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if len(elements) > 3:
-                            break
-                    except:
-                        continue
-                
-                max_items = site_config.get('max_items', 20)
-                for element in elements[:max_items]:
-                    try:
-                        tool = self.extract_generic_data(element)
-                        if tool:
-                            tools.append(tool)
-                    except:
-                        continue
+        if site_config.get('use_selenium', True):
+            # Generic element selectors
+            selectors = SITE_ADAPTERS['generic']['card_selectors']
+            max_items = site_config.get('max_items', 20)
+            
+            with self.driver_session() as driver:
+                self.load_page(driver, url)
                 
-                driver.quit()
-            else:
-                # Use requests for simple sites
-                response = self.session.get(url, timeout=30)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                # Wait for any generic card to render
+                self.wait_for_page(driver, url, self.selector_memory.ordered(urlparse(url).netloc, selectors), max_items, 'generic')
                 
-                elements = soup.find_all(['article', 'div'], class_=re.compile(r'card|item|product'))
+                # Pull compact card JSON in-browser when enabled
+                js_tools = self.extract_in_browser(driver, 'generic', max_items)
+                if js_tools:
+                    return js_tools
                 
-                max_items = site_config.get('max_items', 20)
-                for element in elements[:max_items]:
-                    try:
-                        tool = self.extract_generic_data_bs4(element)
-                        if tool:
-                            tools.append(tool)
-                    except:
-                        continue
+                # Otherwise grab the rendered page once and extract offline
+                html = self.page_source(driver, url)
             
-        except Exception as e:
-            print(f"Error in generic scraper: {e}")
+            soup = parse_html(html, 'generic')
+            elements, _ = self.select_cards(soup, url, selectors, 'generic')
+            
+            for element in elements[:max_items]:
+                try:
+                    tool = self.extract_generic_data(element)
+                    if tool:
+                        tools.append(tool)
+                except:
+                    continue
+        else:
+            # Use requests for simple sites
+            response = self.fetch_page(url)
+            soup = parse_html(response.content, 'generic')
+            
+            elements = soup.find_all(['article', 'div'], class_=re.compile(r'card|item|product'))
+            
+            max_items = site_config.get('max_items', 20)
+            for element in elements[:max_items]:
+                try:
+                    tool = self.extract_generic_data_bs4(element)
+                    if tool:
+                        tools.append(tool)
+                except:
+                    continue
         
         return tools
     
+    @timeline.timed('scrape.extract', 'toolify.ai', keep_span=False)
     def extract_toolify_data(self, element) -> Optional[Dict]:
         """Extract data from Toolify element"""
         try:
@@ -569,11 +866,12 @@ class MultiSiteScraper:
         
         return None
     
+    @timeline.timed('scrape.extract', 'producthunt.com', keep_span=False)
     def extract_producthunt_data(self, element) -> Optional[Dict]:
         """Extract data from Product Hunt element"""
         try:
             # 首先尝试获取完整文本
-            full_text = element.text.strip()
+            full_text = rendered_text(element)
             
             if self.config.DEBUG_MODE:
                 print(f"Processing element with text: {full_text[:100]}...")
@@ -610,8 +908,10 @@ class MultiSiteScraper:
                     
                     for selector in name_selectors:
                         try:
-                            name_elem = element.find_element(By.CSS_SELECTOR, selector)
-                            candidate_name = name_elem.text.strip()
+                            name_elem = element.select_one(selector)
+                            if not name_elem:
+                                continue
+                            candidate_name = rendered_text(name_elem)
                             
                             if candidate_name and len(candidate_name) > 2 and len(candidate_name) < 200:
                                 # 排除干扰词汇
@@ -649,9 +949,9 @@ class MultiSiteScraper:
                         
                         for selector in desc_selectors:
                             try:
-                                desc_elements = element.find_elements(By.CSS_SELECTOR, selector)
+                                desc_elements = element.select(selector)
                                 for desc_elem in desc_elements:
-                                    candidate_desc = desc_elem.text.strip()
+                                    candidate_desc = rendered_text(desc_elem)
                                     
                                     if candidate_desc and len(candidate_desc) > 10 and len(candidate_desc) < 500:
                                         # 排除干扰词汇和重复的名称
@@ -706,8 +1006,8 @@ class MultiSiteScraper:
             # 尝试提取链接
             link = ""
             try:
-                link_elem = element.find_element(By.CSS_SELECTOR, "a")
-                link = link_elem.get_attribute("href")
+                link_elem = element.select_one("a")
+                link = link_elem.get('href', '') if link_elem else ""
                 if link and not link.startswith('http'):
                     link = f"https://www.producthunt.com{link}"
             except:
@@ -730,6 +1030,7 @@ class MultiSiteScraper:
         
         return None
     
+    @timeline.timed('scrape.extract', 'futuretools.io', keep_span=False)
     def extract_futuretools_data(self, element) -> Optional[Dict]:
         """Extract data from Future Tools element"""
         try:
@@ -737,8 +1038,8 @@ class MultiSiteScraper:
             name = ""
             for selector in ["h3", "h4", ".title", ".name"]:
                 try:
-                    name_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    name = name_elem.text.strip()
+                    name_elem = element.select_one(selector)
+                    name = rendered_text(name_elem)
                     if name and len(name) > 2:
                         break
                 except:
@@ -748,8 +1049,8 @@ class MultiSiteScraper:
             description = ""
             for selector in ["p", ".description", ".desc"]:
                 try:
-                    desc_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    description = desc_elem.text.strip()
+                    desc_elem = element.select_one(selector)
+                    description = rendered_text(desc_elem)
                     if description and len(description) > 10:
                         break
                 except:
@@ -769,6 +1070,7 @@ class MultiSiteScraper:
         
         return None
     
+    @timeline.timed('scrape.extract', 'betalist.com', keep_span=False)
     def extract_betalist_data(self, element) -> Optional[Dict]:
         """Extract data from BetaList element"""
         try:
@@ -855,6 +1157,7 @@ class MultiSiteScraper:
         
         return None
     
+    @timeline.timed('scrape.extract', 'explodingtopics.com', keep_span=False)
     def extract_explodingtopics_data(self, element) -> Optional[Dict]:
         """Extract data from Exploding Topics element"""
         try:
@@ -862,8 +1165,8 @@ class MultiSiteScraper:
             name = ""
             for selector in ["h3", "h4", ".title", ".topic-name"]:
                 try:
-                    name_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    name = name_elem.text.strip()
+                    name_elem = element.select_one(selector)
+                    name = rendered_text(name_elem)
                     if name and len(name) > 2:
                         break
                 except:
@@ -873,8 +1176,8 @@ class MultiSiteScraper:
             description = ""
             for selector in ["p", ".description", ".trend-info"]:
                 try:
-                    desc_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    description = desc_elem.text.strip()
+                    desc_elem = element.select_one(selector)
+                    description = rendered_text(desc_elem)
                     if description and len(description) > 10:
                         break
                 except:
@@ -894,15 +1197,16 @@ class MultiSiteScraper:
         
         return None
     
+    @timeline.timed('scrape.extract', 'generic', keep_span=False)
     def extract_generic_data(self, element) -> Optional[Dict]:
-        """Extract data from generic element using Selenium"""
+        """Extract data from a rendered generic card parsed offline"""
         try:
             # Extract name
             name = ""
             for selector in ["h1", "h2", "h3", "h4", ".title", ".name"]:
                 try:
-                    name_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    name = name_elem.text.strip()
+                    name_elem = element.select_one(selector)
+                    name = rendered_text(name_elem)
                     if name and len(name) > 2:
                         break
                 except:
@@ -912,8 +1216,8 @@ class MultiSiteScraper:
             description = ""
             for selector in ["p", ".description", ".desc"]:
                 try:
-                    desc_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    description = desc_elem.text.strip()
+                    desc_elem = element.select_one(selector)
+                    description = rendered_text(desc_elem)
                     if description and len(description) > 10:
                         break
                 except:
@@ -933,6 +1237,7 @@ class MultiSiteScraper:
         
         return None
     
+    @timeline.timed('scrape.extract', 'generic', keep_span=False)
     def extract_generic_data_bs4(self, element) -> Optional[Dict]:
         """Extract data from generic element using BeautifulSoup"""
         try:
@@ -979,27 +1284,22 @@ class MultiSiteScraper:
         """Fallback scraper for Toolify using requests"""
         tools = []
         
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find tool elements
-            elements = soup.find_all(['div', 'article'], class_=re.compile(r'tool|card|item'))
-            
-            max_items = site_config.get('max_items', 50)
-            for element in elements[:max_items]:
-                try:
-                    tool = self.extract_generic_data_bs4(element)
-                    if tool:
-                        tool['source'] = 'toolify.ai'
-                        tools.append(tool)
-                except:
-                    continue
-            
-        except Exception as e:
-            print(f"Error in Toolify requests scraper: {e}")
+        response = self.fetch_page(url)
+        
+        soup = parse_html(response.content, 'toolify.ai')
+        
+        # Find tool elements
+        elements = soup.find_all(['div', 'article'], class_=re.compile(r'tool|card|item'))
+        
+        max_items = site_config.get('max_items', 50)
+        for element in elements[:max_items]:
+            try:
+                tool = self.extract_generic_data_bs4(element)
+                if tool:
+                    tool['source'] = 'toolify.ai'
+                    tools.append(tool)
+            except:
+                continue
         
         return tools
     
@@ -9,6 +9,8 @@ import os
 from typing import Dict, List, Optional
 from datetime import datetime
 from config import Config
+from src.retry_policy import retry_policy
+from src.timing import timeline
 
 class NotificationSystem:
     """Notification system for sending completion notifications and status updates"""
@@ -16,6 +18,7 @@ class NotificationSystem:
     def __init__(self):
         self.config = Config()
         
+    @timeline.timed('notify.webhook')
     def send_webhook_notification(self, data: Dict) -> bool:
         """Send notification via webhook (e.g., Slack, Discord, etc.)"""
         if not self.config.NOTIFICATION_WEBHOOK_URL:
@@ -30,12 +33,12 @@ class NotificationSystem:
                 "timestamp": datetime.now().isoformat()
             }
             
-            response = requests.post(
+            response = retry_policy.call('webhook', lambda: requests.post(
                 self.config.NOTIFICATION_WEBHOOK_URL,
                 json=payload,
                 headers={'Content-Type': 'application/json'},
                 timeout=10
-            )
+            ))
             
             if response.status_code == 200:
                 print("Webhook notification sent successfully")
@@ -48,6 +51,7 @@ class NotificationSystem:
             print(f"Error sending webhook notification: {e}")
             return False
     
+    @timeline.timed('notify.email')
     def send_email_notification(self, data: Dict, attachment_files: List[str] = None) -> bool:
         """Send notification via email with optional attachments"""
         if not self.config.NOTIFICATION_EMAIL or not self.config.EMAIL_PASSWORD:
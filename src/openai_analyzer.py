@@ -3,6 +3,8 @@ import json
 import time
 from typing import List, Dict, Set, Optional
 from config import Config
+from src.retry_policy import retry_policy
+from src.timing import timeline
 import re
 
 class OpenAIAnalyzer:
@@ -10,9 +12,10 @@ class OpenAIAnalyzer:
     
     def __init__(self):
         self.config = Config()
-        # Initialize OpenAI client with minimal configuration
+        # Initialize OpenAI client with minimal configuration; retries go through the shared retry policy
         self.client = openai.OpenAI(
-            api_key=self.config.OPENAI_API_KEY
+            api_key=self.config.OPENAI_API_KEY,
+            max_retries=0
         )
         self.extracted_words = set()
         
@@ -43,27 +46,34 @@ class OpenAIAnalyzer:
     def analyze_single_batch(self, tools_batch: List[Dict]) -> List[Dict]:
         """Analyze a single batch of tools"""
         try:
-            # Prepare the data for analysis
-            tools_text = self.prepare_tools_text(tools_batch)
-            
-            # Create the prompt for OpenAI
-            prompt = self.create_analysis_prompt(tools_text)
+            with timeline.span('openai.prompt'):
+                # Prepare the data for analysis
+                tools_text = self.prepare_tools_text(tools_batch)
+                
+                # Create the prompt for OpenAI
+                prompt = self.create_analysis_prompt(tools_text)
             
             # Call OpenAI API with proper error handling
             try:
-                response = self.client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": self.get_system_prompt()},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.3,
-                    max_tokens=2000
-                )
+                with timeline.span('openai.request'):
+                    response = retry_policy.call('openai', lambda: self.client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=[
+                            {"role": "system", "content": self.get_system_prompt()},
+                            {"role": "user", "content": prompt}
+                        ],
+                        temperature=0.3,
+                        max_tokens=2000
+                    ))
                 
                 # Parse the response
-                result = response.choices[0].message.content
-                new_words = self.parse_openai_response(result)
+                with timeline.span('openai.parse'):
+                    result = response.choices[0].message.content
+                    new_words = self.parse_openai_response(result)
+                
+                # Only tools that got an answer may be remembered as seen
+                for tool in tools_batch:
+                    tool['analyzed'] = True
                 
                 return new_words
                 
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Page Artifact Store for AI Words Mining System
+本次运行中抓取到的页面原始HTML及元数据，供单站点回退直接重新解析，避免重复下载和启动浏览器
+"""
+
+import time
+import threading
+from typing import Dict, Optional
+from config import Config
+
+
+class PageArtifactStore:
+    """Per-run map of URL to captured HTML, shared by the multi-site and Toolify scrapers"""
+    
+    def __init__(self):
+        self.config = Config()
+        self.enabled = self.config.ENABLE_PAGE_ARTIFACTS
+        self._lock = threading.Lock()
+        self.artifacts = {}
+        
+        self.stats = {
+            'stored': 0,
+            'reused': 0
+        }
+    
+    def put(self, url: str, html, source: str, response=None, elapsed: float = None):
+        """Keep a page; source is 'http' (raw response) or 'selenium' (rendered DOM)"""
+        if not self.enabled or not html:
+            return
+        
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        
+        with self._lock:
+            # One entry per (url, source): the plain response and the rendered DOM are both useful
+            self.artifacts[(url, source)] = {
+                'url': url,
+                'source': source,
+                'html': html,
+                'status': getattr(response, 'status_code', 200),
+                'final_url': str(getattr(response, 'url', url)),
+                'bytes': len(html),
+                'elapsed': elapsed,
+                'fetched_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'response': response
+            }
+            self.stats['stored'] += 1
+    
+    def get(self, url: str, source: str = None) -> Optional[Dict]:
+        """Captured artifact for a URL, preferring the rendered DOM unless a source is given"""
+        sources = [source] if source else ['selenium', 'http']
+        with self._lock:
+            for candidate in sources:
+                artifact = self.artifacts.get((url, candidate))
+                if artifact:
+                    self.stats['reused'] += 1
+                    return artifact
+        return None
+    
+    def has(self, url: str, source: str) -> bool:
+        return (url, source) in self.artifacts
+    
+    def response(self, url: str):
+        """The raw HTTP response captured for a URL, if any"""
+        artifact = self.get(url, 'http')
+        return artifact['response'] if artifact else None
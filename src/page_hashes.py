@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Page Hash Index for AI Words Mining System
+按URL持久化页面内容哈希及其提取出的工具列表：页面未变化时跳过提取和分析，直接复用上次结果
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from config import Config
+
+# Markup that changes on every request (scripts, nonces, inline styles) without changing the listing
+VOLATILE_BLOCKS = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+TAGS = re.compile(r'<[^>]+>')
+WHITESPACE = re.compile(r'\s+')
+
+
+class PageHashIndex:
+    """Per-URL content hash with the tools extracted from that content"""
+    
+    def __init__(self, path: str = None):
+        self.config = Config()
+        self.path = path or self.config.PAGE_HASH_PATH
+        self.enabled = self.config.ENABLE_PAGE_HASHES
+        self._lock = threading.Lock()
+        self.index = self.load() if self.enabled else {}
+        
+        # Hashes of pages extracted this run; written only once the run has analyzed them
+        self.pending = {}
+        
+        self.stats = {
+            'checked': 0,
+            'unchanged': 0,
+            'tools_reused': 0
+        }
+    
+    def load(self) -> Dict[str, Dict]:
+        """Load the index and drop entries older than PAGE_HASH_MAX_AGE_DAYS"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        cutoff = (datetime.now() - timedelta(days=self.config.PAGE_HASH_MAX_AGE_DAYS)).strftime('%Y-%m-%d')
+        return {url: entry for url, entry in index.items() if entry.get('extracted_at', '') >= cutoff}
+    
+    def digest_html(self, html) -> Optional[str]:
+        """Hash of the page's visible text; None for near-empty pages such as client-rendered shells"""
+        if isinstance(html, bytes):
+            html = html.decode('utf-8', errors='ignore')
+        text = WHITESPACE.sub(' ', TAGS.sub(' ', VOLATILE_BLOCKS.sub(' ', html or ''))).strip()
+        if len(text) < self.config.PAGE_HASH_MIN_CHARS:
+            return None
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def digest_tools(self, tools: Optional[List[Dict]]) -> Optional[str]:
+        """Hash of tools read from embedded listing JSON, ignoring when they were scraped"""
+        if not tools:
+            return None
+        listing = [{key: value for key, value in tool.items() if key != 'scraped_at'} for tool in tools]
+        return hashlib.sha256(json.dumps(listing, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    
+    def unchanged(self, url: str, digest: Optional[str]) -> Optional[List[Dict]]:
+        """The previous run's tools if the page hash has not changed, else None"""
+        if not self.enabled or not digest:
+            return None
+        
+        with self._lock:
+            self.stats['checked'] += 1
+            entry = self.index.get(url)
+            if not entry or entry.get('hash') != digest or not entry.get('tools'):
+                return None
+            
+            self.stats['unchanged'] += 1
+            self.stats['tools_reused'] += len(entry['tools'])
+            # Keep the entry alive for the next run without re-extracting
+            self.pending[url] = {**entry, 'checked_at': datetime.now().strftime('%Y-%m-%d')}
+        
+        # Already analyzed in the run that extracted them
+        return [{**tool, 'is_new': False, 'unchanged_page': True} for tool in entry['tools']]
+    
+    def remember(self, url: str, digest: Optional[str], tools: List[Dict]):
+        """Record what a changed (or new) page produced; pages that yielded nothing are not cached"""
+        if not self.enabled or not digest or not tools:
+            return
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        with self._lock:
+            self.pending[url] = {
+                'hash': digest,
+                'extracted_at': today,
+                'checked_at': today,
+                'tools': [{key: value for key, value in tool.items() if key not in ('is_new', 'unchanged_page')}
+                          for tool in tools]
+            }
+    
+    def commit(self, analyzed_tools: List[Dict]):
+        """Save the hashes of pages whose every tool was analyzed; other pages are extracted again next run"""
+        if not self.enabled or not self.pending:
+            return
+        
+        analyzed_names = {(tool.get('name') or '').lower().strip() for tool in analyzed_tools}
+        with self._lock:
+            for url, entry in self.pending.items():
+                if all((tool.get('name') or '').lower().strip() in analyzed_names for tool in entry['tools']):
+                    self.index[url] = entry
+            self.pending = {}
+            self.save()
+    
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not save page hash index: {e}")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Page Readiness Engine for AI Words Mining System
+基于WebDriverWait的页面就绪检测，替代固定的sleep等待
+"""
+
+import time
+from typing import List, Dict, Optional, Callable
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from config import Config
+
+# Returns the first selector (in priority order) that matches at least one element
+FIRST_PRESENT_SELECTOR_JS = """
+const selectors = arguments[0];
+for (const selector of selectors) {
+    try {
+        if (document.querySelector(selector)) return selector;
+    } catch (e) {}
+}
+return null;
+"""
+
+COUNT_CARDS_JS = "try { return document.querySelectorAll(arguments[0]).length; } catch (e) { return 0; }"
+
+
+class PageReadiness:
+    """Waits for card selectors and scrolls until the card count stops growing"""
+    
+    def __init__(self):
+        self.config = Config()
+        self.poll_frequency = 0.25
+    
+    def count_cards(self, driver, selector: str) -> int:
+        """Count matching cards with a single WebDriver round trip"""
+        return driver.execute_script(COUNT_CARDS_JS, selector) or 0
+    
+    def wait_for_cards(self, driver, selectors: List[str], timeout: float = None) -> Optional[str]:
+        """Wait until any card selector is present and return the one that matched"""
+        timeout = timeout if timeout is not None else self.config.PAGE_READY_TIMEOUT
+        
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(
+                lambda d: d.execute_script(FIRST_PRESENT_SELECTOR_JS, selectors)
+            )
+        except TimeoutException:
+            return None
+    
+    def scroll_until_stable(self, driver, selector: str, max_items: int,
+                            should_stop: Optional[Callable] = None) -> Dict:
+        """Scroll until the card count stops growing or reaches max_items"""
+        count = self.count_cards(driver, selector)
+        rounds = 0
+        stopped_early = False
+        
+        while count < max_items and rounds < self.config.MAX_SCROLL_ROUNDS:
+            if should_stop and should_stop(driver):
+                stopped_early = True
+                break
+            
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            rounds += 1
+            previous = count
+            
+            def grown(d):
+                current = self.count_cards(d, selector)
+                return current if current > previous else False
+            
+            try:
+                count = WebDriverWait(driver, self.config.SCROLL_SETTLE_TIMEOUT, poll_frequency=self.poll_frequency).until(grown)
+            except TimeoutException:
+                # No new cards appeared within the settle window
+                break
+        
+        return {'cards': count, 'scroll_rounds': rounds, 'stopped_early': stopped_early}
+    
+    def wait_until_ready(self, driver, selectors: List[str], max_items: int,
+                         should_stop: Optional[Callable] = None) -> Dict:
+        """Wait for cards, load more by scrolling and report the time actually spent"""
+        start_time = time.time()
+        
+        result = {'selector': None, 'cards': 0, 'scroll_rounds': 0, 'stopped_early': False}
+        selector = self.wait_for_cards(driver, selectors)
+        
+        if selector:
+            result['selector'] = selector
+            result.update(self.scroll_until_stable(driver, selector, max_items, should_stop))
+        
+        result['waited'] = round(time.time() - start_time, 2)
+        return result
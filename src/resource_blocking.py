@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Resource Blocking for AI Words Mining System
+通过CDP Network.setBlockedURLs 和内容设置屏蔽图片、字体、媒体和统计脚本，并统计节省的流量
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
+from urllib.parse import urlparse
+from config import Config
+
+# Resources the scrapers never read: images, web fonts, media and analytics/trackers
+DEFAULT_BLOCKED_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3', '*.m3u8',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*connect.facebook.net*', '*hotjar.com*', '*segment.io*', '*segment.com/analytics*',
+    '*mixpanel.com*', '*amplitude.com*', '*intercom.io*', '*sentry.io*', '*clarity.ms*'
+]
+
+# Chrome content settings: 2 = block
+BLOCKING_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+    'profile.default_content_setting_values.media_stream': 2
+}
+
+PAGE_LOAD_MS_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+return nav ? Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd || nav.duration) : null;
+"""
+
+
+class ResourceBlocker:
+    """Applies per-site URL blocking to Selenium drivers and records what each page cost"""
+    
+    def __init__(self):
+        self.config = Config()
+        self.enabled = self.config.ENABLE_RESOURCE_BLOCKING
+        # Transfer sizes need Chrome's performance log, which costs CPU on every request
+        self.reporting = self.config.RESOURCE_REPORTING or self.config.DEBUG_MODE
+        self.baseline_path = self.config.RESOURCE_BASELINE_PATH
+        self._lock = threading.Lock()
+        self.baseline = self.load_baseline()
+        # URLs loaded unblocked this run to (re)measure their baseline
+        self.baseline_loads = set()
+        self.stats = {}
+    
+    def apply_options(self, chrome_options):
+        """Add content-settings prefs, and performance logging when reporting is on"""
+        if self.enabled:
+            chrome_options.add_experimental_option('prefs', BLOCKING_PREFS)
+        if self.reporting:
+            # Performance log carries per-request transfer sizes and blocked requests
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    
+    def needs_baseline(self, url: str) -> bool:
+        """No unblocked measurement of this URL yet, or it is older than RESOURCE_BASELINE_MAX_AGE_DAYS"""
+        if not (self.enabled and self.reporting):
+            return False
+        baseline = self.baseline.get(url)
+        if not baseline:
+            return True
+        cutoff = (datetime.now() - timedelta(days=self.config.RESOURCE_BASELINE_MAX_AGE_DAYS)).strftime('%Y-%m-%d %H:%M:%S')
+        return baseline.get('recorded_at', '') < cutoff
+    
+    def blocked_patterns(self, url: str) -> List[str]:
+        """Default patterns adjusted by the site's allow_resources / block_resources"""
+        site_config = self.config.get_site_config(urlparse(url).netloc)
+        allowed = set(site_config.get('allow_resources', []))
+        patterns = [p for p in DEFAULT_BLOCKED_PATTERNS if p not in allowed]
+        return patterns + [p for p in site_config.get('block_resources', []) if p not in patterns]
+    
+    def configure(self, driver, url: str):
+        """Set the blocked URL list for the page about to be loaded"""
+        patterns = self.blocked_patterns(url) if self.enabled else []
+        if self.needs_baseline(url):
+            # One unblocked load gives the size later blocked loads are compared against;
+            # the image content setting still applies, so the saving reported is a lower bound
+            with self._lock:
+                self.baseline_loads.add(url)
+            patterns = []
+            print(f"📏 Loading {urlparse(url).netloc} once without URL blocking to measure its baseline")
+        
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except Exception as e:
+            if self.config.DEBUG_MODE:
+                print(f"Could not set blocked URLs: {e}")
+        
+        # Drop log entries from the previous page
+        self.read_performance_log(driver)
+    
+    def read_performance_log(self, driver) -> Optional[Dict]:
+        """Sum transferred bytes and count blocked requests from Chrome's performance log"""
+        if not self.reporting:
+            return None
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return None
+        
+        transferred = 0
+        blocked = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError, TypeError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.loadingFinished':
+                transferred += params.get('encodedDataLength', 0)
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                blocked += 1
+        
+        return {'bytes': int(transferred), 'blocked': blocked}
+    
+    def record(self, driver, url: str, load_seconds: float) -> Dict:
+        """Record page-load time, transferred bytes and blocked requests for a page"""
+        try:
+            load_ms = driver.execute_script(PAGE_LOAD_MS_JS)
+        except Exception:
+            load_ms = None
+        if not load_ms:
+            load_ms = round(load_seconds * 1000)
+        
+        result = {'load_ms': int(load_ms), 'bytes': None, 'blocked': 0, 'bytes_saved': None}
+        usage = self.read_performance_log(driver)
+        if usage:
+            result.update(usage)
+        
+        with self._lock:
+            baseline_load = url in self.baseline_loads
+            self.baseline_loads.discard(url)
+        
+        result['baseline'] = baseline_load
+        baseline = self.baseline.get(url)
+        if (baseline_load or not self.enabled) and result['bytes'] is not None:
+            # Unblocked loads refresh the baseline that blocked loads are compared against
+            self.save_baseline(url, result)
+        elif self.enabled and baseline and result['bytes'] is not None:
+            result['bytes_saved'] = max(0, baseline['bytes'] - result['bytes'])
+        
+        with self._lock:
+            self.stats[url] = result
+        
+        if self.config.DEBUG_MODE:
+            size = f"{result['bytes'] / 1024:.0f} KB" if result['bytes'] is not None else "n/a"
+            print(f"🚫 {urlparse(url).netloc}: {result['blocked']} requests blocked, {size} transferred, "
+                  f"loaded in {result['load_ms']} ms")
+        
+        return result
+    
+    def load_baseline(self) -> Dict[str, Dict]:
+        try:
+            with open(self.baseline_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save_baseline(self, url: str, result: Dict):
+        """Store an unblocked page's transfer size and load time"""
+        with self._lock:
+            self.baseline[url] = {
+                'bytes': result['bytes'],
+                'load_ms': result['load_ms'],
+                'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S')
+            }
+            try:
+                os.makedirs(os.path.dirname(self.baseline_path) or '.', exist_ok=True)
+                with open(self.baseline_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.baseline, f, indent=2)
+            except OSError as e:
+                print(f"Warning: could not save resource baseline: {e}")
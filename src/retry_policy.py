@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Retry Policy for AI Words Mining System
+统一的重试策略：指数退避 + 抖动，只重试可恢复的错误（超时、连接错误、429/5xx）
+"""
+
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+import requests
+import httpx
+from config import Config
+
+try:
+    import openai
+    OPENAI_RETRYABLE = (openai.APIConnectionError, openai.APITimeoutError, openai.RateLimitError, openai.InternalServerError)
+except (ImportError, AttributeError):
+    OPENAI_RETRYABLE = ()
+
+try:
+    from selenium.common.exceptions import TimeoutException as SeleniumTimeout
+    SELENIUM_RETRYABLE = (SeleniumTimeout,)
+except ImportError:
+    SELENIUM_RETRYABLE = ()
+
+# Status codes worth another attempt; everything else is final
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+RETRYABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    httpx.TransportError,
+    ConnectionError,
+    TimeoutError
+) + OPENAI_RETRYABLE + SELENIUM_RETRYABLE
+
+# Selenium reports network failures as a generic WebDriverException
+RETRYABLE_MESSAGES = ('net::ERR_CONNECTION', 'net::ERR_TIMED_OUT', 'net::ERR_NETWORK_CHANGED', 'net::ERR_NAME_NOT_RESOLVED')
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, shared by HTTP, Selenium, OpenAI and webhook calls"""
+    
+    def __init__(self):
+        self.config = Config()
+        self.max_retries = self.config.MAX_RETRIES
+        self.base_delay = self.config.RETRY_BASE_DELAY
+        self.max_delay = self.config.RETRY_MAX_DELAY
+        self._lock = threading.Lock()
+        
+        # Per operation: calls, retries, failures and seconds spent waiting between attempts
+        self.stats = {}
+    
+    def status_of(self, result) -> Optional[int]:
+        status = getattr(result, 'status_code', None)
+        return status if isinstance(status, int) else None
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """Timeouts, dropped connections, rate limits and server errors"""
+        if isinstance(error, RETRYABLE_ERRORS):
+            return True
+        
+        status = self.status_of(getattr(error, 'response', None))
+        if status in RETRYABLE_STATUS:
+            return True
+        
+        return any(message in str(error) for message in RETRYABLE_MESSAGES)
+    
+    def retry_after(self, result) -> Optional[float]:
+        """Seconds requested by a Retry-After header, if any"""
+        headers = getattr(result, 'headers', None) or getattr(getattr(result, 'response', None), 'headers', None)
+        value = headers.get('Retry-After') if headers else None
+        if not value:
+            return None
+        
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    def delay(self, attempt: int, result=None) -> float:
+        """Full jitter: a random wait up to base * 2^attempt, or the server's Retry-After"""
+        requested = self.retry_after(result)
+        if requested is not None:
+            return min(requested, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+    
+    def record(self, operation: str, key: str, amount=1):
+        with self._lock:
+            stats = self.stats.setdefault(operation, {'calls': 0, 'retries': 0, 'failures': 0, 'retry_seconds': 0.0})
+            stats[key] += amount
+    
+    def should_retry(self, attempt: int, retries: int, result=None, error: Exception = None) -> bool:
+        if attempt >= retries:
+            return False
+        if error is not None:
+            return self.is_retryable(error)
+        return self.status_of(result) in RETRYABLE_STATUS
+    
+    def call(self, operation: str, func: Callable, retries: Optional[int] = None):
+        """Call func, retrying retryable errors and responses up to MAX_RETRIES times"""
+        retries = self.max_retries if retries is None else retries
+        self.record(operation, 'calls')
+        
+        attempt = 0
+        while True:
+            try:
+                result = func()
+            except Exception as e:
+                if not self.should_retry(attempt, retries, error=e):
+                    self.record(operation, 'failures')
+                    raise
+                wait = self.delay(attempt, e)
+                reason = type(e).__name__
+            else:
+                if not self.should_retry(attempt, retries, result=result):
+                    return result
+                wait = self.delay(attempt, result)
+                reason = f"HTTP {self.status_of(result)}"
+            
+            attempt += 1
+            self.note_retry(operation, attempt, retries, reason, wait)
+            time.sleep(wait)
+    
+    async def acall(self, operation: str, func: Callable, retries: Optional[int] = None):
+        """Async version of call; func returns a fresh awaitable per attempt"""
+        retries = self.max_retries if retries is None else retries
+        self.record(operation, 'calls')
+        
+        attempt = 0
+        while True:
+            try:
+                result = await func()
+            except Exception as e:
+                if not self.should_retry(attempt, retries, error=e):
+                    self.record(operation, 'failures')
+                    raise
+                wait = self.delay(attempt, e)
+                reason = type(e).__name__
+            else:
+                if not self.should_retry(attempt, retries, result=result):
+                    return result
+                wait = self.delay(attempt, result)
+                reason = f"HTTP {self.status_of(result)}"
+            
+            attempt += 1
+            self.note_retry(operation, attempt, retries, reason, wait)
+            await asyncio.sleep(wait)
+    
+    def note_retry(self, operation: str, attempt: int, retries: int, reason: str, wait: float):
+        self.record(operation, 'retries')
+        self.record(operation, 'retry_seconds', wait)
+        print(f"🔁 {operation} retry {attempt}/{retries} after {reason}, waiting {wait:.1f}s")
+
+
+# One policy per process so main.py can report retries across every component
+retry_policy = RetryPolicy()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Scrape Engines for AI Words Mining System
+可插拔的爬取引擎：Selenium（MultiSiteScraper）或异步的 Crawl4AI，由 USE_CRAWL4AI 选择，SCRAPE_ENGINE 可显式覆盖
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from urllib.parse import urlparse
+from config import Config
+
+
+class ScrapeEngine(ABC):
+    """Interface for a multi-site engine: scrape every enabled target URL into standardized tool dicts"""
+    
+    name = 'base'
+    
+    def __init__(self, multi_scraper):
+        self.config = Config()
+        self.multi_scraper = multi_scraper
+    
+    def available(self) -> bool:
+        return True
+    
+    @abstractmethod
+    def scrape(self) -> List[Dict]:
+        """Scrape every enabled target URL"""
+
+
+class SeleniumEngine(ScrapeEngine):
+    """The existing Selenium/requests multi-site scraper"""
+    
+    name = 'selenium'
+    
+    def scrape(self) -> List[Dict]:
+        return self.multi_scraper.scrape_all_sites()
+
+
+class Crawl4AIEngine(ScrapeEngine):
+    """Crawl4AI with one shared browser, bounded concurrency and its own page cache"""
+    
+    name = 'crawl4ai'
+    
+    def available(self) -> bool:
+        # crawl4ai is heavy (playwright); import it only when this engine is selected
+        try:
+            import crawl4ai  # noqa: F401
+            return True
+        except ImportError as e:
+            print(f"⚠️ Crawl4AI not available ({e}), falling back to Selenium")
+            return False
+    
+    def urls_config(self) -> Dict[str, Dict]:
+        """Enabled TARGET_URLS mapped to the {'name', 'max_items'} entries Crawl4AIScraper expects"""
+        urls_config = {}
+        for url in self.config.TARGET_URLS:
+            site_domain = urlparse(url).netloc.replace('www.', '')
+            site_config = self.config.get_site_config(site_domain)
+            if not site_config.get('enabled', True):
+                continue
+            urls_config[url] = {
+                'name': site_domain.split('.')[0],
+                'max_items': site_config.get('max_items', 30)
+            }
+        return urls_config
+    
+    def scrape(self) -> List[Dict]:
+        from src.crawl4ai_scraper import Crawl4AIScraper
+        
+        scraper = Crawl4AIScraper(debug_mode=self.config.DEBUG_MODE, page_hashes=self.multi_scraper.page_hashes)
+        tools = asyncio.run(self.crawl(scraper))
+        return self.multi_scraper.seen_index.mark(tools or [])
+    
+    async def crawl(self, scraper) -> List[Dict]:
+        """Listing pages, then (with ENABLE_DEEP_CRAWL) their tool detail pages, in one shared browser"""
+        urls_config = self.urls_config()
+        async with scraper:
+            tools = await scraper.scrape_multiple_sites(urls_config, use_llm=self.config.ENABLE_LLM_EXTRACTION)
+            if self.config.ENABLE_DEEP_CRAWL:
+                tools += await scraper.deep_crawl_sites(list(urls_config))
+        return scraper.remove_duplicates(tools)
+
+
+SCRAPE_ENGINES = {
+    SeleniumEngine.name: SeleniumEngine,
+    Crawl4AIEngine.name: Crawl4AIEngine
+}
+
+
+def get_scrape_engine(multi_scraper, name: str = None) -> ScrapeEngine:
+    """SCRAPE_ENGINE if set, else Crawl4AI when USE_CRAWL4AI is on; Selenium when the engine is unknown or cannot be loaded"""
+    name = (name or Config.SCRAPE_ENGINE or ('crawl4ai' if Config.USE_CRAWL4AI else 'selenium')).strip().lower()
+    engine_class = SCRAPE_ENGINES.get(name)
+    if engine_class is None:
+        print(f"⚠️ Unknown SCRAPE_ENGINE '{name}', using selenium")
+        engine_class = SeleniumEngine
+    
+    engine = engine_class(multi_scraper)
+    return engine if engine.available() else SeleniumEngine(multi_scraper)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Seen Tools Index for AI Words Mining System
+按站点持久化已采集工具的指纹（规范化名称+链接），用于增量爬取
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict, Callable, Optional
+from urllib.parse import urlparse
+from config import Config
+
+
+class SeenToolsIndex:
+    """Per-site fingerprints of tools collected in earlier runs"""
+    
+    def __init__(self, path: str = None):
+        self.config = Config()
+        self.path = path or self.config.SEEN_INDEX_PATH
+        self.enabled = self.config.ENABLE_INCREMENTAL_SCRAPING
+        self._lock = threading.Lock()
+        self.index = self.load() if self.enabled else {}
+        self._build_lookups()
+    
+    def load(self) -> Dict[str, Dict]:
+        """Load the index and drop entries older than SEEN_INDEX_MAX_AGE_DAYS"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        cutoff = (datetime.now() - timedelta(days=self.config.SEEN_INDEX_MAX_AGE_DAYS)).strftime('%Y-%m-%d')
+        return {
+            site: {fp: entry for fp, entry in entries.items() if entry.get('last_seen', '') >= cutoff}
+            for site, entries in index.items()
+        }
+    
+    def _build_lookups(self):
+        # Name-only and link-only lookups catch the same tool when one field was extracted differently
+        self.names = {site: {e['name'] for e in entries.values() if e.get('name')} for site, entries in self.index.items()}
+        self.links = {site: {e['link'] for e in entries.values() if e.get('link')} for site, entries in self.index.items()}
+    
+    def normalize_name(self, name: str) -> str:
+        name = re.sub(r'[^\w\s\-]', '', (name or '').lower())
+        return re.sub(r'\s+', ' ', name).strip()
+    
+    def normalize_link(self, link: str) -> str:
+        """Keep only the path so absolute and relative links compare equal"""
+        return urlparse(link or '').path.rstrip('/').lower()
+    
+    def fingerprint(self, tool: Dict) -> str:
+        key = f"{self.normalize_name(tool.get('name'))}|{self.normalize_link(tool.get('link'))}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    def has_site(self, source: str) -> bool:
+        return bool(self.index.get(source))
+    
+    def is_seen(self, source: str, tool: Dict) -> bool:
+        """True if this tool was collected from the site in an earlier run"""
+        if self.fingerprint(tool) in self.index.get(source, {}):
+            return True
+        link = self.normalize_link(tool.get('link'))
+        if link and link in self.links.get(source, set()):
+            return True
+        return self.normalize_name(tool.get('name')) in self.names.get(source, set())
+    
+    def scroll_stop_check(self, source: str, tail_cards: Callable) -> Optional[Callable]:
+        """should_stop callback for scrolling: True once the last loaded cards were all seen before"""
+        if not self.has_site(source):
+            return None
+        
+        window = self.config.SEEN_STOP_WINDOW
+        
+        def should_stop(driver) -> bool:
+            items = tail_cards(driver, window)
+            return len(items) >= window and all(self.is_seen(source, item) for item in items)
+        
+        return should_stop
+    
+    def mark(self, tools: List[Dict]) -> List[Dict]:
+        """Flag each tool as new or already seen"""
+        if not self.enabled:
+            return tools
+        
+        for tool in tools:
+            tool['is_new'] = not tool.get('unchanged_page') and not self.is_seen(tool.get('source', 'unknown'), tool)
+        return tools
+    
+    def commit(self, tools: List[Dict]):
+        """Add tools to the index once they have been processed, then save"""
+        if not self.enabled:
+            return
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        with self._lock:
+            for tool in tools:
+                if 'is_new' not in tool:
+                    continue
+                entries = self.index.setdefault(tool.get('source', 'unknown'), {})
+                fingerprint = self.fingerprint(tool)
+                entry = entries.setdefault(fingerprint, {
+                    'name': self.normalize_name(tool.get('name')),
+                    'link': self.normalize_link(tool.get('link')),
+                    'first_seen': today
+                })
+                entry['last_seen'] = today
+            
+            self._build_lookups()
+            self.save()
+    
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not save seen tools index: {e}")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Selector Memory for AI Words Mining System
+记住每个站点上次命中的CSS选择器及卡片数量，下次优先尝试
+"""
+
+import os
+import json
+import time
+import threading
+from typing import List, Dict, Optional, Tuple
+from config import Config
+
+
+class SelectorMemory:
+    """Persists the winning card selector per site and probes with it first"""
+    
+    def __init__(self, path: str = None):
+        self.config = Config()
+        self.path = path or self.config.SELECTOR_MEMORY_PATH
+        self.enabled = self.config.ENABLE_SELECTOR_MEMORY
+        self._lock = threading.Lock()
+        self.memory = self.load() if self.enabled else {}
+        
+        self.stats = {
+            'remembered_hits': 0,
+            'probes': 0,
+            'collapses': 0
+        }
+    
+    def load(self) -> Dict[str, Dict]:
+        """Load remembered selectors from disk"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save(self):
+        """Write remembered selectors to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.memory, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not save selector memory: {e}")
+    
+    def ordered(self, site: str, selectors: List[str]) -> List[str]:
+        """Return selectors with the remembered one moved to the front"""
+        remembered = self.memory.get(site, {}).get('selector')
+        if remembered not in selectors:
+            return list(selectors)
+        return [remembered] + [s for s in selectors if s != remembered]
+    
+    def record(self, site: str, selector: str, count: int):
+        """Remember the selector that produced the cards for a site"""
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            self.memory[site] = {
+                'selector': selector,
+                'yield': count,
+                'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')
+            }
+            self.save()
+    
+    def is_collapsed(self, site: str, count: int, min_count: int) -> bool:
+        """True when the remembered selector now yields far fewer cards than last time"""
+        last_yield = self.memory.get(site, {}).get('yield', 0)
+        if count == 0:
+            return True
+        if count < self.config.SELECTOR_COLLAPSE_RATIO * last_yield:
+            return True
+        return count < min(min_count, last_yield)
+    
+    def probe(self, root, site: str, selectors: List[str], min_count: int) -> Tuple[List, Optional[str]]:
+        """Select cards, trying the remembered selector before probing the whole list"""
+        remembered = self.memory.get(site, {}).get('selector')
+        
+        if remembered in selectors:
+            try:
+                elements = root.select(remembered)
+            except Exception:
+                elements = []
+            
+            if not self.is_collapsed(site, len(elements), min_count):
+                with self._lock:
+                    self.stats['remembered_hits'] += 1
+                if len(elements) != self.memory[site].get('yield'):
+                    self.record(site, remembered, len(elements))
+                return elements, remembered
+            
+            with self._lock:
+                self.stats['collapses'] += 1
+            if self.config.DEBUG_MODE:
+                print(f"🧠 Remembered selector '{remembered}' collapsed on {site} ({len(elements)} cards), re-probing")
+        
+        # Probe in priority order, keeping the largest match until one is big enough
+        with self._lock:
+            self.stats['probes'] += 1
+        
+        elements, best_selector = [], None
+        for selector in selectors:
+            try:
+                found = root.select(selector)
+            except Exception:
+                continue
+            if len(found) > len(elements):
+                elements, best_selector = found, selector
+            if len(elements) >= min_count:
+                break
+        
+        if best_selector:
+            self.record(site, best_selector, len(elements))
+        
+        return elements, best_selector
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Site Health Ledger for AI Words Mining System
+按域名持久化每次运行的成功率、产出、耗时和最近错误，并对连续失败的站点熔断
+"""
+
+import os
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from config import Config
+
+# Longest an open breaker waits before the next probe
+MAX_COOLDOWN_HOURS = 24 * 7
+
+
+class SiteHealthLedger:
+    """Per-domain run history with a circuit breaker for sites that keep failing"""
+    
+    def __init__(self, path: str = None):
+        self.config = Config()
+        self.path = path or self.config.SITE_HEALTH_PATH
+        self.enabled = self.config.ENABLE_CIRCUIT_BREAKER
+        self._lock = threading.Lock()
+        self.ledger = self.load()
+        
+        # What the breaker decided for each domain during this run
+        self.run_events = {}
+    
+    def load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.ledger, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not save site health ledger: {e}")
+    
+    def entry(self, domain: str) -> Dict:
+        return self.ledger.get(domain, {})
+    
+    def state(self, domain: str) -> str:
+        return self.entry(domain).get('state', 'closed')
+    
+    def cooling_down(self, domain: str) -> bool:
+        """True while an open breaker's cooldown has not yet elapsed"""
+        retry_after = self.entry(domain).get('retry_after')
+        return bool(retry_after) and datetime.now().isoformat(timespec='seconds') < retry_after
+    
+    def should_skip(self, domain: str) -> bool:
+        """Skip the site entirely: breaker open and still cooling down"""
+        return self.enabled and self.state(domain) == 'open' and self.cooling_down(domain)
+    
+    def needs_probe(self, domain: str) -> bool:
+        """Breaker open but cooldown elapsed: check the site cheaply before a full scrape"""
+        return self.enabled and self.state(domain) == 'open' and not self.cooling_down(domain)
+    
+    def note(self, domain: str, event: str):
+        with self._lock:
+            self.run_events[domain] = event
+    
+    def start_trial(self, domain: str):
+        """Probe passed: allow one full scrape that closes or re-opens the breaker"""
+        with self._lock:
+            self.ledger.setdefault(domain, {})['state'] = 'half_open'
+            self.run_events[domain] = 'trial'
+    
+    def record(self, domain: str, items: int, seconds: float, error: Optional[str] = None):
+        """Record one scrape of a site and update its breaker; kept in memory only while the breaker is disabled"""
+        now = datetime.now()
+        ok = items > 0 and not error
+        
+        with self._lock:
+            entry = self.ledger.setdefault(domain, {})
+            runs = entry.setdefault('runs', [])
+            runs.append({
+                'at': now.isoformat(timespec='seconds'),
+                'ok': ok,
+                'items': items,
+                'seconds': round(seconds, 2),
+                'error': error
+            })
+            del runs[:-self.config.SITE_HEALTH_HISTORY]
+            
+            if ok:
+                if entry.get('state') == 'half_open':
+                    self.run_events[domain] = 'recovered'
+                entry.update({'state': 'closed', 'consecutive_failures': 0, 'trips': 0,
+                              'retry_after': None, 'last_success': runs[-1]['at']})
+            else:
+                entry['consecutive_failures'] = entry.get('consecutive_failures', 0) + 1
+                entry['last_error'] = error or 'no items found'
+                
+                if self.enabled and entry.get('state') == 'half_open':
+                    self.run_events[domain] = 'reopened'
+                    self.trip(domain, entry, now)
+                elif self.enabled and entry['consecutive_failures'] >= self.config.BREAKER_FAILURE_THRESHOLD:
+                    self.run_events[domain] = 'opened'
+                    self.trip(domain, entry, now)
+            
+            if self.enabled:
+                self.save()
+    
+    def record_probe_failure(self, domain: str, error: str):
+        """A failed probe keeps the breaker open for another, longer cooldown"""
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            entry = self.ledger.setdefault(domain, {})
+            entry['last_error'] = f"probe: {error}"
+            self.trip(domain, entry, datetime.now())
+            self.run_events[domain] = 'probe_failed'
+            self.save()
+    
+    def trip(self, domain: str, entry: Dict, now: datetime):
+        # Each consecutive trip doubles the cooldown
+        trips = entry.get('trips', 0)
+        cooldown = min(self.config.BREAKER_COOLDOWN_HOURS * 2 ** trips, MAX_COOLDOWN_HOURS)
+        entry.update({
+            'state': 'open',
+            'trips': trips + 1,
+            'opened_at': entry.get('opened_at') if entry.get('state') == 'open' else now.isoformat(timespec='seconds'),
+            'retry_after': (now + timedelta(hours=cooldown)).isoformat(timespec='seconds')
+        })
+        print(f"🔌 Circuit breaker open for {domain} until {entry['retry_after']} ({entry['last_error']})")
+    
+    def summary(self, domain: str) -> Dict:
+        """Success rate, average yield and latency over the recorded runs"""
+        entry = self.entry(domain)
+        runs = entry.get('runs', [])
+        successes = [run for run in runs if run['ok']]
+        
+        return {
+            'state': entry.get('state', 'closed'),
+            'runs': len(runs),
+            'success_rate': len(successes) / len(runs) if runs else None,
+            'avg_items': sum(run['items'] for run in successes) / len(successes) if successes else 0,
+            'avg_seconds': sum(run['seconds'] for run in runs) / len(runs) if runs else 0,
+            'consecutive_failures': entry.get('consecutive_failures', 0),
+            'last_error': entry.get('last_error'),
+            'retry_after': entry.get('retry_after')
+        }
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Embedded Structured Data Extractor for AI Words Mining System
+从页面内嵌的 __NEXT_DATA__ / JSON-LD / Apollo 状态中直接提取工具列表，无需启动浏览器
+"""
+
+import re
+import json
+import time
+from typing import List, Dict, Optional, Iterator
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, SoupStrainer
+from config import Config
+from src.html_parsing import HTML_PARSER
+
+# Keys that hold a tool's fields in the various embedded payloads
+NAME_KEYS = ('name', 'title')
+DESCRIPTION_KEYS = ('tagline', 'description', 'shortDescription', 'short_description', 'desc', 'summary', 'what_is')
+LINK_KEYS = ('url', 'website', 'link', 'websiteUrl', 'website_url')
+CATEGORY_KEYS = ('topics', 'categories', 'category', 'tags', 'applicationCategory')
+
+# Per-site paths for items that only carry a slug/handle
+SLUG_LINKS = {
+    'producthunt.com': '/posts/{slug}',
+    'toolify.ai': '/tool/{slug}'
+}
+
+# JSON-LD types that describe a single tool or product
+JSON_LD_ITEM_TYPES = {'SoftwareApplication', 'WebApplication', 'MobileApplication', 'Product', 'CreativeWork'}
+
+APOLLO_STATE_RE = re.compile(r'__APOLLO_STATE__\s*=\s*(\{.*?\})\s*;?\s*$', re.S)
+
+
+class StructuredDataExtractor:
+    """Maps embedded listing JSON straight to tool dicts"""
+    
+    def __init__(self):
+        self.config = Config()
+        self.min_items = self.config.STRUCTURED_DATA_MIN_ITEMS
+    
+    def extract(self, html, url: str, source: str, max_items: int) -> List[Dict]:
+        """Return tools found in embedded JSON, or an empty list when there is no usable payload"""
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer('script'))
+        
+        for payload_type, payload, refs in self.iter_payloads(soup):
+            tools = []
+            seen_names = set()
+            
+            for item in self.iter_items(payload, refs):
+                tool = self.to_tool(item, refs, url, source)
+                if tool and tool['name'].lower() not in seen_names:
+                    seen_names.add(tool['name'].lower())
+                    tools.append(tool)
+                if len(tools) >= max_items:
+                    break
+            
+            if len(tools) >= self.min_items:
+                if self.config.DEBUG_MODE:
+                    print(f"🧩 {source}: {len(tools)} tools from embedded {payload_type}")
+                return tools
+        
+        return []
+    
+    def iter_payloads(self, soup) -> Iterator:
+        """Yield (type, payload, refs) for each embedded JSON blob on the page"""
+        next_data = soup.find('script', id='__NEXT_DATA__')
+        if next_data:
+            data = self.load_json(next_data.string)
+            if data:
+                page_props = data.get('props', {}).get('pageProps', {})
+                apollo = page_props.get('apolloState') or page_props.get('__APOLLO_STATE__') or data.get('apolloState')
+                if isinstance(apollo, dict):
+                    yield 'Apollo state', list(apollo.values()), apollo
+                yield '__NEXT_DATA__', page_props or data, {}
+        
+        for script in soup.find_all('script'):
+            text = script.string or ''
+            if '__APOLLO_STATE__' in text:
+                match = APOLLO_STATE_RE.search(text)
+                apollo = self.load_json(match.group(1)) if match else None
+                if isinstance(apollo, dict):
+                    yield 'Apollo state', list(apollo.values()), apollo
+        
+        json_ld = []
+        for script in soup.find_all('script', type='application/ld+json'):
+            data = self.load_json(script.string)
+            if data:
+                json_ld.append(data)
+        if json_ld:
+            yield 'JSON-LD', json_ld, {}
+    
+    def load_json(self, text: Optional[str]):
+        try:
+            return json.loads(text) if text else None
+        except ValueError:
+            return None
+    
+    def resolve(self, value, refs: Dict):
+        """Follow an Apollo {"__ref": "Type:id"} pointer"""
+        if isinstance(value, dict) and '__ref' in value:
+            return refs.get(value['__ref'], {})
+        return value
+    
+    def iter_items(self, payload, refs: Dict, depth: int = 0) -> Iterator[Dict]:
+        """Walk a payload and yield dicts that look like a listed tool"""
+        if depth > 12:
+            return
+        
+        payload = self.resolve(payload, refs)
+        
+        if isinstance(payload, list):
+            for value in payload:
+                yield from self.iter_items(value, refs, depth + 1)
+            return
+        
+        if not isinstance(payload, dict):
+            return
+        
+        # JSON-LD lists wrap each entry in a ListItem
+        if payload.get('@type') == 'ListItem' and 'item' in payload:
+            yield from self.iter_items(payload['item'], refs, depth + 1)
+            return
+        
+        if self.looks_like_tool(payload):
+            yield payload
+            return
+        
+        for key, value in payload.items():
+            if isinstance(value, (dict, list)) and not key.startswith('__'):
+                yield from self.iter_items(value, refs, depth + 1)
+    
+    def looks_like_tool(self, item: Dict) -> bool:
+        """A tool has a short name and a description-like field"""
+        item_type = item.get('@type')
+        item_types = item_type if isinstance(item_type, list) else [item_type]
+        if item_type and not JSON_LD_ITEM_TYPES.intersection(t for t in item_types if isinstance(t, str)):
+            return False
+        
+        name = next((item[key] for key in NAME_KEYS if isinstance(item.get(key), str)), None)
+        if not name or not 2 < len(name.strip()) < 100:
+            return False
+        
+        return any(isinstance(item.get(key), str) and len(item[key]) > 10 for key in DESCRIPTION_KEYS)
+    
+    def names_from(self, value, refs: Dict) -> List[str]:
+        """Flatten category values (strings, dicts, GraphQL edges) into names"""
+        value = self.resolve(value, refs)
+        
+        if isinstance(value, str):
+            return [value]
+        if isinstance(value, dict):
+            if 'edges' in value:
+                return self.names_from([edge.get('node') for edge in value['edges'] if isinstance(edge, dict)], refs)
+            name = value.get('name') or value.get('title')
+            return [name] if isinstance(name, str) else []
+        if isinstance(value, list):
+            names = []
+            for entry in value:
+                names.extend(self.names_from(entry, refs))
+            return names
+        return []
+    
+    def to_tool(self, item: Dict, refs: Dict, url: str, source: str) -> Optional[Dict]:
+        """Map one embedded item to the scrapers' tool dict format"""
+        name = next(item[key] for key in NAME_KEYS if isinstance(item.get(key), str)).strip()
+        description = next((item[key].strip() for key in DESCRIPTION_KEYS
+                            if isinstance(item.get(key), str) and len(item[key]) > 10), '')
+        
+        link = next((item[key] for key in LINK_KEYS if isinstance(item.get(key), str) and item[key]), '')
+        if not link:
+            slug = item.get('slug') or item.get('handle')
+            template = SLUG_LINKS.get(source)
+            if isinstance(slug, str) and template:
+                link = template.format(slug=slug)
+        if link:
+            link = urljoin(url, link)
+        
+        categories = []
+        for key in CATEGORY_KEYS:
+            for category in self.names_from(item.get(key), refs):
+                category = category.strip()
+                if category and len(category) < 30 and category not in categories:
+                    categories.append(category)
+        
+        return {
+            'name': name,
+            'description': description or "AI tool description not available",
+            'categories': categories[:5],
+            'link': link,
+            'source': source,
+            'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Stage Timing for AI Words Mining System
+轻量级计时：记录各阶段（爬取、分析、处理、通知）的耗时，输出到执行摘要和JSON文件
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class Timeline:
+    """Thread-safe collection of timed spans, aggregated per (stage, label)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.totals = {}
+    
+    def record(self, stage: str, seconds: float, label: Optional[str] = None,
+               start: Optional[float] = None, keep_span: bool = True):
+        """Add a measured duration; keep_span=False only updates the aggregate"""
+        with self._lock:
+            total = self.totals.setdefault((stage, label), {'count': 0, 'seconds': 0.0, 'max': 0.0})
+            total['count'] += 1
+            total['seconds'] += seconds
+            total['max'] = max(total['max'], seconds)
+            
+            if keep_span:
+                offset = (start if start is not None else time.perf_counter() - seconds) - self.origin
+                self.spans.append({
+                    'stage': stage,
+                    'label': label,
+                    'start': round(offset, 3),
+                    'seconds': round(seconds, 3),
+                    'thread': threading.current_thread().name
+                })
+    
+    @contextmanager
+    def span(self, stage: str, label: Optional[str] = None):
+        """Time the enclosed block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, label, start)
+    
+    def timed(self, stage: str, label: Optional[str] = None, keep_span: bool = True):
+        """Decorator form of span; use keep_span=False for per-item functions"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(stage, time.perf_counter() - start, label, start, keep_span)
+            return wrapper
+        return decorator
+    
+    def stage_totals(self) -> List[Dict]:
+        """Aggregated rows, slowest first"""
+        with self._lock:
+            rows = [{'stage': stage, 'label': label, **total} for (stage, label), total in self.totals.items()]
+        return sorted(rows, key=lambda row: row['seconds'], reverse=True)
+    
+    def to_markdown(self) -> str:
+        rows = self.stage_totals()
+        if not rows:
+            return "No timings recorded"
+        
+        lines = ["| Stage | Target | Count | Total (s) | Max (s) |", "|-------|--------|-------|-----------|---------|"]
+        for row in rows:
+            lines.append(f"| {row['stage']} | {row['label'] or '-'} | {row['count']} | "
+                         f"{row['seconds']:.2f} | {row['max']:.2f} |")
+        return "\n".join(lines)
+    
+    def save(self, path: str):
+        """Write stage totals and raw spans as JSON"""
+        report = {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'elapsed': round(time.perf_counter() - self.origin, 3),
+            'stages': [{**row, 'seconds': round(row['seconds'], 3), 'max': round(row['max'], 3)}
+                       for row in self.stage_totals()],
+            'spans': list(self.spans)
+        }
+        
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"⏱️ Stage timings saved to {path}")
+        except OSError as e:
+            print(f"Warning: could not save timings: {e}")
+
+
+# One timeline per process, shared by every component
+timeline = Timeline()
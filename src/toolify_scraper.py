@@ -1,22 +1,43 @@
 import requests
 import time
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Optional, Iterator
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from config import Config
+from src.driver_pool import ChromeDriverPool, get_chromedriver_path
+from src.page_readiness import PageReadiness
+from src.html_parsing import parse_html
+from src.structured_data import StructuredDataExtractor
+from src.resource_blocking import ResourceBlocker
+from src.seen_index import SeenToolsIndex
+from src.js_extractor import JSCardExtractor
+from src.async_http import AsyncHTTPEngine
+from src.http_cache import HTTPCache, mount_http_cache
+from src.retry_policy import retry_policy
+from src.timing import timeline
+from src.page_artifacts import PageArtifactStore
 import json
-import re
 
 class ToolifyScraper:
     """Scraper specifically designed for toolify.ai"""
     
-    def __init__(self):
+    def __init__(self, driver_pool: Optional[ChromeDriverPool] = None, http_cache: Optional[HTTPCache] = None,
+                 seen_index: Optional[SeenToolsIndex] = None, page_artifacts: Optional[PageArtifactStore] = None):
         self.config = Config()
+        self.seen_index = seen_index or SeenToolsIndex()
+        # Pages the multi-site scraper already fetched or rendered this run
+        self.page_artifacts = page_artifacts
+        self.js_extractor = JSCardExtractor()
+        if http_cache is None and self.config.ENABLE_HTTP_CACHE:
+            http_cache = HTTPCache()
+        self.http_cache = http_cache
+        self.driver_pool = driver_pool
+        self.readiness = PageReadiness()
+        self.readiness_stats = {}
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -26,6 +47,10 @@ class ToolifyScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        mount_http_cache(self.session, self.http_cache)
+        self.http_engine = AsyncHTTPEngine(headers=self.session.headers, http_cache=self.http_cache)
+        self.structured_extractor = StructuredDataExtractor()
+        self.resource_blocker = ResourceBlocker()
         
     def setup_driver(self) -> webdriver.Chrome:
         """Setup Chrome driver for Toolify.ai"""
@@ -38,10 +63,11 @@ class ToolifyScraper:
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        self.resource_blocker.apply_options(chrome_options)
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         driver = webdriver.Chrome(
-            service=webdriver.chrome.service.Service(ChromeDriverManager().install()),
+            service=webdriver.chrome.service.Service(get_chromedriver_path()),
             options=chrome_options
         )
         
@@ -50,77 +76,106 @@ class ToolifyScraper:
         
         return driver
     
-    def scrape_with_selenium(self, url: str) -> List[Dict]:
+    @contextmanager
+    def driver_session(self):
+        """Lease a driver from the shared pool, or launch a one-off driver"""
+        if self.driver_pool:
+            with self.driver_pool.lease() as driver:
+                yield driver
+            return
+        
+        driver = self.setup_driver()
+        try:
+            yield driver
+        finally:
+            driver.quit()
+    
+    def scrape_with_selenium(self, url: str, cancelled: Optional[threading.Event] = None) -> List[Dict]:
         """Scrape Toolify.ai using Selenium"""
         tools_data = []
-        driver = None
+        
+        if self.page_artifacts and self.page_artifacts.has(url, 'selenium'):
+            # The multi-site scraper already rendered this page; scrape_artifacts re-parsed it
+            print("♻️ Toolify.ai was already rendered this run, skipping Chrome")
+            return []
+        
+        # Try different selectors for Toolify.ai tool cards
+        possible_selectors = [
+            '.tool-card',
+            '[data-testid="tool-card"]',
+            '.ai-tool-card',
+            '.grid-item',
+            '.tool-item',
+            '.tool',
+            'article',
+            '.card',
+            'div[class*="tool"]',
+            'div[class*="card"]'
+        ]
         
         try:
-            driver = self.setup_driver()
-            
-            if self.config.DEBUG_MODE:
-                print(f"Loading Toolify.ai page: {url}")
-            
-            driver.get(url)
-            
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Scroll to load more content
-            for i in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            # Try different selectors for Toolify.ai tool cards
-            possible_selectors = [
-                '.tool-card',
-                '[data-testid="tool-card"]',
-                '.ai-tool-card',
-                '.grid-item',
-                '.tool-item',
-                '.tool',
-                'article',
-                '.card',
-                'div[class*="tool"]',
-                'div[class*="card"]'
-            ]
-            
-            tool_elements = []
-            for selector in possible_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and len(elements) > 5:  # Should have multiple tools
-                        tool_elements = elements
-                        if self.config.DEBUG_MODE:
-                            print(f"Found {len(tool_elements)} tools with selector: {selector}")
-                        break
-                except:
-                    continue
-            
-            if not tool_elements:
-                # Fallback: try to find any links or divs that might contain tools
-                tool_elements = driver.find_elements(By.CSS_SELECTOR, "a[href*='tool'], div[class*='grid'] > div")
+            with self.driver_session() as driver:
+                # A hedged scrape may already have been won by the requests path
+                if cancelled and cancelled.is_set():
+                    return []
+                
                 if self.config.DEBUG_MODE:
-                    print(f"Fallback: Found {len(tool_elements)} potential tool elements")
-            
-            for element in tool_elements[:50]:  # Limit to 50 tools
-                try:
-                    tool_data = self.extract_tool_data_selenium(element)
-                    if tool_data and tool_data['name'] and tool_data['name'] != "Unknown":
-                        tools_data.append(tool_data)
-                except Exception as e:
+                    print(f"Loading Toolify.ai page: {url}")
+                
+                self.resource_blocker.configure(driver, url)
+                start_time = time.time()
+                retry_policy.call('selenium', lambda: driver.get(url))
+                load_seconds = time.time() - start_time
+                
+                # Wait for tool cards and scroll until no more load
+                should_stop = self.seen_index.scroll_stop_check(
+                    'toolify.ai', lambda d, count: self.js_extractor.tail_cards(d, 'toolify.ai', count)
+                )
+                if cancelled:
+                    seen_stop = should_stop
+                    should_stop = lambda d: cancelled.is_set() or bool(seen_stop and seen_stop(d))
+                readiness = self.readiness.wait_until_ready(driver, possible_selectors, 50, should_stop)
+                self.readiness_stats[url] = readiness
+                self.resource_blocker.record(driver, url, load_seconds)
+                print(f"⏱️ Toolify.ai ready in {readiness['waited']}s "
+                      f"({readiness['cards']} cards, {readiness['scroll_rounds']} scrolls)")
+                
+                if cancelled and cancelled.is_set():
+                    return []
+                
+                tool_elements = []
+                for selector in possible_selectors:
+                    try:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                        if elements and len(elements) > 5:  # Should have multiple tools
+                            tool_elements = elements
+                            if self.config.DEBUG_MODE:
+                                print(f"Found {len(tool_elements)} tools with selector: {selector}")
+                            break
+                    except:
+                        continue
+                
+                if not tool_elements:
+                    # Fallback: try to find any links or divs that might contain tools
+                    tool_elements = driver.find_elements(By.CSS_SELECTOR, "a[href*='tool'], div[class*='grid'] > div")
                     if self.config.DEBUG_MODE:
-                        print(f"Error extracting tool data: {e}")
-                    continue
-            
-            return tools_data
-            
+                        print(f"Fallback: Found {len(tool_elements)} potential tool elements")
+                
+                for element in tool_elements[:50]:  # Limit to 50 tools
+                    try:
+                        tool_data = self.extract_tool_data_selenium(element)
+                        if tool_data and tool_data['name'] and tool_data['name'] != "Unknown":
+                            tools_data.append(tool_data)
+                    except Exception as e:
+                        if self.config.DEBUG_MODE:
+                            print(f"Error extracting tool data: {e}")
+                        continue
+                
+                return tools_data
+                
         except Exception as e:
             print(f"Error scraping Toolify.ai with Selenium: {e}")
             return []
-        finally:
-            if driver:
-                driver.quit()
     
     def extract_tool_data_selenium(self, element) -> Optional[Dict]:
         """Extract tool data from a single element using Selenium"""
@@ -208,52 +263,190 @@ class ToolifyScraper:
                 print(f"Error extracting tool data from element: {e}")
             return None
     
+    def fetch_page(self, url: str, timeout: float = 15):
+        """Fetch a page over the async engine (or the plain session)"""
+        response = self.page_artifacts.response(url) if self.page_artifacts else None
+        if response is not None:
+            return response
+        
+        if self.config.ENABLE_ASYNC_HTTP:
+            response = self.http_engine.fetch(url, timeout=timeout)
+        else:
+            response = retry_policy.call('http', lambda: self.session.get(url, timeout=timeout))
+        response.raise_for_status()
+        return response
+    
+    def scrape_structured(self, url: str) -> List[Dict]:
+        """Read the listing from embedded JSON so no browser is needed"""
+        if not self.config.ENABLE_STRUCTURED_DATA:
+            return []
+        
+        try:
+            response = self.fetch_page(url)
+            return self.structured_extractor.extract(response.content, url, 'toolify.ai', 50)
+        except Exception as e:
+            if self.config.DEBUG_MODE:
+                print(f"No embedded data on Toolify.ai: {e}")
+            return []
+    
     def scrape_with_requests(self, url: str) -> List[Dict]:
         """Fallback scraping method using requests"""
-        tools_data = []
-        
         try:
             if self.config.DEBUG_MODE:
                 print(f"Scraping Toolify.ai with requests: {url}")
             
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            response = self.fetch_page(url)
             
-            # Try to find tool containers
-            possible_selectors = [
-                'div[class*="tool"]',
-                'div[class*="card"]',
-                'article',
-                'div[class*="grid"] > div',
-                'a[href*="tool"]'
-            ]
-            
-            tool_elements = []
-            for selector in possible_selectors:
-                elements = soup.select(selector)
-                if elements and len(elements) > 5:
-                    tool_elements = elements
-                    if self.config.DEBUG_MODE:
-                        print(f"Found {len(tool_elements)} tools with selector: {selector}")
-                    break
-            
-            for element in tool_elements[:50]:
-                tool_data = self.extract_tool_data_bs4(element)
-                if tool_data and tool_data['name'] and tool_data['name'] != "Unknown":
-                    tools_data.append(tool_data)
-            
-            return tools_data
+            return self.parse_listing(response.content)
             
         except Exception as e:
             print(f"Error scraping Toolify.ai with requests: {e}")
             return []
     
+    def parse_listing(self, html, max_items: int = 50) -> List[Dict]:
+        """Extract tools from a server-rendered Toolify.ai listing page"""
+        tools_data = []
+        soup = parse_html(html, 'toolify.ai')
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        # Try to find tool containers
+        possible_selectors = [
+            'div[class*="tool"]',
+            'div[class*="card"]',
+            'article',
+            'div[class*="grid"] > div',
+            'a[href*="tool"]'
+        ]
+        
+        tool_elements = []
+        for selector in possible_selectors:
+            elements = soup.select(selector)
+            if elements and len(elements) > 5:
+                tool_elements = elements
+                if self.config.DEBUG_MODE:
+                    print(f"Found {len(tool_elements)} tools with selector: {selector}")
+                break
+        
+        for element in tool_elements[:max_items]:
+            tool_data = self.extract_tool_data_bs4(element)
+            if tool_data and tool_data['name'] and tool_data['name'] != "Unknown":
+                tools_data.append(tool_data)
+        
+        return tools_data
+    
+    def page_url(self, url: str, page: int) -> str:
+        """URL of the Nth listing page; page 1 is the listing itself"""
+        if page == 1:
+            return url
+        return self.config.TOOLIFY_PAGE_URL_TEMPLATE.format(url=url.rstrip('/'), page=page)
+    
+    def fetch_listing_pages(self, urls: List[str]) -> Dict:
+        """Fetch a window of listing pages together; values are responses or exceptions"""
+        results = {}
+        if self.page_artifacts:
+            for url in urls:
+                response = self.page_artifacts.response(url)
+                if response is not None:
+                    results[url] = response
+        
+        missing = [url for url in urls if url not in results]
+        if self.config.ENABLE_ASYNC_HTTP:
+            results.update(self.http_engine.fetch_many(missing, timeout=15))
+            return results
+        
+        for url in missing:
+            try:
+                results[url] = self.fetch_page(url)
+            except Exception as e:
+                results[url] = e
+        return results
+    
+    def iter_paginated(self, url: str, cancelled: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """Yield unique tools page by page, fetching HTTP_PER_HOST_LIMIT pages at a time"""
+        window = max(1, self.config.HTTP_PER_HOST_LIMIT)
+        max_pages = max(1, self.config.TOOLIFY_MAX_PAGES)
+        knows_site = self.seen_index.has_site('toolify.ai')
+        seen_names = set()
+        yielded = 0
+        
+        for first_page in range(1, max_pages + 1, window):
+            if cancelled and cancelled.is_set():
+                # A hedged scrape was already won by Selenium
+                return
+            
+            pages = list(range(first_page, min(first_page + window, max_pages + 1)))
+            urls = [self.page_url(url, page) for page in pages]
+            
+            with timeline.span('scrape.pages', 'toolify.ai'):
+                responses = self.fetch_listing_pages(urls)
+            
+            # Walk the window in page order so stopping stays deterministic
+            for page, page_url in zip(pages, urls):
+                response = responses.get(page_url)
+                if response is None or isinstance(response, Exception) or response.status_code != 200:
+                    print(f"📄 Toolify.ai page {page} unavailable, stopping pagination")
+                    return
+                
+                page_tools = (self.structured_extractor.extract(response.content, page_url, 'toolify.ai', 100)
+                              or self.parse_listing(response.content, max_items=100))
+                new_tools = [tool for tool in page_tools if tool['name'].lower() not in seen_names]
+                
+                if not new_tools:
+                    # Empty page, or the site ignored the page parameter and repeated earlier results
+                    print(f"📄 Toolify.ai page {page} has no new tools, stopping pagination")
+                    return
+                
+                for tool in new_tools:
+                    seen_names.add(tool['name'].lower())
+                    yield tool
+                    yielded += 1
+                    if yielded >= self.config.MAX_TOTAL_ITEMS:
+                        return
+                
+                if self.config.DEBUG_MODE:
+                    print(f"📄 Toolify.ai page {page}: {len(new_tools)} tools")
+                
+                # Listings are newest first: once a whole page was collected before, later pages are older still
+                if knows_site and all(self.seen_index.is_seen('toolify.ai', tool) for tool in new_tools):
+                    print(f"📄 Toolify.ai page {page} was fully collected in earlier runs, stopping pagination")
+                    return
+    
+    def scrape_artifacts(self, url: str) -> List[Dict]:
+        """Re-parse HTML the multi-site scraper captured for this URL earlier in the run"""
+        if not self.page_artifacts:
+            return []
+        
+        for source in ('selenium', 'http'):
+            artifact = self.page_artifacts.get(url, source)
+            if not artifact:
+                continue
+            
+            tools = (self.structured_extractor.extract(artifact['html'], url, 'toolify.ai', 50)
+                     or self.parse_listing(artifact['html']))
+            print(f"♻️ Re-parsed {source} HTML captured at {artifact['fetched_at']}: {len(tools)} tools")
+            if tools:
+                return tools
+        
+        return []
+    
+    def scrape_paginated(self, url: str, cancelled: Optional[threading.Event] = None) -> List[Dict]:
+        """Crawl up to TOOLIFY_MAX_PAGES listing pages without a browser"""
+        if not self.config.ENABLE_TOOLIFY_PAGINATION:
+            return []
+        
+        start_time = time.time()
+        try:
+            tools_data = list(self.iter_paginated(url, cancelled))
+        except Exception as e:
+            print(f"Error crawling Toolify.ai pages: {e}")
+            return []
+        
+        print(f"📄 Paginated crawl: {len(tools_data)} tools in {time.time() - start_time:.1f}s")
+        return tools_data
+    
     def extract_tool_data_bs4(self, element) -> Optional[Dict]:
         """Extract tool data using BeautifulSoup"""
         try:
@@ -318,13 +511,19 @@ class ToolifyScraper:
         
         print(f"🕷️ Starting to scrape Toolify.ai: {url}")
         
-        # Try Selenium first
-        tools_data = self.scrape_with_selenium(url)
-        
-        # If Selenium failed or returned few results, try requests
-        if len(tools_data) < 5:
-            print("🔄 Selenium returned few results, trying requests method...")
-            tools_data.extend(self.scrape_with_requests(url))
+        if self.config.ENABLE_HEDGED_SCRAPING:
+            # Chrome starts right away, so its startup overlaps the plain-HTTP attempts
+            tools_data = self.scrape_hedged(url)
+        else:
+            # Only launch Chrome when none of the plain-HTTP paths finds anything
+            tools_data = self.scrape_artifacts(url) or self.scrape_paginated(url) or self.scrape_structured(url)
+            if not tools_data:
+                tools_data = self.scrape_with_selenium(url)
+            
+            # If Selenium failed or returned few results, try requests
+            if len(tools_data) < 5:
+                print("🔄 Selenium returned few results, trying requests method...")
+                tools_data.extend(self.scrape_with_requests(url))
         
         # Remove duplicates
         seen_names = set()
@@ -334,6 +533,8 @@ class ToolifyScraper:
                 seen_names.add(tool['name'])
                 unique_tools.append(tool)
         
+        self.seen_index.mark(unique_tools)
+        
         print(f"✅ Successfully scraped {len(unique_tools)} unique AI tools from Toolify.ai")
         
         if self.config.DEBUG_MODE and unique_tools:
@@ -343,6 +544,50 @@ class ToolifyScraper:
         
         return unique_tools
     
+    def scrape_plain(self, url: str, cancelled: Optional[threading.Event] = None) -> List[Dict]:
+        """Pages captured earlier in this run, then a paginated plain-HTTP crawl, then embedded JSON on the single page"""
+        tools_data = (self.scrape_artifacts(url) or self.scrape_paginated(url, cancelled)
+                      or self.scrape_structured(url))
+        if not tools_data and not self.config.ENABLE_TOOLIFY_PAGINATION:
+            # Pagination already parses page 1; without it, parse the single page here
+            tools_data = self.scrape_with_requests(url)
+        return tools_data
+    
+    def scrape_hedged(self, url: str) -> List[Dict]:
+        """Start Chrome alongside the plain-HTTP path; the first path with HEDGE_MIN_TOOLS tools wins"""
+        cancelled = threading.Event()
+        start_time = time.time()
+        results = {}
+        
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = {
+            executor.submit(self.scrape_plain, url, cancelled): 'requests',
+            executor.submit(self.scrape_with_selenium, url, cancelled): 'selenium'
+        }
+        
+        try:
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result() or []
+                except Exception as e:
+                    print(f"Hedged {path} scrape failed: {e}")
+                    results[path] = []
+                
+                # A thin server-rendered page (a few teaser cards) keeps waiting for the full browser listing
+                if len(results[path]) >= self.config.HEDGE_MIN_TOOLS:
+                    elapsed = time.time() - start_time
+                    timeline.record('scrape.hedged', elapsed, path)
+                    print(f"🏁 Hedged scrape: {path} won with {len(results[path])} tools in {elapsed:.1f}s")
+                    return results[path]
+        finally:
+            # Stop the loser: the browser and the page crawl notice the event between steps
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        print("🔄 Neither plain HTTP nor Selenium returned enough tools, combining both")
+        return results.get('requests', []) + results.get('selenium', [])
+    
     def save_to_json(self, tools_data: List[Dict], filename: str = "toolify_scraped_tools.json"):
         """Save scraped data to JSON file"""
         try:
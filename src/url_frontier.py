@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+URL Frontier for AI Words Mining System
+深度爬取的待爬队列：链接按得分优先出队，已访问的工具详情页记录在持久化的布隆过滤器中，跨运行去重；
+待爬链接、进行中的链接和每个URL的状态定期写入检查点，下次运行从中断处继续
+"""
+
+import os
+import re
+import json
+import math
+import heapq
+import base64
+import hashlib
+import itertools
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, urljoin
+from config import Config
+
+# Tool detail pages per site; anything else is a listing page that is only expanded
+DETAIL_PATTERNS = {
+    'toolify.ai': re.compile(r'^/tool/[^/]+$'),
+    'producthunt.com': re.compile(r'^/(posts|products)/[^/]+$'),
+    'futuretools.io': re.compile(r'^/tools/[^/]+$'),
+    'betalist.com': re.compile(r'^/startups/[^/]+$'),
+    'generic': re.compile(r'/(tool|tools|ai-tools|product|products|app|apps)/[^/]+$')
+}
+
+# Listing pages worth expanding: categories, tags, "new" feeds and pagination
+LISTING_PATTERN = re.compile(r'/(category|categories|tag|tags|topics|new|newly-added|latest|collections?)(/|$)|[?&]page=')
+
+EXCLUDE_PATTERN = re.compile(
+    r'/(login|signin|sign-in|register|signup|sign-up|contact|about|privacy|terms|cart|checkout|account|settings)(/|$)'
+    r'|\.(jpg|jpeg|png|gif|svg|webp|pdf|doc|docx|zip|mp4|css|js)$',
+    re.IGNORECASE
+)
+
+RELEVANT_WORDS = ('ai', 'gpt', 'tool', 'agent', 'assistant', 'generator', 'llm', 'app', 'copilot', 'chat')
+
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|ref|fbclid|gclid|mc_cid|mc_eid|source)$', re.IGNORECASE)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter; k bit positions by double hashing one SHA-256 digest"""
+    
+    def __init__(self, capacity: int, error_rate: float, bits: Optional[bytes] = None, count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        byte_count = (self.size + 7) // 8
+        self.bits = bytearray(bits) if bits and len(bits) == byte_count else bytearray(byte_count)
+        self.count = count if bits and len(bits) == byte_count else 0
+    
+    def positions(self, key: str):
+        digest = hashlib.sha256(key.encode('utf-8')).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:16], 'big') | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+    
+    def add(self, key: str) -> bool:
+        """Set the key's bits; False if it was (probably) already present"""
+        added = False
+        for position in self.positions(key):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position // 8] & (1 << position % 8) for position in self.positions(key))
+    
+    def to_dict(self) -> Dict:
+        return {
+            'capacity': self.capacity,
+            'error_rate': self.error_rate,
+            'count': self.count,
+            'bits': base64.b64encode(bytes(self.bits)).decode('ascii')
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict, capacity: int, error_rate: float) -> 'BloomFilter':
+        """Restore a saved filter; a different capacity or error rate starts an empty one"""
+        if data.get('capacity') != capacity or data.get('error_rate') != error_rate:
+            return cls(capacity, error_rate)
+        return cls(capacity, error_rate, base64.b64decode(data.get('bits', '')), data.get('count', 0))
+
+
+class URLFrontier:
+    """Priority queue of links to crawl, deduplicated per run and against detail pages visited in earlier runs"""
+    
+    def __init__(self, strategy: str = None, max_depth: int = None, path: str = None):
+        self.config = Config()
+        self.strategy = (strategy or self.config.DEEP_CRAWL_STRATEGY).lower()
+        self.max_depth = self.config.DEEP_CRAWL_MAX_DEPTH if max_depth is None else max_depth
+        self.path = path or self.config.DEEP_CRAWL_FRONTIER_PATH
+        
+        self.heap = []
+        self.queued = set()
+        self._order = itertools.count()
+        self.visited = BloomFilter(self.config.DEEP_CRAWL_BLOOM_CAPACITY, self.config.DEEP_CRAWL_BLOOM_ERROR_RATE)
+        
+        # Popped but not yet finished; checkpointed as pending so a killed run loses nothing
+        self.in_flight = {}
+        # Per URL: listing pages crawled recently and pages that failed, with their attempt count
+        self.pages = {}
+        self.resumed = 0
+        self.load()
+        
+        self.stats = {
+            'queued': 0,
+            'skipped_visited': 0,
+            'skipped_recent': 0,
+            'skipped_filtered': 0,
+            'failed': 0
+        }
+    
+    def load(self):
+        """Restore the visited-URL filter and the links left over from the last run"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        self.visited = BloomFilter.from_dict(saved.get('visited', {}), self.config.DEEP_CRAWL_BLOOM_CAPACITY,
+                                             self.config.DEEP_CRAWL_BLOOM_ERROR_RATE)
+        self.pages = saved.get('pages', {})
+        for entry in saved.get('pending', []):
+            self.enqueue(entry['url'], entry['depth'], entry['score'])
+        self.resumed = len(self.heap)
+    
+    def save(self):
+        """Checkpoint the filter, pending and in-flight links and per-URL state so the next run can carry on"""
+        entries = [(priority, order, url, depth, score) for priority, order, url, depth, score in self.heap]
+        entries += [(self.priority(score, depth), 0, url, depth, score) for url, (depth, score) in self.in_flight.items()]
+        pending = [{'url': url, 'depth': depth, 'score': score}
+                   for _, _, url, depth, score in heapq.nsmallest(self.config.DEEP_CRAWL_FRONTIER_SIZE, entries)]
+        
+        checkpoint = {
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'visited': self.visited.to_dict(),
+            'pending': pending,
+            'pages': {url: page for url, page in self.pages.items()
+                      if page['state'] == 'failed' or self.crawled_recently(url)}
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not save deep crawl frontier: {e}")
+    
+    def crawled_recently(self, url: str) -> bool:
+        """A listing page fetched within DEEP_CRAWL_RECRAWL_HOURS is not fetched again"""
+        page = self.pages.get(url)
+        if not page or page['state'] != 'done':
+            return False
+        cutoff = datetime.now() - timedelta(hours=self.config.DEEP_CRAWL_RECRAWL_HOURS)
+        return page['at'] >= cutoff.isoformat(timespec='seconds')
+    
+    def gave_up(self, url: str) -> bool:
+        page = self.pages.get(url)
+        return bool(page) and page['state'] == 'failed' and page['attempts'] >= self.config.DEEP_CRAWL_MAX_ATTEMPTS
+    
+    def normalize(self, url: str) -> str:
+        """Drop fragments, tracking parameters and trailing slashes so one page has one key"""
+        parts = urlparse(url)
+        query = urlencode(sorted((key, value) for key, value in parse_qsl(parts.query) if not TRACKING_PARAMS.match(key)))
+        path = parts.path.rstrip('/') or '/'
+        return urlunparse((parts.scheme.lower(), parts.netloc.lower(), path, '', query, ''))
+    
+    def site_key(self, url: str) -> str:
+        host = urlparse(url).netloc.lower()
+        return next((key for key in DETAIL_PATTERNS if key in host), 'generic')
+    
+    def is_detail(self, url: str) -> bool:
+        """True for a single tool's page"""
+        return bool(DETAIL_PATTERNS[self.site_key(url)].search(urlparse(url).path))
+    
+    def score(self, url: str, anchor: str, depth: int) -> float:
+        """Higher first: tool detail pages, then listing pages, boosted by AI-related words, shallow before deep"""
+        path = urlparse(url).path.lower()
+        words = set(re.findall(r'[a-z]+', f"{path} {(anchor or '').lower()}"))
+        
+        score = 10.0 if self.is_detail(url) else 4.0 if LISTING_PATTERN.search(url) else 0.0
+        score += min(3, sum(1 for word in RELEVANT_WORDS if word in words))
+        return score - depth
+    
+    def priority(self, score: float, depth: int) -> Tuple[float, float]:
+        # heapq pops the smallest key
+        if self.strategy == 'bfs':
+            return depth, -score
+        if self.strategy == 'dfs':
+            return -depth, -score
+        return -score, depth
+    
+    def enqueue(self, url: str, depth: int, score: float):
+        self.queued.add(url)
+        heapq.heappush(self.heap, (self.priority(score, depth), next(self._order), url, depth, score))
+    
+    def push(self, url: str, depth: int, anchor: str = '', base_url: str = None) -> bool:
+        """Queue a link found on a page of the same host; False if it was filtered or already known"""
+        if base_url:
+            if urlparse(urljoin(base_url, url)).netloc.lower() != urlparse(base_url).netloc.lower():
+                return False
+            url = urljoin(base_url, url)
+        if not url.startswith(('http://', 'https://')):
+            return False
+        
+        url = self.normalize(url)
+        if url in self.queued:
+            return False
+        if depth > self.max_depth or EXCLUDE_PATTERN.search(urlparse(url).path):
+            self.stats['skipped_filtered'] += 1
+            return False
+        # Detail pages are remembered for good; listing pages change and are re-crawled once they are stale
+        if self.is_detail(url) and url in self.visited:
+            self.stats['skipped_visited'] += 1
+            return False
+        if self.crawled_recently(url) or self.gave_up(url):
+            self.stats['skipped_recent'] += 1
+            return False
+        
+        self.enqueue(url, depth, self.score(url, anchor, depth))
+        self.stats['queued'] += 1
+        return True
+    
+    def pop_batch(self, count: int) -> List[Tuple[str, int]]:
+        """The next (url, depth) pairs in strategy order"""
+        batch = []
+        while self.heap and len(batch) < count:
+            _, _, url, depth, score = heapq.heappop(self.heap)
+            self.in_flight[url] = (depth, score)
+            batch.append((url, depth))
+        return batch
+    
+    def complete(self, url: str, ok: bool):
+        """Record a finished page; failures are re-queued with a lower score until DEEP_CRAWL_MAX_ATTEMPTS"""
+        depth, score = self.in_flight.pop(url, (0, 0.0))
+        now = datetime.now().isoformat(timespec='seconds')
+        
+        if ok:
+            if self.is_detail(url):
+                self.visited.add(url)
+                self.pages.pop(url, None)
+            else:
+                self.pages[url] = {'state': 'done', 'at': now}
+            return
+        
+        self.stats['failed'] += 1
+        attempts = self.pages.get(url, {}).get('attempts', 0) + 1
+        self.pages[url] = {'state': 'failed', 'at': now, 'attempts': attempts}
+        if attempts < self.config.DEEP_CRAWL_MAX_ATTEMPTS:
+            self.enqueue(url, depth, score - 2 * attempts)
+    
+    def __len__(self) -> int:
+        return len(self.heap)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+测试爬取任务调度器
+验证按主机轮转的排队顺序、全局与每主机并发上限、单任务超时、结果顺序，以及从配置读取的默认值
+"""
+
+import sys
+import os
+import asyncio
+import pytest
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.crawl_scheduler import CrawlScheduler
+
+
+def test_defaults_come_from_config(cache):
+    """未传参数时使用 CRAWL4AI_* 配置，超时为页面等待时间的两倍"""
+    print("🧪 测试默认配置...")
+    cache.configure(CRAWL4AI_MAX_CONCURRENT=4, CRAWL4AI_PER_HOST_LIMIT=0, CRAWL4AI_WAIT_TIMEOUT=5000)
+    scheduler = CrawlScheduler()
+    assert (scheduler.max_concurrent, scheduler.per_host, scheduler.timeout) == (4, 1, 10.0)
+    print("✅ 默认配置正常")
+
+
+def test_fair_order_interleaves_hosts():
+    """大站点的任务与其他主机轮流排队"""
+    print("🧪 测试按主机轮转...")
+    jobs = [(url, None) for url in (
+        'https://a.com/1', 'https://a.com/2', 'https://a.com/3', 'https://b.com/1', 'https://c.com/1', 'https://b.com/2'
+    )]
+    order = CrawlScheduler(max_concurrent=2, per_host=1, timeout=5).fair_order(jobs)
+    assert [jobs[index][0] for index in order] == [
+        'https://a.com/1', 'https://b.com/1', 'https://c.com/1', 'https://a.com/2', 'https://b.com/2', 'https://a.com/3'
+    ]
+    print("✅ 按主机轮转正常")
+
+
+def test_concurrency_limits():
+    """同时运行的任务不超过全局上限，同一主机不超过每主机上限"""
+    print("🧪 测试并发上限...")
+    scheduler = CrawlScheduler(max_concurrent=3, per_host=1, timeout=5)
+    running = {'total': 0, 'peak': 0}
+    per_host = {}
+    host_peaks = {}
+    
+    def job(url):
+        host = url.split('/')[2]
+        
+        async def crawl():
+            running['total'] += 1
+            per_host[host] = per_host.get(host, 0) + 1
+            running['peak'] = max(running['peak'], running['total'])
+            host_peaks[host] = max(host_peaks.get(host, 0), per_host[host])
+            await asyncio.sleep(0.02)
+            running['total'] -= 1
+            per_host[host] -= 1
+            return url
+        return url, crawl
+    
+    urls = [f'https://{host}.com/{page}' for host in 'abcd' for page in range(3)]
+    results = asyncio.run(scheduler.run([job(url) for url in urls]))
+    
+    assert results == urls
+    assert running['peak'] == 3
+    assert max(host_peaks.values()) == 1
+    print("✅ 并发上限正常")
+
+
+def test_timeouts_and_errors_are_returned():
+    """超时和出错的任务以异常形式返回，不影响其他任务"""
+    print("🧪 测试超时和错误...")
+    scheduler = CrawlScheduler(max_concurrent=2, per_host=2, timeout=0.05)
+    
+    async def fast():
+        return 'ok'
+    
+    async def slow():
+        await asyncio.sleep(1)
+    
+    async def broken():
+        raise ValueError('bad page')
+    
+    results = asyncio.run(scheduler.run([
+        ('https://a.com/slow', slow), ('https://a.com/fast', fast), ('https://b.com/broken', broken)
+    ]))
+    
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1] == 'ok'
+    assert isinstance(results[2], ValueError)
+    assert scheduler.report['https://a.com/slow']['status'] == 'timeout'
+    assert scheduler.report['https://a.com/fast']['status'] == 'ok'
+    assert scheduler.report['https://b.com/broken']['status'] == 'error'
+    print("✅ 超时和错误处理正常")
+
+
+if __name__ == "__main__":
+    # 夹具来自 conftest.py，通过 pytest 运行
+    if pytest.main([__file__, '-s', '-q']) == 0:
+        print("🎉 所有调度器测试通过")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+测试磁盘HTTP缓存
+使用本地HTTP服务器验证 ETag 条件请求、304 读取磁盘缓存，以及按时间和大小淘汰缓存
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import requests
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.http_cache import HTTPCache, mount_http_cache
+
+PAGE = b'<html><body><div class="tool-item">Writer AI</div></body></html>'
+ETAG = '"v1"'
+
+
+class ListingHandler(BaseHTTPRequestHandler):
+    """Serves one page with an ETag and answers matching conditional requests with 304"""
+    requests_seen = []
+    
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+    
+    def log_message(self, *args):
+        pass
+
+
+def test_revalidation_serves_body_from_disk():
+    """第二次请求带 If-None-Match，304 时返回磁盘上的内容"""
+    print("🧪 测试304条件请求...")
+    server = HTTPServer(('127.0.0.1', 0), ListingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/tools"
+    ListingHandler.requests_seen = []
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = HTTPCache(cache_dir=tmp_dir)
+            session = requests.Session()
+            session.trust_env = False  # no proxy for the local server
+            mount_http_cache(session, cache)
+            
+            first = session.get(url, timeout=5)
+            second = session.get(url, timeout=5)
+            
+            assert first.status_code == 200 and second.status_code == 200
+            assert second.content == PAGE
+            assert 'If-None-Match' not in ListingHandler.requests_seen[0]
+            assert ListingHandler.requests_seen[1].get('If-None-Match') == ETAG
+            assert cache.stats['stored'] == 1
+            assert cache.stats['hits'] == 1
+            assert cache.stats['bytes_saved'] == len(PAGE)
+    finally:
+        server.shutdown()
+        server.server_close()
+    print("✅ 304条件请求正常")
+
+
+def test_responses_without_validator_are_not_stored():
+    """没有 ETag/Last-Modified 或带 no-store 的响应不缓存"""
+    print("🧪 测试不可缓存的响应...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = HTTPCache(cache_dir=tmp_dir)
+        cache.store('https://example.com/a', 200, {}, PAGE)
+        cache.store('https://example.com/b', 200, {'ETag': ETAG, 'Cache-Control': 'no-store'}, PAGE)
+        cache.store('https://example.com/c', 404, {'ETag': ETAG}, PAGE)
+        assert cache.stats['stored'] == 0
+        assert cache.get('https://example.com/a') is None
+    print("✅ 不可缓存的响应被忽略")
+
+
+def test_eviction_by_age_and_size():
+    """过期条目被删除；超过大小上限时先删最旧的条目"""
+    print("🧪 测试缓存淘汰...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = HTTPCache(cache_dir=tmp_dir, max_bytes=len(PAGE) * 2, max_age=3600)
+        for name in ('old', 'middle', 'new'):
+            cache.store(f'https://example.com/{name}', 200, {'ETag': ETAG}, PAGE)
+            time.sleep(0.01)
+        
+        # Over the size limit: the oldest entry goes first
+        cache.evict()
+        assert cache.get('https://example.com/old') is None
+        assert cache.get('https://example.com/middle') is not None
+        assert cache.get('https://example.com/new') is not None
+        
+        # Past max_age: get() drops the entry
+        expired = HTTPCache(cache_dir=tmp_dir, max_bytes=len(PAGE) * 2, max_age=0)
+        time.sleep(0.01)
+        assert expired.get('https://example.com/new') is None
+        assert expired.stats['evicted'] == 2
+    print("✅ 缓存淘汰正常")
+
+
+if __name__ == "__main__":
+    test_revalidation_serves_body_from_disk()
+    test_responses_without_validator_are_not_stored()
+    test_eviction_by_age_and_size()
+    print("🎉 所有HTTP缓存测试通过")
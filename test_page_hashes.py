@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+测试页面哈希索引
+验证页面未变化时复用上次的工具、条目过期、只保存已分析页面的哈希，以及结构化列表的哈希
+"""
+
+import sys
+import os
+import json
+import pytest
+from datetime import datetime, timedelta
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from config import Config
+from src.page_hashes import PageHashIndex
+
+LISTING = "<html><body>" + "".join(
+    f"<div class='tool-item'><h3>Tool {index}</h3><p>An AI assistant for task number {index}</p></div>"
+    for index in range(10)
+) + "</body></html>"
+TOOLS = [{'name': 'Writer AI', 'description': 'Writes blog posts'}, {'name': 'Clip Maker', 'description': 'Cuts clips'}]
+
+
+def index_for(cache):
+    cache.configure(ENABLE_PAGE_HASHES=True, PAGE_HASH_MIN_CHARS=200)
+    return PageHashIndex(path=cache.path('page_hashes.json'))
+
+
+def test_unchanged_page_reuses_tools(cache):
+    """哈希相同时返回上次的工具，并标记为非新工具；内容变化时返回 None"""
+    print("🧪 测试未变化页面复用...")
+    index = index_for(cache)
+    digest = index.digest_html(LISTING)
+    assert index.unchanged('https://example.com/new', digest) is None
+    index.remember('https://example.com/new', digest, TOOLS)
+    index.commit(TOOLS)
+    
+    # Scripts and comments do not count as a change
+    rerun = index_for(cache)
+    noisy = LISTING.replace('<body>', '<body><script>var nonce = "abc123";</script><!-- build 42 -->')
+    reused = rerun.unchanged('https://example.com/new', rerun.digest_html(noisy))
+    assert [tool['name'] for tool in reused] == ['Writer AI', 'Clip Maker']
+    assert all(tool['unchanged_page'] and not tool['is_new'] for tool in reused)
+    assert rerun.stats['unchanged'] == 1 and rerun.stats['tools_reused'] == 2
+    
+    changed = rerun.digest_html(LISTING.replace('Tool 3', 'Tool 33'))
+    assert rerun.unchanged('https://example.com/new', changed) is None
+    
+    # Client-rendered shells are never compared
+    assert rerun.digest_html("<html><body><div id='root'></div></body></html>") is None
+    print("✅ 未变化页面复用正常")
+
+
+def test_entries_expire(cache):
+    """提取时间超过 PAGE_HASH_MAX_AGE_DAYS 的条目在加载时被丢弃"""
+    print("🧪 测试条目过期...")
+    index = index_for(cache)
+    digest = index.digest_html(LISTING)
+    old = (datetime.now() - timedelta(days=Config.PAGE_HASH_MAX_AGE_DAYS + 1)).strftime('%Y-%m-%d')
+    today = datetime.now().strftime('%Y-%m-%d')
+    with open(index.path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'https://example.com/old': {'hash': digest, 'extracted_at': old, 'checked_at': today, 'tools': TOOLS},
+            'https://example.com/fresh': {'hash': digest, 'extracted_at': today, 'checked_at': today, 'tools': TOOLS}
+        }, f)
+    
+    reloaded = index_for(cache)
+    assert reloaded.unchanged('https://example.com/old', digest) is None
+    assert reloaded.unchanged('https://example.com/fresh', digest) is not None
+    print("✅ 条目过期正常")
+
+
+def test_commit_only_analyzed_pages(cache):
+    """只有全部工具都分析过的页面才保存哈希，其余页面下次重新提取"""
+    print("🧪 测试只保存已分析页面...")
+    index = index_for(cache)
+    digest = index.digest_html(LISTING)
+    index.remember('https://example.com/a', digest, TOOLS)
+    index.remember('https://example.com/b', digest, [{'name': 'Voice Clone', 'description': 'Clones voices'}])
+    index.commit([{'name': 'writer ai'}, {'name': 'Clip Maker'}])
+    
+    rerun = index_for(cache)
+    assert rerun.unchanged('https://example.com/a', digest) is not None
+    assert rerun.unchanged('https://example.com/b', digest) is None
+    assert index.pending == {}
+    print("✅ 只保存已分析页面正常")
+
+
+def test_digest_tools_ignores_scrape_time(cache):
+    """结构化列表的哈希不受 scraped_at 影响，工具变化时哈希变化"""
+    print("🧪 测试结构化列表哈希...")
+    index = index_for(cache)
+    first = [{**tool, 'scraped_at': '2024-01-01T00:00:00'} for tool in TOOLS]
+    second = [{**tool, 'scraped_at': '2024-01-02T00:00:00'} for tool in TOOLS]
+    assert index.digest_tools(first) == index.digest_tools(second)
+    assert index.digest_tools(first) != index.digest_tools(first[:1])
+    assert index.digest_tools([]) is None
+    print("✅ 结构化列表哈希正常")
+
+
+if __name__ == "__main__":
+    # 夹具来自 conftest.py，通过 pytest 运行
+    if pytest.main([__file__, '-s', '-q']) == 0:
+        print("🎉 所有页面哈希测试通过")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+测试统一重试策略
+验证退避时间上限、Retry-After、可重试错误的判断，以及重试次数用尽后的行为
+"""
+
+import sys
+import os
+import asyncio
+import requests
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.retry_policy import RetryPolicy
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def make_policy():
+    policy = RetryPolicy()
+    policy.max_retries = 3
+    policy.base_delay = 0.001
+    policy.max_delay = 0.004
+    return policy
+
+
+def test_backoff_bounds():
+    """抖动后的等待时间不超过 base * 2^attempt，也不超过 RETRY_MAX_DELAY"""
+    print("🧪 测试退避时间上限...")
+    policy = RetryPolicy()
+    policy.base_delay = 1.0
+    policy.max_delay = 10.0
+    for attempt in range(8):
+        cap = min(policy.max_delay, policy.base_delay * 2 ** attempt)
+        assert all(0 <= policy.delay(attempt) <= cap for _ in range(200))
+    
+    # A server's Retry-After wins, but is still capped
+    assert policy.delay(0, FakeResponse(429, {'Retry-After': '3'})) == 3.0
+    assert policy.delay(0, FakeResponse(429, {'Retry-After': '600'})) == policy.max_delay
+    print("✅ 退避时间上限正常")
+
+
+def test_retryable_classification():
+    """超时、连接错误、429/5xx 可重试；4xx 等错误不重试"""
+    print("🧪 测试可重试错误判断...")
+    policy = RetryPolicy()
+    assert policy.is_retryable(requests.Timeout())
+    assert policy.is_retryable(requests.ConnectionError())
+    assert policy.is_retryable(requests.HTTPError(response=FakeResponse(503)))
+    assert policy.is_retryable(Exception("unknown error: net::ERR_CONNECTION_RESET"))
+    assert not policy.is_retryable(requests.HTTPError(response=FakeResponse(404)))
+    assert not policy.is_retryable(ValueError("bad json"))
+    print("✅ 可重试错误判断正常")
+
+
+def test_call_retries_until_success():
+    """可重试的错误和状态码会重试，成功后返回结果"""
+    print("🧪 测试重试直到成功...")
+    policy = make_policy()
+    outcomes = [requests.Timeout(), FakeResponse(502), FakeResponse(200)]
+    
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    assert policy.call('http', flaky).status_code == 200
+    assert policy.stats['http']['retries'] == 2
+    assert policy.stats['http']['failures'] == 0
+    print("✅ 重试直到成功正常")
+
+
+def test_call_gives_up():
+    """不可重试的错误立即抛出；重试次数用尽后抛出最后的错误"""
+    print("🧪 测试放弃重试...")
+    policy = make_policy()
+    calls = []
+    
+    def not_found():
+        calls.append(1)
+        raise requests.HTTPError(response=FakeResponse(404))
+    
+    try:
+        policy.call('http', not_found)
+        assert False, "404 should not be retried"
+    except requests.HTTPError:
+        pass
+    assert len(calls) == 1
+    
+    def always_timeout():
+        calls.append(1)
+        raise requests.Timeout()
+    
+    calls.clear()
+    try:
+        policy.call('http', always_timeout, retries=2)
+        assert False, "timeouts should be raised once retries are used up"
+    except requests.Timeout:
+        pass
+    assert len(calls) == 3
+    assert policy.stats['http']['failures'] == 2
+    print("✅ 放弃重试正常")
+
+
+def test_async_call():
+    """异步版本使用同样的重试规则"""
+    print("🧪 测试异步重试...")
+    policy = make_policy()
+    outcomes = [FakeResponse(429), FakeResponse(200)]
+    
+    async def rate_limited():
+        return outcomes.pop(0)
+    
+    assert asyncio.run(policy.acall('openai', rate_limited)).status_code == 200
+    assert policy.stats['openai']['retries'] == 1
+    print("✅ 异步重试正常")
+
+
+if __name__ == "__main__":
+    test_backoff_bounds()
+    test_retryable_classification()
+    test_call_retries_until_success()
+    test_call_gives_up()
+    test_async_call()
+    print("🎉 所有重试策略测试通过")
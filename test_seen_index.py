@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+测试已采集工具索引（增量爬取）
+验证新旧工具标记、只记录已处理的工具，以及过期条目的清理
+"""
+
+import sys
+import os
+import json
+import pytest
+from datetime import datetime, timedelta
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from config import Config
+from src.seen_index import SeenToolsIndex
+
+
+def index_for(cache):
+    cache.configure(ENABLE_INCREMENTAL_SCRAPING=True)
+    return SeenToolsIndex(path=cache.path('seen_tools.json'))
+
+
+def test_mark_and_commit(cache):
+    """提交后的工具在下次运行中被标记为已见过"""
+    print("🧪 测试工具标记和提交...")
+    index = index_for(cache)
+    tools = index.mark([
+        {'name': 'Writer AI', 'link': 'https://toolify.ai/tool/writer-ai', 'source': 'toolify'},
+        {'name': 'Video Gen', 'link': '/tool/video-gen', 'source': 'toolify'}
+    ])
+    assert all(tool['is_new'] for tool in tools)
+    index.commit(tools[:1])
+    
+    index = index_for(cache)
+    # Same tool with a relative link and different punctuation is still recognized
+    again = index.mark([
+        {'name': 'Writer AI!', 'link': '/tool/writer-ai/', 'source': 'toolify'},
+        {'name': 'Video Gen', 'link': '/tool/video-gen', 'source': 'toolify'},
+        {'name': 'Writer AI', 'link': '/tool/writer-ai', 'source': 'futuretools'}
+    ])
+    assert [tool['is_new'] for tool in again] == [False, True, True]
+    print("✅ 工具标记和提交正常")
+
+
+def test_commit_skips_unmarked_tools(cache):
+    """未经过 mark 的工具（如模拟数据）不会写入索引"""
+    print("🧪 测试未标记工具不写入索引...")
+    index = index_for(cache)
+    index.commit([{'name': 'Mock Tool', 'link': '/tool/mock', 'source': 'toolify'}])
+    assert not index.has_site('toolify')
+    print("✅ 未标记工具被忽略")
+
+
+def test_unchanged_page_tools_are_not_new(cache):
+    """来自未变化页面的工具不算新工具"""
+    print("🧪 测试未变化页面的工具...")
+    index = index_for(cache)
+    tools = index.mark([{'name': 'Cached', 'link': '/tool/cached', 'source': 'toolify', 'unchanged_page': True}])
+    assert tools[0]['is_new'] is False
+    print("✅ 未变化页面的工具被标记为已见过")
+
+
+def test_expired_entries_are_dropped(cache):
+    """超过 SEEN_INDEX_MAX_AGE_DAYS 的条目在加载时被丢弃"""
+    print("🧪 测试过期条目清理...")
+    index = index_for(cache)
+    index.commit(index.mark([{'name': 'Old Tool', 'link': '/tool/old', 'source': 'toolify'}]))
+    
+    with open(index.path, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    stale = (datetime.now() - timedelta(days=Config.SEEN_INDEX_MAX_AGE_DAYS + 1)).strftime('%Y-%m-%d')
+    for entry in saved['toolify'].values():
+        entry['last_seen'] = stale
+    with open(index.path, 'w', encoding='utf-8') as f:
+        json.dump(saved, f)
+    
+    index = index_for(cache)
+    assert not index.is_seen('toolify', {'name': 'Old Tool', 'link': '/tool/old'})
+    print("✅ 过期条目已清理")
+
+
+if __name__ == "__main__":
+    # 夹具来自 conftest.py，通过 pytest 运行
+    if pytest.main([__file__, '-s', '-q']) == 0:
+        print("🎉 所有已采集工具索引测试通过")
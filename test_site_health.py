@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+测试站点健康记录和熔断器
+验证连续失败后熔断、冷却时间翻倍、恢复后重置，以及关闭熔断器时不写盘
+"""
+
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from config import Config
+from src.site_health import SiteHealthLedger, MAX_COOLDOWN_HOURS
+
+
+def ledger_for(cache, enabled=True):
+    cache.configure(ENABLE_CIRCUIT_BREAKER=enabled)
+    return SiteHealthLedger(path=cache.path('site_health.json'))
+
+
+def cooldown_hours(entry):
+    retry_after = datetime.fromisoformat(entry['retry_after'])
+    return round((retry_after - datetime.now()).total_seconds() / 3600)
+
+
+def test_breaker_trips_after_threshold(cache):
+    """连续失败达到阈值后熔断，冷却期内跳过站点"""
+    print("🧪 测试连续失败熔断...")
+    ledger = ledger_for(cache)
+    for _ in range(Config.BREAKER_FAILURE_THRESHOLD - 1):
+        ledger.record('example.com', 0, 1.0, 'HTTP 503')
+    assert ledger.state('example.com') == 'closed'
+    
+    ledger.record('example.com', 0, 1.0, 'HTTP 503')
+    assert ledger.state('example.com') == 'open'
+    assert ledger.should_skip('example.com')
+    assert ledger.summary('example.com')['last_error'] == 'HTTP 503'
+    assert ledger.run_events['example.com'] == 'opened'
+    
+    # The ledger survives a restart
+    assert ledger_for(cache).should_skip('example.com')
+    print("✅ 熔断正常")
+
+
+def test_cooldown_doubles_on_each_trip(cache):
+    """每次重新熔断冷却时间翻倍，且不超过上限"""
+    print("🧪 测试冷却时间翻倍...")
+    ledger = ledger_for(cache)
+    for _ in range(Config.BREAKER_FAILURE_THRESHOLD):
+        ledger.record('example.com', 0, 1.0, 'timeout')
+    entry = ledger.entry('example.com')
+    assert cooldown_hours(entry) == Config.BREAKER_COOLDOWN_HOURS
+    
+    ledger.record_probe_failure('example.com', 'timeout')
+    assert cooldown_hours(entry) == Config.BREAKER_COOLDOWN_HOURS * 2
+    
+    for _ in range(20):
+        ledger.record_probe_failure('example.com', 'timeout')
+    assert cooldown_hours(entry) == MAX_COOLDOWN_HOURS
+    print("✅ 冷却时间翻倍正常")
+
+
+def test_trial_recovers_or_reopens(cache):
+    """冷却结束后探测通过：成功则关闭熔断器，失败则重新熔断"""
+    print("🧪 测试半开状态...")
+    ledger = ledger_for(cache)
+    for _ in range(Config.BREAKER_FAILURE_THRESHOLD):
+        ledger.record('example.com', 0, 1.0, 'timeout')
+    ledger.entry('example.com')['retry_after'] = (datetime.now() - timedelta(minutes=1)).isoformat(timespec='seconds')
+    assert ledger.needs_probe('example.com')
+    
+    ledger.start_trial('example.com')
+    ledger.record('example.com', 0, 1.0, 'timeout')
+    assert ledger.state('example.com') == 'open'
+    assert ledger.run_events['example.com'] == 'reopened'
+    
+    ledger.start_trial('example.com')
+    ledger.record('example.com', 12, 2.0)
+    assert ledger.state('example.com') == 'closed'
+    assert ledger.entry('example.com')['trips'] == 0
+    assert ledger.run_events['example.com'] == 'recovered'
+    print("✅ 半开状态正常")
+
+
+def test_disabled_breaker_never_trips_or_saves(cache):
+    """关闭熔断器时不熔断、不写盘"""
+    print("🧪 测试关闭熔断器...")
+    ledger = ledger_for(cache, enabled=False)
+    for _ in range(Config.BREAKER_FAILURE_THRESHOLD + 1):
+        ledger.record('example.com', 0, 1.0, 'HTTP 503')
+    ledger.record_probe_failure('example.com', 'HTTP 503')
+    
+    assert ledger.state('example.com') == 'closed'
+    assert not ledger.should_skip('example.com')
+    assert not os.path.exists(ledger.path)
+    print("✅ 关闭熔断器时不熔断")
+
+
+if __name__ == "__main__":
+    # 夹具来自 conftest.py，通过 pytest 运行
+    if pytest.main([__file__, '-s', '-q']) == 0:
+        print("🎉 所有站点健康测试通过")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+测试内嵌结构化数据提取
+验证 __NEXT_DATA__、Apollo 状态和 JSON-LD 中的工具列表能被直接映射为工具数据
+"""
+
+import sys
+import os
+import json
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.structured_data import StructuredDataExtractor
+
+
+def page(*scripts):
+    return "<html><head>" + "".join(scripts) + "</head><body><div id='root'></div></body></html>"
+
+
+def make_extractor(min_items=2):
+    extractor = StructuredDataExtractor()
+    extractor.min_items = min_items
+    return extractor
+
+
+def test_next_data_with_slugs():
+    """__NEXT_DATA__ 中的工具：用 slug 拼出链接，类别取自 tags"""
+    print("🧪 测试 __NEXT_DATA__ 提取...")
+    data = {'props': {'pageProps': {'tools': [
+        {'name': 'Writer AI', 'what_is': 'Writes long-form blog posts', 'slug': 'writer-ai', 'tags': ['Writing', 'SEO']},
+        {'name': 'Clip Maker', 'what_is': 'Turns podcasts into short clips', 'slug': 'clip-maker', 'tags': [{'name': 'Video'}]},
+        {'name': 'Writer AI', 'what_is': 'Duplicate entry of the same tool', 'slug': 'writer-ai'}
+    ]}}}
+    html = page(f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>')
+    
+    tools = make_extractor().extract(html, 'https://www.toolify.ai/new', 'toolify.ai', 20)
+    assert [tool['name'] for tool in tools] == ['Writer AI', 'Clip Maker']
+    assert tools[0]['link'] == 'https://www.toolify.ai/tool/writer-ai'
+    assert tools[0]['categories'] == ['Writing', 'SEO']
+    assert tools[1]['categories'] == ['Video']
+    print("✅ __NEXT_DATA__ 提取正常")
+
+
+def test_apollo_state_refs():
+    """Apollo 状态中的 __ref 指针和 GraphQL edges 会被解析"""
+    print("🧪 测试 Apollo 状态提取...")
+    apollo = {
+        'Post:1': {'name': 'Agent Studio', 'tagline': 'Build AI agents visually', 'slug': 'agent-studio',
+                   'topics': {'edges': [{'node': {'__ref': 'Topic:1'}}]}},
+        'Post:2': {'name': 'Voice Clone', 'tagline': 'Clone any voice in seconds', 'slug': 'voice-clone'},
+        'Topic:1': {'name': 'Developer Tools'}
+    }
+    html = page(f'<script>window.__APOLLO_STATE__ = {json.dumps(apollo)};</script>')
+    
+    tools = make_extractor().extract(html, 'https://www.producthunt.com/', 'producthunt.com', 20)
+    assert {tool['name'] for tool in tools} == {'Agent Studio', 'Voice Clone'}
+    studio = next(tool for tool in tools if tool['name'] == 'Agent Studio')
+    assert studio['link'] == 'https://www.producthunt.com/posts/agent-studio'
+    assert studio['categories'] == ['Developer Tools']
+    print("✅ Apollo 状态提取正常")
+
+
+def test_json_ld_item_list():
+    """JSON-LD ItemList 中的 SoftwareApplication 会被提取，其他类型被忽略"""
+    print("🧪 测试 JSON-LD 提取...")
+    item_list = {'@type': 'ItemList', 'itemListElement': [
+        {'@type': 'ListItem', 'item': {'@type': 'SoftwareApplication', 'name': 'Slide Genie',
+                                       'description': 'Generates slide decks from outlines', 'url': '/tools/slide-genie',
+                                       'applicationCategory': 'Productivity'}},
+        {'@type': 'ListItem', 'item': {'@type': 'SoftwareApplication', 'name': 'Code Buddy',
+                                       'description': 'Pair programming assistant for teams', 'url': '/tools/code-buddy'}},
+        {'@type': 'ListItem', 'item': {'@type': 'Person', 'name': 'Jane Doe', 'description': 'Author of many reviews'}}
+    ]}
+    html = page(f'<script type="application/ld+json">{json.dumps(item_list)}</script>')
+    
+    tools = make_extractor().extract(html, 'https://www.futuretools.io/', 'futuretools.io', 20)
+    assert [tool['name'] for tool in tools] == ['Slide Genie', 'Code Buddy']
+    assert tools[0]['link'] == 'https://www.futuretools.io/tools/slide-genie'
+    assert tools[0]['categories'] == ['Productivity']
+    print("✅ JSON-LD 提取正常")
+
+
+def test_too_few_items_falls_back():
+    """工具数量少于 STRUCTURED_DATA_MIN_ITEMS 或没有内嵌数据时返回空列表"""
+    print("🧪 测试数据不足时回退...")
+    data = {'props': {'pageProps': {'tool': {'name': 'Only One', 'description': 'A single featured tool here'}}}}
+    html = page(f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>')
+    
+    assert make_extractor(min_items=2).extract(html, 'https://example.com/', 'example.com', 20) == []
+    assert make_extractor().extract(page('<script>var x = 1;</script>'), 'https://example.com/', 'example.com', 20) == []
+    print("✅ 数据不足时回退正常")
+
+
+if __name__ == "__main__":
+    test_next_data_with_slugs()
+    test_apollo_state_refs()
+    test_json_ld_item_list()
+    test_too_few_items_falls_back()
+    print("🎉 所有结构化数据测试通过")
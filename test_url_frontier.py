@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+测试深度爬取的待爬队列
+验证按策略出队的顺序、链接规范化与过滤、布隆过滤器对已访问详情页的去重，以及检查点的保存与恢复
+"""
+
+import sys
+import os
+import pytest
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.url_frontier import URLFrontier, BloomFilter
+
+DETAIL = 'https://www.toolify.ai/tool/writer-ai'
+LISTING = 'https://www.toolify.ai/category/writing'
+OTHER = 'https://www.toolify.ai/blog/news'
+
+
+def frontier_for(cache, strategy='bestfirst'):
+    return URLFrontier(strategy=strategy, max_depth=3, path=cache.path('frontier.json'))
+
+
+def test_best_first_order(cache):
+    """详情页先于列表页出队，列表页先于其他页面"""
+    print("🧪 测试最佳优先顺序...")
+    frontier = frontier_for(cache)
+    for url in (OTHER, LISTING, DETAIL):
+        assert frontier.push(url, 1)
+    assert [url for url, _ in frontier.pop_batch(3)] == [DETAIL, LISTING, OTHER]
+    assert len(frontier) == 0
+    print("✅ 最佳优先顺序正常")
+
+
+@pytest.mark.parametrize('strategy, expected', [
+    ('bfs', [(LISTING, 1), (DETAIL, 2)]),
+    ('dfs', [(DETAIL, 2), (LISTING, 1)])
+])
+def test_breadth_and_depth_first_order(cache, strategy, expected):
+    """bfs 先出浅层链接，dfs 先出深层链接"""
+    print(f"🧪 测试 {strategy} 顺序...")
+    frontier = frontier_for(cache, strategy)
+    frontier.push(DETAIL, 2)
+    frontier.push(LISTING, 1)
+    assert frontier.pop_batch(2) == expected
+    print(f"✅ {strategy} 顺序正常")
+
+
+def test_normalize_and_filter(cache):
+    """跟踪参数、锚点和末尾斜杠不产生新链接；站外、排除路径和超出深度的链接被过滤"""
+    print("🧪 测试规范化与过滤...")
+    frontier = frontier_for(cache)
+    assert frontier.push('/tool/writer-ai/?utm_source=feed#reviews', 1, base_url='https://www.toolify.ai/new')
+    assert not frontier.push(DETAIL, 1)
+    assert frontier.pop_batch(5) == [(DETAIL, 1)]
+    
+    assert not frontier.push('https://other.com/tool/x', 1, base_url='https://www.toolify.ai/new')
+    assert not frontier.push('https://www.toolify.ai/login', 1)
+    assert not frontier.push('https://www.toolify.ai/tool/deep-one', 4)
+    assert frontier.stats['skipped_filtered'] == 2
+    print("✅ 规范化与过滤正常")
+
+
+def test_bloom_filter_dedup(cache):
+    """布隆过滤器中已访问的详情页不再入队；列表页不受影响"""
+    print("🧪 测试布隆过滤器去重...")
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    assert bloom.add(DETAIL)
+    assert not bloom.add(DETAIL)
+    assert DETAIL in bloom and LISTING not in bloom
+    
+    # Roughly the configured false-positive rate once full
+    for index in range(1000):
+        bloom.add(f'https://example.com/tool/{index}')
+    false_positives = sum(f'https://example.com/app/{index}' in bloom for index in range(2000))
+    assert false_positives < 2000 * 0.03
+    
+    frontier = frontier_for(cache)
+    frontier.visited.add(DETAIL)
+    frontier.visited.add(LISTING)
+    assert not frontier.push(DETAIL + '?ref=home', 1)
+    assert frontier.stats['skipped_visited'] == 1
+    assert frontier.push(LISTING, 1)
+    
+    # A finished detail page goes into the filter
+    frontier.push('https://www.toolify.ai/tool/clip-maker', 1)
+    frontier.pop_batch(2)
+    frontier.complete('https://www.toolify.ai/tool/clip-maker', ok=True)
+    assert 'https://www.toolify.ai/tool/clip-maker' in frontier.visited
+    print("✅ 布隆过滤器去重正常")
+
+
+def test_checkpoint_round_trip(cache):
+    """检查点保存待爬和进行中的链接、已访问过滤器和失败记录，下次运行从中断处继续"""
+    print("🧪 测试检查点恢复...")
+    broken = 'https://www.toolify.ai/tool/broken'
+    clip_maker = 'https://www.toolify.ai/tool/clip-maker'
+    new_feed = 'https://www.toolify.ai/new'
+    cache.configure(DEEP_CRAWL_MAX_ATTEMPTS=3, DEEP_CRAWL_RECRAWL_HOURS=12)
+    frontier = frontier_for(cache)
+    for url in (clip_maker, broken, new_feed):
+        frontier.push(url, 1)
+    frontier.pop_batch(3)
+    frontier.complete(clip_maker, ok=True)
+    frontier.complete(new_feed, ok=True)
+    frontier.complete(broken, ok=False)
+    
+    for url in (OTHER, LISTING, DETAIL):
+        frontier.push(url, 1)
+    # Killed mid-batch: the popped links were never completed
+    in_flight = frontier.pop_batch(2)
+    assert [url for url, _ in in_flight] == [DETAIL, broken]
+    frontier.save()
+    
+    resumed = frontier_for(cache)
+    assert resumed.resumed == 4
+    assert [url for url, _ in resumed.pop_batch(4)] == [DETAIL, broken, LISTING, OTHER]
+    assert clip_maker in resumed.visited
+    assert resumed.pages[broken]['state'] == 'failed' and resumed.pages[broken]['attempts'] == 1
+    
+    # Visited detail pages and recently crawled listing pages are not queued again
+    assert not resumed.push(clip_maker, 1)
+    assert not resumed.push(new_feed, 1)
+    assert resumed.stats['skipped_visited'] == 1
+    assert resumed.stats['skipped_recent'] == 1
+    print("✅ 检查点恢复正常")
+
+
+if __name__ == "__main__":
+    # 夹具来自 conftest.py，通过 pytest 运行
+    if pytest.main([__file__, '-s', '-q']) == 0:
+        print("🎉 所有待爬队列测试通过")